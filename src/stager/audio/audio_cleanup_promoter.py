@@ -3,6 +3,7 @@ from __future__ import annotations
 from dataclasses import dataclass
 from datetime import datetime, timezone
 import json
+import os
 from pathlib import Path
 import shutil
 
@@ -81,8 +82,7 @@ class AudioCleanupPromoter:
                     raise RuntimeError(f"Missing backup path for {paths.display_path(entry.target_path)}")
                 entry.backup_path.parent.mkdir(parents=True, exist_ok=True)
                 shutil.copy2(entry.target_path, entry.backup_path)
-            entry.target_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(entry.cleaned_path, entry.target_path)
+            self._replace_segment(entry.cleaned_path, entry.target_path)
             promoted.append(entry)
         if not promoted:
             raise RuntimeError("No audio cleanup review entries matched the promotion request.")
@@ -110,6 +110,13 @@ class AudioCleanupPromoter:
             skipped_count=skipped_count,
         )
 
+    def _replace_segment(self, source_path: Path, target_path: Path) -> None:
+        # Imported segments can share an inode with import history, so never write into the target itself.
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = target_path.with_name(f".{target_path.name}.promoting")
+        shutil.copy2(source_path, staging_path)
+        os.replace(staging_path, target_path)
+
     def _load_review(self) -> dict:
         review_path = self.paths_config.audio_out_dir / "cleaned" / "cleanup_review.json"
         if not review_path.exists():
@@ -17,6 +17,7 @@ from stager.audio.audio_cleanup_batch import (
 )
 from stager.audio.audio_cleanup_boundaries import AudioCleanupBoundaryDetector
 from stager.loudnorm.metric import LoudnessProfile, Metrics
+from stager.loudnorm.loudness_meter import LoudnessMeter
 from stager.loudnorm.normalizer import Normalizer
 from stager.shared import paths
 
@@ -529,6 +530,7 @@ class AudioCleanupRenderer:
             metrics=Metrics.for_profile(self._loudness_profile(profile_name)),
             command_runner=self.command_runner,
             output_sample_rate_hz=self.sample_rate_hz,
+            loudness_meter=LoudnessMeter(),
         )
 
     def _loudness_profile(self, profile_name: str) -> LoudnessProfile:
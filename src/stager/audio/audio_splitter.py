@@ -1,6 +1,7 @@
 """Shared audio splitting utilities."""
 from __future__ import annotations
 
+import os
 import subprocess
 from pathlib import Path
 from typing import Iterable, List, Tuple
@@ -131,6 +132,10 @@ class AudioSplitter:
             logging.getLogger(__name__).info("Total silence detection time: %.3fs", self.last_detect_seconds)
         return [(s, e) for s, e in cuts if e > s]
 
+    @staticmethod
+    def _staging_path(out_dir: Path, eid: str) -> Path:
+        return out_dir / f".{eid}.wav.splitting"
+
     def export_spans(
         self,
         source: Path,
@@ -174,7 +179,7 @@ class AudioSplitter:
                 start_s = max(0.0, (start_ms - base_start_ms) / 1000.0)
                 end_s = max(start_s, (end_ms - base_start_ms) / 1000.0)
                 filter_parts.append(f"[0:a]atrim=start={start_s}:end={end_s},asetpts=PTS-STARTPTS[{label}]")
-                maps.extend(["-map", f"[{label}]", str(out_dir / f"{eid}.wav")])
+                maps.extend(["-map", f"[{label}]", "-f", "wav", str(self._staging_path(out_dir, eid))])
             if not filter_parts:
                 return
             cmd = [
@@ -197,6 +202,9 @@ class AudioSplitter:
                 )
             t0 = perf_counter()
             subprocess.run(cmd, check=True, stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL)
+            # Segments may share an inode with LineRecorder import history, so replace them instead of rewriting.
+            for eid in batch_ids:
+                os.replace(self._staging_path(out_dir, eid), out_dir / f"{eid}.wav")
             if self.verbose:
                 logging.getLogger(__name__).info(
                     "FFmpeg export batch %d completed in %.3fs", batch_idx, perf_counter() - t0
@@ -2,34 +2,103 @@
 """Container class for audio plans."""
 from __future__ import annotations
 
-from typing import Iterable, TypeVar, Generic, List
+from bisect import bisect_left
+from typing import Iterable, Iterator, TypeVar, Generic, List, overload
 
-from stager.audiobook.clip import Clip, Silence, ParallelClips
+import numpy as np
+
+from stager.audiobook.clip import Clip, CalloutClip, SegmentClip, Silence, ParallelClips
 from stager.audiobook.chapter import Chapter
-from pathlib import Path
+from stager.audiobook.plan_columns import (
+    CALLOUT,
+    CHAPTER,
+    NO_VALUE,
+    PARALLEL,
+    SEGMENT,
+    SILENCE,
+    PlanColumns,
+    PlanTables,
+)
 
 PlanItem = Clip | Chapter | ParallelClips
 PI = TypeVar("PI", bound=PlanItem)
 
-class AudioPlan(List[PI], Generic[PI]):
-    """Simple list subclass to represent an ordered audio plan."""
+CLIP_KINDS = {SegmentClip: SEGMENT, CalloutClip: CALLOUT, Silence: SILENCE}
+CLIP_TYPES = {SEGMENT: SegmentClip, CALLOUT: CalloutClip}
+
+
+class AudioPlan(Generic[PI]):
+    """Ordered audio plan stored as parallel columns; items are materialized as clip objects on access."""
 
-    def __init__(self, items: Iterable[PI] | None = None) -> None:
-        super().__init__(items or [])
+    def __init__(self, items: Iterable[PI] | None = None, *, tables: PlanTables | None = None) -> None:
+        self.tables = tables if tables is not None else PlanTables()
+        self.rows = PlanColumns()
+        self.members = PlanColumns()
         self.duration_ms: int = 0
+        for item in items or []:
+            self.append(item)
 
     @property
-    def items(self) -> List[PlanItem]:
+    def items(self) -> AudioPlan[PI]:
         return self
 
+    def __len__(self) -> int:
+        return len(self.rows)
+
+    def __iter__(self) -> Iterator[PI]:
+        for index in range(len(self.rows)):
+            yield self._item(self.rows, index)
+
+    @overload
+    def __getitem__(self, index: int) -> PI: ...
+
+    @overload
+    def __getitem__(self, index: slice) -> List[PI]: ...
+
+    def __getitem__(self, index: int | slice) -> PI | List[PI]:
+        if isinstance(index, slice):
+            return [self._item(self.rows, i) for i in range(*index.indices(len(self.rows)))]
+        if index < 0:
+            index += len(self.rows)
+        if not 0 <= index < len(self.rows):
+            raise IndexError("audio plan index out of range")
+        return self._item(self.rows, index)
+
+    def __repr__(self) -> str:
+        return f"AudioPlan({len(self.rows)} items, duration_ms={self.duration_ms})"
+
+    def empty_like(self) -> AudioPlan[PI]:
+        """Return an empty plan sharing this plan's value tables, so appending it back needs no remapping."""
+        return AudioPlan(tables=self.tables)
+
+    def append(self, item: PI) -> None:
+        """Append an item at its own offset, without re-timing it."""
+        if isinstance(item, Chapter):
+            self.rows.append(
+                CHAPTER,
+                item.offset_ms if item.offset_ms is not None else self.duration_ms,
+                0,
+                text=self.tables.string_index(item.title),
+                clip_id=self.tables.string_index(item.block_id),
+            )
+            return
+        if isinstance(item, ParallelClips):
+            group_start = len(self.members)
+            for clip in item.clips:
+                self._append_clip(self.members, clip)
+            self.rows.append(PARALLEL, item.offset_ms, item.length_ms, group_start=group_start, group_size=len(item.clips))
+        else:
+            self._append_clip(self.rows, item)
+        self.duration_ms = max(self.duration_ms, item.offset_ms + item.length_ms)
+
     def addClip(self, clip: Clip, following_silence_ms: int = 0) -> None:
         """Append a clip and optional trailing silence."""
         clip.offset_ms = self.duration_ms
-        self.append(clip)
+        self._append_clip(self.rows, clip)
         offset_ms = clip.offset_ms + clip.length_ms
         self.duration_ms = max(self.duration_ms, offset_ms)
         if following_silence_ms > 0:
-            self.append(Silence(following_silence_ms, offset_ms=offset_ms))
+            self.rows.append(SILENCE, offset_ms, following_silence_ms)
             offset_ms += following_silence_ms
             self.duration_ms = max(self.duration_ms, offset_ms)
 
@@ -38,7 +107,7 @@ class AudioPlan(List[PI], Generic[PI]):
         if ms <= 0:
             return
         offset_ms = self.duration_ms
-        self.append(Silence(ms, offset_ms=offset_ms))
+        self.rows.append(SILENCE, offset_ms, ms)
         offset_ms += ms
         self.duration_ms = max(self.duration_ms, offset_ms)
 
@@ -61,8 +130,98 @@ class AudioPlan(List[PI], Generic[PI]):
         end = start + max_len
         self.duration_ms = max(self.duration_ms, end)
         if following_silence_ms > 0:
-            self.append(Silence(following_silence_ms, offset_ms=end))
+            self.rows.append(SILENCE, end, following_silence_ms)
             end += following_silence_ms
             self.duration_ms = max(self.duration_ms, end)
         return group
-      
+
+    def append_plan(self, other: AudioPlan) -> None:
+        """Append every item of ``other`` after this plan's end, shifting offsets column-wise."""
+        shift_ms = self.duration_ms
+        self._copy_rows(other, 0, len(other.rows), shift_ms)
+        self.duration_ms = max(self.duration_ms, shift_ms + other.duration_ms)
+
+    def between(self, start_ms: int, end_ms: int) -> AudioPlan[PI]:
+        """Return the items overlapping ``[start_ms, end_ms)`` (and chapters starting in it) at their plan offsets.
+
+        Offsets are assumed to be non-decreasing in plan order, as the add methods produce them.
+        """
+        offsets = self.rows.offset_ms
+        lengths = self.rows.length_ms
+        lo = bisect_left(offsets, start_ms)
+        # Sequential items end no later than the next one starts, so only a few rows before ``lo`` can overlap.
+        while lo > 0 and offsets[lo - 1] + lengths[lo - 1] > start_ms:
+            lo -= 1
+        hi = max(lo, bisect_left(offsets, end_ms))
+        part = self.empty_like()
+        part._copy_rows(self, lo, hi, 0)
+        if hi > lo:
+            part.duration_ms = int(max(offsets[i] + lengths[i] for i in range(lo, hi)))
+        return part
+
+    def _copy_rows(self, other: AudioPlan, start: int, stop: int, shift_ms: int) -> None:
+        if start >= stop:
+            return
+        path_map = string_map = None
+        if other.tables is not self.tables:
+            path_map = np.array([self.tables.path_index(path) for path in other.tables.paths] + [NO_VALUE])
+            string_map = np.array([self.tables.string_index(value) for value in other.tables.strings] + [NO_VALUE])
+        # Members are appended alongside their rows, so the groups of a row range are one contiguous block.
+        sizes = np.frombuffer(other.rows.group_size[start:stop], dtype=np.int32)
+        grouped = np.flatnonzero(sizes > 0)
+        group_shift = 0
+        if grouped.size:
+            starts = other.rows.group_start
+            first = int(starts[start + int(grouped[0])])
+            last = int(starts[start + int(grouped[-1])] + sizes[grouped[-1]])
+            group_shift = len(self.members) - first
+            self.members.extend(other.members, first, last, shift_ms, path_map=path_map, string_map=string_map)
+        self.rows.extend(
+            other.rows,
+            start,
+            stop,
+            shift_ms,
+            group_shift=group_shift,
+            path_map=path_map,
+            string_map=string_map,
+        )
+
+    def _append_clip(self, columns: PlanColumns, clip: Clip) -> None:
+        kind = CLIP_KINDS.get(type(clip))
+        if kind is None:
+            raise RuntimeError(f"Unexpected plan item type: {type(clip)}")
+        columns.append(
+            kind,
+            clip.offset_ms,
+            clip.length_ms,
+            path=self.tables.path_index(clip.path),
+            text=self.tables.string_index(clip.text),
+            role=self.tables.string_index(clip.role),
+            clip_id=self.tables.string_index(clip.clip_id),
+        )
+
+    def _item(self, columns: PlanColumns, index: int) -> PI:
+        kind = columns.kind[index]
+        offset_ms = columns.offset_ms[index]
+        length_ms = columns.length_ms[index]
+        tables = self.tables
+        if kind == SILENCE:
+            return Silence(length_ms, offset_ms=offset_ms)
+        if kind == CHAPTER:
+            return Chapter(
+                block_id=tables.string(columns.clip_id[index]),
+                title=tables.string(columns.text[index]),
+                offset_ms=offset_ms,
+            )
+        if kind == PARALLEL:
+            first = columns.group_start[index]
+            clips = [self._item(self.members, i) for i in range(first, first + columns.group_size[index])]
+            return ParallelClips(clips=clips, offset_ms=offset_ms, length_ms=length_ms)
+        return CLIP_TYPES[kind](
+            path=tables.path(columns.path[index]),
+            text=tables.string(columns.text[index]),
+            role=tables.string(columns.role[index]),
+            clip_id=tables.string(columns.clip_id[index]),
+            length_ms=length_ms,
+            offset_ms=offset_ms,
+        )
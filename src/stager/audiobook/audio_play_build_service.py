@@ -1,8 +1,11 @@
 """Service for building assembled audioplay output."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass
 import logging
+import os
+from pathlib import Path
 
 from stager.audio.segment_build_service import SegmentBuildService
 from stager.audio.voice_profile_config import VoiceProfileConfig
@@ -13,6 +16,7 @@ from stager.audio.voice_render_cache import VoiceRenderCache
 from stager.audiobook.audio_play_build_manifest import AudioPlayBuildManifestWriter
 from stager.audiobook.play_builder import PlayBuilder
 from stager.domain.play import Play
+from stager.loudnorm.loudness_meter import LoudnessMeter
 from stager.loudnorm.normalizer import Normalizer
 from stager.scriptwright.production_play_loader import ProductionPlayLoader
 from stager.shared import paths as path_display
@@ -34,6 +38,7 @@ class AudioPlayBuildService:
     progress_reporter: ProgressReporter | None = None
     command_runner: CommandRunner | None = None
     ffmpeg_installation: FfmpegInstallation | None = None
+    jobs: int | None = None
 
     def build(
         self,
@@ -101,18 +106,11 @@ class AudioPlayBuildService:
             play=play,
             paths=self.paths,
             progress_reporter=self.progress_reporter,
+            jobs=self.jobs,
         )
         out_paths = builder.build_audio(part_no=part_no)
         if normalize_output and generate_audio:
-            normalizer = Normalizer()
-            for out_path in out_paths:
-                target_dir = out_path.parent / "normalized"
-                target_dir.mkdir(parents=True, exist_ok=True)
-                norm_path = target_dir / out_path.name
-                logger.info("Normalizing audioplay to %s", path_display.display_path(norm_path))
-                normalizer.normalize(str(out_path), str(norm_path))
-                if self.progress_reporter is not None:
-                    self.progress_reporter.advance(f"Normalized {out_path.name}")
+            self._normalize_outputs(out_paths)
         elif normalize_output and not generate_audio:
             logger.info("Skipping normalization because audio rendering was skipped.")
         manifest_path = AudioPlayBuildManifestWriter(self.paths).write(
@@ -129,6 +127,27 @@ class AudioPlayBuildService:
             self.progress_reporter.finish("Built audioplay")
         return out_paths
 
+    def _normalize_outputs(self, out_paths: list[Path]) -> None:
+        if not out_paths:
+            return
+        # One normalizer serves every part; its ffmpeg passes and measurements are independent per file.
+        normalizer = Normalizer(loudness_meter=LoudnessMeter(cache_dir=self.paths.build_dir / "loudness_cache"))
+        norm_paths: list[Path] = []
+        for out_path in out_paths:
+            target_dir = out_path.parent / "normalized"
+            target_dir.mkdir(parents=True, exist_ok=True)
+            norm_paths.append(target_dir / out_path.name)
+        workers = min(self.jobs or os.cpu_count() or 1, len(out_paths))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="audioplay-normalize") as executor:
+            futures = []
+            for out_path, norm_path in zip(out_paths, norm_paths):
+                logger.info("Normalizing audioplay to %s", path_display.display_path(norm_path))
+                futures.append(executor.submit(normalizer.normalize, str(out_path), str(norm_path)))
+            for out_path, future in zip(out_paths, futures):
+                future.result()
+                if self.progress_reporter is not None:
+                    self.progress_reporter.advance(f"Normalized {out_path.name}")
+
     def _render_voice_profiles(
         self,
         *,
@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""Reuse rendered audio for plan chunks whose clips, silences and mix settings are unchanged."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import ClassVar, Sequence
+
+from pydub import AudioSegment
+
+from stager.audio.audio_mixer import AudioMixer
+from stager.audiobook.clip import ParallelClips, Silence
+from stager.shared import paths
+
+CACHE_VERSION = "1"
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class ChunkRenderCache:
+    cache_dir: Path
+    _logger: logging.Logger = field(init=False, repr=False)
+
+    # Content digests keyed by path and memoized by mtime and size, shared across builders in one run.
+    _digests: ClassVar[dict[str, tuple[int, int, str]]] = {}
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+
+    def key(self, items: Sequence[object], mixer: AudioMixer) -> str:
+        entries: list[object] = []
+        for item in items:
+            if isinstance(item, ParallelClips):
+                clip_paths = [clip.path for clip in item.clips if clip.path is not None]
+                entries.append(["parallel", [self._parallel_entry(path) for path in clip_paths], self._mixer_entry(mixer)])
+            elif isinstance(item, Silence):
+                entries.append(["silence", item.length_ms])
+            elif getattr(item, "path", None) is not None:
+                entries.append(["clip", str(item.path), self._content_digest(item.path)])
+        payload = {"cache_version": CACHE_VERSION, "items": entries}
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def load(self, key: str) -> AudioSegment | None:
+        chunk_path = self._chunk_path(key)
+        if not chunk_path.exists():
+            return None
+        self._logger.debug("Reusing rendered chunk %s", paths.display_path(chunk_path))
+        return AudioSegment.from_wav(chunk_path)
+
+    def save(self, key: str, audio: AudioSegment) -> None:
+        chunk_path = self._chunk_path(key)
+        chunk_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = chunk_path.with_name(f".{chunk_path.stem}.{os.getpid()}.{threading.get_ident()}.tmp.wav")
+        audio.export(staging, format="wav")
+        os.replace(staging, chunk_path)
+
+    def retain(self, out_path: Path, keys: Sequence[str]) -> None:
+        """Record the chunks the output at ``out_path`` was built from, replacing its previous set."""
+        output = str(out_path.resolve())
+        owner_path = self._owners_dir() / f"{hashlib.sha256(output.encode('utf-8')).hexdigest()[:16]}.json"
+        owner_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = owner_path.with_name(f".{owner_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        record = {"output": output, "chunks": sorted(set(keys))}
+        staging.write_text(json.dumps(record, separators=(",", ":")), encoding="utf-8")
+        os.replace(staging, owner_path)
+
+    def prune(self) -> int:
+        """Delete chunks no existing output still references; run once after every render of a build has finished.
+
+        Records of outputs that no longer exist (a switched format, a renamed title) are dropped first.
+        """
+        if not self.cache_dir.exists():
+            return 0
+        retained: set[str] = set()
+        owners_dir = self._owners_dir()
+        for owner_path in owners_dir.glob("*.json") if owners_dir.exists() else []:
+            try:
+                record = json.loads(owner_path.read_text(encoding="utf-8"))
+                output, chunks = Path(record["output"]), record["chunks"]
+            except (ValueError, KeyError, TypeError):
+                # An unreadable record could hide live chunks, so nothing is pruned until it is rewritten.
+                self._logger.warning("Skipping render cache prune; unreadable %s", paths.display_path(owner_path))
+                return 0
+            if not output.exists():
+                owner_path.unlink(missing_ok=True)
+                continue
+            retained.update(chunks)
+        removed = 0
+        for chunk_path in self.cache_dir.glob("*.wav"):
+            if chunk_path.stem not in retained:
+                chunk_path.unlink(missing_ok=True)
+                removed += 1
+        if removed:
+            self._logger.info("Pruned %d unused render cache chunk%s", removed, "" if removed == 1 else "s")
+        return removed
+
+    def _owners_dir(self) -> Path:
+        return self.cache_dir / "outputs"
+
+    def _chunk_path(self, key: str) -> Path:
+        return self.cache_dir / f"{key}.wav"
+
+    def _parallel_entry(self, path: Path) -> list[object]:
+        # The mixer skips missing inputs, so a missing path is part of the key rather than an error.
+        return [str(path), self._content_digest(path) if path.exists() else None]
+
+    @staticmethod
+    def _mixer_entry(mixer: AudioMixer) -> list[object]:
+        attenuator = mixer.attenuator
+        return [type(attenuator).__name__, vars(attenuator)]
+
+    def _content_digest(self, path: Path) -> str:
+        try:
+            stat = path.stat()
+        except FileNotFoundError:
+            raise RuntimeError(f"Audio file missing: {paths.display_path(path)}") from None
+        memo = self._digests.get(str(path))
+        if memo is not None and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        value = digest.hexdigest()
+        self._digests[str(path)] = (stat.st_mtime_ns, stat.st_size, value)
+        return value
@@ -0,0 +1,133 @@
+#!/usr/bin/env python3
+"""Parallel typed arrays holding audio plan rows, with paths and strings interned into shared tables."""
+from __future__ import annotations
+
+from array import array
+from dataclasses import dataclass, field
+from pathlib import Path
+
+import numpy as np
+
+SEGMENT = 0
+CALLOUT = 1
+SILENCE = 2
+PARALLEL = 3
+CHAPTER = 4
+
+NO_VALUE = -1
+
+COLUMN_TYPES = {
+    "kind": "b",
+    "offset_ms": "q",
+    "length_ms": "q",
+    "path": "i",
+    "text": "i",
+    "role": "i",
+    "clip_id": "i",
+    "group_start": "i",
+    "group_size": "i",
+}
+
+
+@dataclass
+class PlanTables:
+    """Append-only value tables; plans sharing one can copy rows between them without remapping indices."""
+
+    paths: list[Path] = field(default_factory=list)
+    strings: list[str] = field(default_factory=list)
+    _path_index: dict[Path, int] = field(init=False, repr=False, default_factory=dict)
+    _string_index: dict[str, int] = field(init=False, repr=False, default_factory=dict)
+
+    def path_index(self, path: Path | None) -> int:
+        if path is None:
+            return NO_VALUE
+        index = self._path_index.get(path)
+        if index is None:
+            index = self._path_index[path] = len(self.paths)
+            self.paths.append(path)
+        return index
+
+    def string_index(self, value: str | None) -> int:
+        if value is None:
+            return NO_VALUE
+        index = self._string_index.get(value)
+        if index is None:
+            index = self._string_index[value] = len(self.strings)
+            self.strings.append(value)
+        return index
+
+    def path(self, index: int) -> Path | None:
+        return None if index == NO_VALUE else self.paths[index]
+
+    def string(self, index: int) -> str | None:
+        return None if index == NO_VALUE else self.strings[index]
+
+
+@dataclass
+class PlanColumns:
+    kind: array = field(default_factory=lambda: array(COLUMN_TYPES["kind"]))
+    offset_ms: array = field(default_factory=lambda: array(COLUMN_TYPES["offset_ms"]))
+    length_ms: array = field(default_factory=lambda: array(COLUMN_TYPES["length_ms"]))
+    path: array = field(default_factory=lambda: array(COLUMN_TYPES["path"]))
+    text: array = field(default_factory=lambda: array(COLUMN_TYPES["text"]))
+    role: array = field(default_factory=lambda: array(COLUMN_TYPES["role"]))
+    clip_id: array = field(default_factory=lambda: array(COLUMN_TYPES["clip_id"]))
+    group_start: array = field(default_factory=lambda: array(COLUMN_TYPES["group_start"]))
+    group_size: array = field(default_factory=lambda: array(COLUMN_TYPES["group_size"]))
+
+    def __len__(self) -> int:
+        return len(self.kind)
+
+    def append(
+        self,
+        kind: int,
+        offset_ms: int,
+        length_ms: int,
+        path: int = NO_VALUE,
+        text: int = NO_VALUE,
+        role: int = NO_VALUE,
+        clip_id: int = NO_VALUE,
+        group_start: int = NO_VALUE,
+        group_size: int = 0,
+    ) -> int:
+        self.kind.append(kind)
+        self.offset_ms.append(offset_ms)
+        self.length_ms.append(length_ms)
+        self.path.append(path)
+        self.text.append(text)
+        self.role.append(role)
+        self.clip_id.append(clip_id)
+        self.group_start.append(group_start)
+        self.group_size.append(group_size)
+        return len(self.kind) - 1
+
+    def extend(
+        self,
+        other: PlanColumns,
+        start: int,
+        stop: int,
+        shift_ms: int = 0,
+        group_shift: int = 0,
+        path_map: np.ndarray | None = None,
+        string_map: np.ndarray | None = None,
+    ) -> None:
+        """Copy rows ``start:stop`` of ``other``, shifting offsets and member starts and remapping table indices."""
+        values = {name: self._slice(other, name, start, stop) for name in COLUMN_TYPES}
+        if shift_ms:
+            values["offset_ms"] = values["offset_ms"] + shift_ms
+        if group_shift:
+            grouped = values["group_size"] > 0
+            values["group_start"] = np.where(grouped, values["group_start"] + group_shift, values["group_start"])
+        # Maps carry a trailing NO_VALUE so that index -1 still maps to "no value".
+        if path_map is not None:
+            values["path"] = path_map[values["path"]]
+        if string_map is not None:
+            for name in ("text", "role", "clip_id"):
+                values[name] = string_map[values[name]]
+        for name, typecode in COLUMN_TYPES.items():
+            getattr(self, name).frombytes(values[name].astype(np.dtype(typecode), copy=False).tobytes())
+
+    @staticmethod
+    def _slice(columns: PlanColumns, name: str, start: int, stop: int) -> np.ndarray:
+        # Slicing copies the array, so the numpy view never pins the source buffer against later appends.
+        return np.frombuffer(getattr(columns, name)[start:stop], dtype=np.dtype(COLUMN_TYPES[name]))
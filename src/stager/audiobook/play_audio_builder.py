@@ -4,6 +4,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import logging
 import subprocess
+import tempfile
 from pathlib import Path
 from typing import Dict, List, Tuple
 
@@ -12,12 +13,17 @@ from pydub import AudioSegment
 from stager.audiobook.play_plan_builder import PlanItem, Silence, Chapter, PlayPlanBuilder
 from stager.audiobook.clip import CalloutClip, SegmentClip, ParallelClips
 from stager.audio.audio_mixer import AudioMixer
+from stager.audiobook.chunk_render_cache import ChunkRenderCache
 from stager.shared import paths
 
+PCM_FORMATS = {1: "u8", 2: "s16le", 3: "s24le", 4: "s32le"}
+STILL_FRAME = "color=size=1280x720:rate=1:color=black"
+
 @dataclass
 class PlayAudioBuilder:
     """Render an audio plan (and optional chapters/captions) into an audio file."""
     audio_mixer:AudioMixer = field(default_factory=AudioMixer)
+    render_cache: ChunkRenderCache | None = None
 
     def export_with_chapters(
         self,
@@ -26,24 +32,46 @@ class PlayAudioBuilder:
         out_path: Path,
         fmt: str,
         metadata: dict[str, str] | None = None,
+        captions_path: Path | None = None,
     ) -> None:
+        """Encode the rendered audio, chapters, captions and (for mp4) a still video track in one ffmpeg pass."""
         out_path.parent.mkdir(parents=True, exist_ok=True)
-        if not chapters:
-            export_kwargs = {}
-            if fmt == "mp3":
-                export_kwargs["bitrate"] = "128k"
-                export_kwargs["tags"] = metadata or {}
-                export_kwargs["id3v2_version"] = "3"
-            audio.export(out_path, format=fmt, **export_kwargs)
+        if fmt == "wav":
+            # WAV carries neither chapters nor captions, so the PCM is written as-is.
+            audio.export(out_path, format="wav")
             return
-
-        import tempfile
-        import subprocess
-
         with tempfile.TemporaryDirectory() as tmpdir:
-            wav_path = Path(tmpdir) / "tmp.wav"
-            meta_path = Path(tmpdir) / "chapters.txt"
-            audio.export(wav_path, format="wav")
+            cmd = self.encode_command(audio, chapters, out_path, fmt, metadata, captions_path, Path(tmpdir))
+            logging.info("Encoding %s", paths.display_path(out_path))
+            subprocess.run(cmd, input=audio.raw_data, check=True)
+
+    def encode_command(
+        self,
+        audio: AudioSegment,
+        chapters: List[Tuple[int, int, str]],
+        out_path: Path,
+        fmt: str,
+        metadata: dict[str, str] | None,
+        captions_path: Path | None,
+        tmpdir: Path,
+    ) -> List[str]:
+        # Input 0 is the rendered PCM, piped on stdin instead of round-tripping through a temp WAV.
+        cmd = [
+            "ffmpeg",
+            "-y",
+            "-f",
+            PCM_FORMATS[audio.sample_width],
+            "-ar",
+            str(audio.frame_rate),
+            "-ac",
+            str(audio.channels),
+            "-i",
+            "pipe:0",
+        ]
+        output_args = ["-map", "0:a:0"]
+        next_input = 1
+        if chapters:
+            meta_path = tmpdir / "chapters.txt"
             lines = [";FFMETADATA1"]
             for start, end, title in chapters:
                 lines.append("[CHAPTER]")
@@ -52,27 +80,27 @@ class PlayAudioBuilder:
                 lines.append(f"END={end}")
                 lines.append(f"title={title}")
             meta_path.write_text("\n".join(lines) + "\n", encoding="utf-8")
-
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-i",
-                str(wav_path),
-                "-i",
-                str(meta_path),
-                "-map_metadata",
-                "1",
-                "-c:a",
-                "aac" if fmt == "mp4" else "libmp3lame",
-                "-b:a",
-                "128k" if fmt == "mp3" else "192k",
-            ]
-            for key, val in (metadata or {}).items():
-                cmd.extend(["-metadata", f"{key}={val}"])
-            if fmt == "mp3":
-                cmd.extend(["-id3v2_version", "3", "-write_id3v1", "1"])
-            cmd.append(str(out_path))
-            subprocess.run(cmd, check=True)
+            cmd += ["-i", str(meta_path)]
+            output_args += ["-map_metadata", str(next_input), "-map_chapters", str(next_input)]
+            next_input += 1
+        if fmt == "mp4":
+            # One black frame per second is enough for players that expect video; x264 encodes it almost for free.
+            cmd += ["-f", "lavfi", "-i", f"{STILL_FRAME}:duration={len(audio) / 1000:.3f}"]
+            output_args += ["-map", f"{next_input}:v:0"]
+            next_input += 1
+            if captions_path and captions_path.exists():
+                cmd += ["-i", str(captions_path)]
+                output_args += ["-map", f"{next_input}:s:0", "-c:s", "mov_text", "-metadata:s:s:0", "language=eng"]
+                next_input += 1
+            output_args += ["-c:v", "libx264", "-tune", "stillimage", "-pix_fmt", "yuv420p", "-r", "1"]
+            output_args += ["-c:a", "aac", "-b:a", "192k"]
+        else:
+            output_args += ["-c:a", "libmp3lame", "-b:a", "128k"]
+        for key, val in (metadata or {}).items():
+            output_args.extend(["-metadata", f"{key}={val}"])
+        if fmt == "mp3":
+            output_args.extend(["-id3v2_version", "3", "-write_id3v1", "1"])
+        return cmd + output_args + [str(out_path)]
 
     def instantiate_plan(
         self,
@@ -85,27 +113,73 @@ class PlayAudioBuilder:
         metadata: dict[str, str] | None = None,
         audio_mixer: AudioMixer | None = None,
     ) -> None:
-        """Render the audio plan into a single audio file, optionally muxing captions and a blank video track."""
+        """Render the audio plan into a single audio file, optionally muxing captions and a still video track."""
         cache: Dict[Path, AudioSegment | None] = {}
         mixer = audio_mixer or self.audio_mixer
         audio = AudioSegment.empty()
         chapters: List[Tuple[int, int, str]] = []
-        current_chapter_title: str | None = None
-        current_chapter_start: int | None = None
+        chunk_keys: List[str] = []
 
         for extra in prepend_paths or []:
             seg = PlayPlanBuilder.load_audio_by_path(extra, cache)
             if seg:
                 audio += seg
 
+        for title, items in self.split_chapters(plan):
+            start = len(audio)
+            audio += self._render_chunk(items, mixer, cache, chunk_keys)
+            if title is not None:
+                logging.info("Inserting chapter: %s", title)
+                chapters.append((start, len(audio), title))
+
+        for extra in append_paths or []:
+            seg = PlayPlanBuilder.load_audio_by_path(extra, cache)
+            if seg:
+                audio += seg
+
+        self.export_with_chapters(
+            audio,
+            chapters if chapters else [],
+            out_path,
+            fmt=audio_format,
+            metadata=metadata or {},
+            captions_path=captions_path,
+        )
+        if self.render_cache is not None:
+            self.render_cache.retain(out_path, chunk_keys)
+
+
+    @staticmethod
+    def split_chapters(plan: List[PlanItem]) -> List[Tuple[str | None, List[PlanItem]]]:
+        """Split the plan at each Chapter; items before the first chapter form an untitled chunk."""
+        chunks: List[Tuple[str | None, List[PlanItem]]] = [(None, [])]
         for item in plan:
             if isinstance(item, Chapter):
-                logging.info("Inserting chapter: %s", item.title or "")
-                if current_chapter_start is not None:
-                    chapters.append((current_chapter_start, len(audio), current_chapter_title or ""))
-                current_chapter_title = item.title or ""
-                current_chapter_start = len(audio)
+                chunks.append((item.title or "", []))
                 continue
+            chunks[-1][1].append(item)
+        return [(title, items) for title, items in chunks if title is not None or items]
+
+    def _render_chunk(
+        self,
+        items: List[PlanItem],
+        mixer: AudioMixer,
+        cache: Dict[Path, AudioSegment | None],
+        chunk_keys: List[str],
+    ) -> AudioSegment:
+        if self.render_cache is None or not items:
+            return self._render_items(items, mixer, cache)
+        key = self.render_cache.key(items, mixer)
+        chunk_keys.append(key)
+        audio = self.render_cache.load(key)
+        if audio is None:
+            audio = self._render_items(items, mixer, cache)
+            self.render_cache.save(key, audio)
+        return audio
+
+    def _render_items(self, items: List[PlanItem], mixer: AudioMixer, cache: Dict[Path, AudioSegment | None]) -> AudioSegment:
+        audio = AudioSegment.empty()
+        for item in items:
             if isinstance(item, ParallelClips):
                 if not item.clips:
                     continue
@@ -128,39 +202,7 @@ class PlayAudioBuilder:
             seg = PlayPlanBuilder.load_audio_by_path(item.path, cache)
             if seg:
                 audio += seg
-
-        if current_chapter_start is not None:
-            chapters.append((current_chapter_start, len(audio), current_chapter_title or ""))
-
-        for extra in append_paths or []:
-            seg = PlayPlanBuilder.load_audio_by_path(extra, cache)
-            if seg:
-                audio += seg
-
-        self.export_with_chapters(audio, chapters if chapters else [], out_path, fmt=audio_format, metadata=metadata or {})
-
-        if audio_format == "mp4":
-            tmp_out = out_path.with_suffix(".tmp.mp4")
-            cmd = [
-                "ffmpeg",
-                "-y",
-                "-f",
-                "lavfi",
-                "-i",
-                "color=size=1280x720:rate=30:color=black",
-                "-i",
-                str(out_path),
-            ]
-            map_args = ["-map", "0:v:0", "-map", "1:a:0"]
-            if captions_path and captions_path.exists():
-                cmd += ["-i", str(captions_path)]
-                map_args += ["-map", "2:s:0"]
-                cmd += ["-c:s", "mov_text", "-metadata:s:s:0", "language=eng"]
-            cmd += map_args
-            cmd += ["-shortest", "-c:v", "libx264", "-c:a", "copy", str(tmp_out)]
-            logging.info("Muxing video (and captions if present) into %s", paths.display_path(out_path))
-            subprocess.run(cmd, check=True)
-            tmp_out.replace(out_path)
+        return audio
 
 
 __all__ = ["PlayAudioBuilder"]
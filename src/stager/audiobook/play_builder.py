@@ -2,7 +2,9 @@
 """Thin wrapper to build audio plans and optionally render them."""
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 import logging
+import os
 from pathlib import Path
 from dataclasses import dataclass, field
 
@@ -11,6 +13,7 @@ from stager.domain.play import Play, Part
 from stager.audiobook.chapter_builder import ChapterBuilder
 from stager.cues.callout_director import CalloutDirector, ConversationAwareCalloutDirector, RoleCalloutDirector, NoCalloutDirector
 from stager.audiobook.play_audio_builder import PlayAudioBuilder
+from stager.audiobook.chunk_render_cache import ChunkRenderCache
 from stager.audiobook.caption_builder import CaptionBuilder
 from stager.shared import paths
 from stager.shared.progress_reporter import ProgressReporter
@@ -32,8 +35,13 @@ class PlayBuilder:
     voice_actor: str | None = None
     play: Play = None
     paths: paths.PathConfig = field(default_factory=paths.current)
-    audio_builder:PlayAudioBuilder = field(default_factory = PlayAudioBuilder)
+    audio_builder: PlayAudioBuilder | None = None
     progress_reporter: ProgressReporter | None = None
+    jobs: int | None = None
+
+    def __post_init__(self):
+        if self.audio_builder is None:
+            self.audio_builder = PlayAudioBuilder(render_cache=ChunkRenderCache(self.paths.build_dir / "render_cache"))
 
     def build_audio(self, part_no: int) -> list[Path]:
         """Build audio plans (and optional outputs) using configured settings."""
@@ -46,7 +54,6 @@ class PlayBuilder:
             ConversationAwareCalloutDirector(self.play, paths_config=self.paths) if self.minimal_callouts else RoleCalloutDirector(self.play, paths_config=self.paths)
         )
         director = director if self.include_callouts else NoCalloutDirector(self.play)
-        audio_builder = PlayAudioBuilder()
         builder = PlayPlanBuilder(
             play=self.play,
             director=director,
@@ -74,10 +81,11 @@ class PlayBuilder:
             logging.info("Wrote captions to %s", paths.display_path(captions_path))
         if self.generate_audio:
             logging.info("Generating audioplay to %s", paths.display_path(out_path))
-            audio_builder.instantiate_plan(plan, out_path, audio_format=self.audio_format, captions_path=captions_path)
+            self.audio_builder.instantiate_plan(plan, out_path, audio_format=self.audio_format, captions_path=captions_path)
             logging.info("Wrote %s", paths.display_path(out_path))
         else:
             logging.info("Skipping audio rendering (generate-audio=false)")
+        self._prune_render_cache()
         if self.progress_reporter is not None:
             self.progress_reporter.advance(f"Rendered {out_path.name}")
         return [out_path]
@@ -91,7 +99,7 @@ class PlayBuilder:
         return self.paths.audio_play_dir / f"{title}.{audio_format}"
 
     def _build_librivox(self) -> list[Path]:
-        outputs: list[Path] = []
+        renders: list[tuple[list[PlanItem], Path, dict[str, str]]] = []
         chapters = ChapterBuilder(play=self.play).build()
         director: CalloutDirector = (
             ConversationAwareCalloutDirector(self.play, paths_config=self.paths) if self.minimal_callouts else RoleCalloutDirector(self.play, paths_config=self.paths)
@@ -101,7 +109,6 @@ class PlayBuilder:
         file_friendly_title = ''.join(self.play.title.lower().split())
         for part_no in [p.part_no for p in self.play.parts if p.part_no is not None]:
             out_path = self.paths.audio_play_dir / f"{file_friendly_title}_{part_no}_shaw_128kb.mp3"
-            outputs.append(out_path)
             title_map = {0: "PROLOGUE", 1: "ACT I", 2: "ACT II"}
             metadata = {
                 "title": title_map.get(part_no, str(part_no)),
@@ -130,22 +137,51 @@ class PlayBuilder:
             plan_path.parent.mkdir(parents=True, exist_ok=True)
             write_plan(plan, plan_path)
             logging.info("Wrote audio plan to %s", paths.display_path(plan_path))
-            if self.generate_audio:
-                self.audio_builder.instantiate_plan(
-                    plan,
-                    out_path,
-                    audio_format="mp3",
-                    captions_path=None,
-                    prepend_paths=[],
-                    append_paths=[],
-                    metadata=metadata,
-                )
-                logging.info("Wrote %s", paths.display_path(out_path))
-            else:
+            renders.append((plan, out_path, metadata))
+        # Plans are built in part order above; only the independent per-part renders run in parallel.
+        self._render_librivox_parts(renders)
+        self._prune_render_cache()
+        return [out_path for _plan, out_path, _metadata in renders]
+
+    def _render_librivox_parts(self, renders: list[tuple[list[PlanItem], Path, dict[str, str]]]) -> None:
+        if not self.generate_audio:
+            for _plan, out_path, _metadata in renders:
                 logging.info("Skipping audio rendering (generate-audio=false)")
-            if self.progress_reporter is not None:
-                self.progress_reporter.advance(f"Rendered {out_path.name}")
-        return outputs
+                self._advance(out_path)
+            return
+        if not renders:
+            return
+        workers = min(self.jobs or os.cpu_count() or 1, len(renders))
+        with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="librivox-part") as executor:
+            futures = [
+                executor.submit(self._render_librivox_part, plan, out_path, metadata)
+                for plan, out_path, metadata in renders
+            ]
+            # Results are reported in part order, whichever part finishes first.
+            for (_plan, out_path, _metadata), future in zip(renders, futures):
+                future.result()
+                logging.info("Wrote %s", paths.display_path(out_path))
+                self._advance(out_path)
+
+    def _prune_render_cache(self) -> None:
+        # Parts render in parallel, so superseded chunks are only swept once every render has recorded its keys.
+        if self.generate_audio and self.audio_builder.render_cache is not None:
+            self.audio_builder.render_cache.prune()
+
+    def _render_librivox_part(self, plan: list[PlanItem], out_path: Path, metadata: dict[str, str]) -> None:
+        self.audio_builder.instantiate_plan(
+            plan,
+            out_path,
+            audio_format="mp3",
+            captions_path=None,
+            prepend_paths=[],
+            append_paths=[],
+            metadata=metadata,
+        )
+
+    def _advance(self, out_path: Path) -> None:
+        if self.progress_reporter is not None:
+            self.progress_reporter.advance(f"Rendered {out_path.name}")
 
 
 __all__ = ["PlayBuilder", "PlanItem"]
@@ -174,7 +174,7 @@ class PlayPlanBuilder:
             raise RuntimeError(f"No segments found for part {part_filter!r}")
         part_blocks = part_obj.blocks
 
-        audio_plan: AudioPlan = AudioPlan()
+        audio_plan: AudioPlan = self.plan.empty_like()
 
         for b_idx, block in enumerate(part_blocks):
             block_id = block.block_id
@@ -241,40 +241,7 @@ class PlayPlanBuilder:
             seg_plan = self.build_part_plan(part_filter=part.part_no)
 
             ## add segments to plan
-            for item in seg_plan:
-                if isinstance(item, Chapter):
-                    item.offset_ms = self.plan.duration_ms
-                    self.plan.addChapter(item)
-                    continue
-                if isinstance(item, Silence):
-                    self.plan.add_silence(item.length_ms)
-                elif isinstance(item, ParallelClips):
-                    clips: List[SegmentClip] = []
-                    for clip in item.clips:
-                        clips.append(
-                            clip.__class__(
-                                path=clip.path,
-                                text=clip.text,
-                                role=clip.role,
-                                clip_id=clip.clip_id,
-                                length_ms=clip.length_ms,
-                                offset_ms=self.plan.duration_ms,
-                            )
-                        )
-                    self.plan.add_parallel(clips, following_silence_ms=0)
-                elif isinstance(item, (CalloutClip, SegmentClip)):
-                    self.plan.addClip(
-                        item.__class__(
-                            path=item.path,
-                            text=item.text,
-                            role=item.role,
-                            clip_id=item.clip_id,
-                            length_ms=item.length_ms,
-                            offset_ms=self.plan.duration_ms,
-                        )
-                    )
-                else:
-                    raise RuntimeError(f"Unexpected plan item type: {type(item)}")
+            self.plan.append_plan(seg_plan)
 
             ## add end of part clips
             self.plan.add_silence(PARAGRAPH_PAUSE_MS)
@@ -5,11 +5,15 @@ from __future__ import annotations
 from collections import defaultdict
 import logging
 
-from openpyxl import Workbook
-from openpyxl.utils import get_column_letter
-from openpyxl.styles import PatternFill
-
 from stager.shared import paths
+from stager.shared.xlsx_report_writer import (
+    CENTER,
+    DECIMAL,
+    RIGHT,
+    RIGHT_MISSING,
+    RIGHT_WARNING,
+    XlsxReportWriter,
+)
 from stager.verification.segment_verifier import compute_rows
 from stager.audio.spacing import CALLOUT_SPACING_MS, SEGMENT_SPACING_MS
 
@@ -28,12 +32,33 @@ def safe_sheet_name(name: str, existing: set[str]) -> str:
     return candidate
 
 
-def write_sheet(ws, headers, rows):
-    ws.append(headers)
-    id_col_idx = headers.index("id") + 1 if "id" in headers else None
-    warn_col_idx = headers.index("warning") + 1 if "warning" in headers else None
-    warn_fill = PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid")
-    missing_fill = PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid")
+def write_sheet(report: XlsxReportWriter, title: str, headers, rows):
+    sheet = report.add_sheet(
+        title,
+        headers,
+        widths={
+            "warning": 2.5,  # ~7-8px
+            "expected_seconds": 5,  # ~20px
+            "actual_seconds": 5,
+            "text": 106,  # ~800px
+            "role": 5,  # match expected/actual columns
+            "start": 8,
+            "src_offset": 9,
+        },
+        column_styles={
+            "id": RIGHT,
+            "warning": CENTER,
+            "expected_seconds": DECIMAL,
+            "actual_seconds": DECIMAL,
+            "percent": DECIMAL,
+            "start": RIGHT,
+            "src_offset": RIGHT,
+        },
+        header_styles={"id": RIGHT, "warning": CENTER},
+        hidden={"percent"},
+        row_styles={RIGHT_WARNING, RIGHT_MISSING},
+    )
+    flag_ids = "id" in headers and "warning" in headers
     for row in rows:
         values = []
         for h in headers:
@@ -44,59 +69,14 @@ def write_sheet(ws, headers, rows):
                 except ValueError:
                     pass
             values.append(val)
-        ws.append(values)
-        if id_col_idx and warn_col_idx:
-            warn_val = values[warn_col_idx - 1]
+        styles = None
+        if flag_ids:
+            warn_val = row.get("warning", "")
             if warn_val == "-":
-                ws.cell(row=ws.max_row, column=id_col_idx).fill = missing_fill
+                styles = {"id": RIGHT_MISSING}
             elif warn_val in ("<", ">"):
-                ws.cell(row=ws.max_row, column=id_col_idx).fill = warn_fill
-    # Apply number formats
-    for col in ws.iter_cols(min_row=2, max_row=ws.max_row):
-        header = col[0].offset(row=-1).value  # header cell above data
-        if header in ("expected_seconds", "actual_seconds"):
-            for cell in col:
-                cell.number_format = "0.0"
-                cell.alignment = cell.alignment.copy(horizontal="right")
-        elif header == "percent":
-            for cell in col:
-                cell.number_format = "0.0"
-                cell.alignment = cell.alignment.copy(horizontal="right")
-        elif header in ("start", "src_offset"):
-            for cell in col:
-                cell.alignment = cell.alignment.copy(horizontal="right")
-    # Widen text column
-    # Column widths
-    if "warning" in headers:
-        idx = headers.index("warning") + 1
-        ws.column_dimensions[get_column_letter(idx)].width = 2.5  # ~7-8px
-        for cell in ws[get_column_letter(idx)]:
-            cell.alignment = cell.alignment.copy(horizontal="center")
-    if "expected_seconds" in headers:
-        idx = headers.index("expected_seconds") + 1
-        ws.column_dimensions[get_column_letter(idx)].width = 5  # ~20px
-    if "actual_seconds" in headers:
-        idx = headers.index("actual_seconds") + 1
-        ws.column_dimensions[get_column_letter(idx)].width = 5  # ~20px
-    if "percent" in headers:
-        idx = headers.index("percent") + 1
-        ws.column_dimensions[get_column_letter(idx)].hidden = True
-    if "text" in headers:
-        idx = headers.index("text") + 1
-        ws.column_dimensions[get_column_letter(idx)].width = 106  # ~800px
-    if "role" in headers:
-        idx = headers.index("role") + 1
-        ws.column_dimensions[get_column_letter(idx)].width = 5  # match expected/actual columns
-    if "start" in headers:
-        idx = headers.index("start") + 1
-        ws.column_dimensions[get_column_letter(idx)].width = 8
-    if "src_offset" in headers:
-        idx = headers.index("src_offset") + 1
-        ws.column_dimensions[get_column_letter(idx)].width = 9
-    if "id" in headers:
-        idx = headers.index("id") + 1
-        for cell in ws[get_column_letter(idx)]:
-            cell.alignment = cell.alignment.copy(horizontal="right")
+                styles = {"id": RIGHT_WARNING}
+        sheet.append(values, styles)
 
 
 def generate_xlsx(
@@ -121,10 +101,8 @@ def generate_xlsx(
         paths_config=cfg,
     )
     headers = ["id", "warning", "expected_seconds", "actual_seconds", "percent", "start", "src_offset", "role", "text"]
-    wb = Workbook()
-    ws = wb.active
-    ws.title = "All"
-    write_sheet(ws, headers, rows)
+    report = XlsxReportWriter()
+    write_sheet(report, "All", headers, rows)
 
     by_role = defaultdict(list)
     for row in rows:
@@ -136,21 +114,18 @@ def generate_xlsx(
     narrator_key = "_NARRATOR"
     if narrator_key in by_role:
         name = safe_sheet_name(narrator_key, used_names)
-        ws_role = wb.create_sheet(title=name)
-        write_sheet(ws_role, headers, by_role[narrator_key])
+        write_sheet(report, name, headers, by_role[narrator_key])
 
     for role, role_rows in sorted(by_role.items()):
         if role == narrator_key:
             continue
         name = safe_sheet_name(role, used_names)
-        ws_role = wb.create_sheet(title=name)
-        write_sheet(ws_role, headers, role_rows)
+        write_sheet(report, name, headers, role_rows)
 
     if part_no is None:
         out_path = cfg.audio_out_dir / "timings.xlsx"
     else:
         out_path = cfg.audio_out_dir / f"timings_part_{part_no}.xlsx"
-    out_path.parent.mkdir(parents=True, exist_ok=True)
-    wb.save(out_path)
+    report.save(out_path)
     logger.info("Wrote %s", paths.display_path(out_path))
     return out_path
@@ -36,14 +36,18 @@ from stager.audiobook.audio_play_build_service import AudioPlayBuildService
 from stager.audiobook.timing_build_service import TimingBuildService
 from stager.domain.play import Play, Part
 from stager.text.text_artifact_builder import TextArtifactBuilder
+from stager.loudnorm.loudness_meter import LoudnessMeter
 from stager.loudnorm.normalizer import Normalizer
 from stager.cues.cue_build_service import CueBuildService
 from stager.audiobook.play_plan_builder import PlayPlanBuilder
 from stager.playbook.playbook_builder import PlaybookBuilder
+from stager.playbook.playbook_cue_selector import PlaybookCueSelector
 from stager.playbook.playbook_progress_reporter import PlaybookProgressReporter
 from stager.scriptwright import ProductionPlayLoader, ScriptWright
 from stager.scriptwright.scriptwright import PRODUCTION_MARKDOWN_FORMATS
+from stager.linerecorder.recording_context_index import RecordingContextIndex
 from stager.linerecorder.recording_request_builder import RecordingRequestBuilder
+from stager.linerecorder.role_recordings_bulk_importer import RoleRecordingsBulkImporter, RoleRecordingsBulkImportResult
 from stager.linerecorder.role_recordings_importer import RecordingImportProcessingOptions, RoleRecordingsImporter
 from stager.production.production_status import ProductionStatus, ProductionStatusService
 from stager.production.production_renderers import (
@@ -64,8 +68,13 @@ from stager.verification.match_audio_diff import MatchAudioDiff
 from stager.verification.missing_audio_diff import MissingAudioDiff
 from stager.verification.audio_verifier_summary_renderer import AudioVerifierSummaryRenderer
 from stager.verification.audio_verifier_workbook_writer import AudioVerifierWorkbookWriter
+from stager.verification.role_verification_cache import RoleVerificationCache
 from stager.transcription.vad_config import VadConfig
 from stager.transcription.whisper_cache_cleaner import WhisperCacheCleaner
+from stager.transcription.resident_whisper_model_store import ResidentWhisperModelStore
+from stager.transcription.decoded_audio_cache import DecodedAudioCache
+from stager.transcription.segment_transcription_cache import SegmentTranscriptionCache
+from stager.transcription.whisper_transcription_cache import WhisperTranscriptionCache
 from stager.audio.audio_check import AudioCheck
 from stager.audio.segment_audio_player import SegmentAudioPlayer
 from stager.audio.audacity_recording_exporter import AudacityRecordingExporter
@@ -234,6 +243,30 @@ def require_audio_tools():
         raise click.ClickException(str(exc)) from exc
 
 
+def validate_whisper_batching(batch_size: int, threads: int) -> None:
+    if batch_size < 1:
+        raise typer.BadParameter("--batch-size must be at least 1")
+    if threads < 0:
+        raise typer.BadParameter("--threads must be 0 or more")
+
+
+def whisper_model_store(
+    paths_config: paths.PathConfig,
+    threads: int = 0,
+    daemon: bool = False,
+) -> WhisperModelStore | ResidentWhisperModelStore:
+    store = WhisperModelStore(
+        paths=paths_config,
+        device="cpu",
+        compute_type="int8",
+        local_files_only=True,
+        cpu_threads=threads,
+    )
+    if daemon:
+        return ResidentWhisperModelStore(store=store)
+    return store
+
+
 def raise_playbook_cli_error(exc: RuntimeError) -> None:
     message = str(exc)
     if message.startswith("Missing required ") and " while building Playbook:" in message:
@@ -556,6 +589,37 @@ def verify_audio(
         "--remove-fillers/--keep-fillers",
         help="Drop filler words like 'um' and 'uh' during alignment",
     ),
+    per_segment: bool = typer.Option(
+        False,
+        "--per-segment/--whole-recording",
+        help="Transcribe split segment audio one file at a time, caching each take by content",
+    ),
+    batch_size: int = typer.Option(
+        1,
+        "--batch-size",
+        help="Segments per batched Whisper call with --per-segment (1 disables batching)",
+    ),
+    threads: int = typer.Option(0, "--threads", help="CPU threads for Whisper inference (0: library default)"),
+    daemon: bool = typer.Option(
+        False,
+        "--daemon/--no-daemon",
+        help="Keep Whisper models loaded in a background daemon between runs",
+    ),
+    cache_max_mb: int = typer.Option(
+        1024,
+        "--cache-max-mb",
+        help="Evict least recently used cached transcriptions beyond this size (0: unbounded)",
+    ),
+    decoded_cache_max_mb: int = typer.Option(
+        8192,
+        "--decoded-cache-max-mb",
+        help="Evict least recently used decoded recordings beyond this size (0: unbounded)",
+    ),
+    incremental: bool = typer.Option(
+        True,
+        "--incremental/--no-incremental",
+        help="Reuse results for roles whose recording, script, substitutions and settings are unchanged",
+    ),
     summary: bool = typer.Option(True, "--summary/--no-summary", help="Write concise summary to console"),
     summary_format: str = typer.Option("text", "--summary-format", help="Summary format: text or yaml"),
     play: str | None = PLAY_OPTION,
@@ -578,6 +642,13 @@ def verify_audio(
         raise typer.BadParameter("Cannot use --recording without --role")
     if output and len(roles_to_verify) > 1:
         raise typer.BadParameter("Cannot use --out without --role")
+    if recording and per_segment:
+        raise typer.BadParameter("Cannot use --recording with --per-segment")
+    validate_whisper_batching(batch_size, threads)
+    if cache_max_mb < 0:
+        raise typer.BadParameter("--cache-max-mb must be 0 or more")
+    if decoded_cache_max_mb < 0:
+        raise typer.BadParameter("--decoded-cache-max-mb must be 0 or more")
     for role_name in roles_to_verify:
         if role_name not in valid_roles:
             raise typer.BadParameter(f"Unknown role: {role_name}")
@@ -587,12 +658,12 @@ def verify_audio(
         raise typer.BadParameter(f"Unknown model: {model}. Choose from {', '.join(MODEL_CHOICES)}.")
     model_name = MODEL_NAME_MAP[model_key]
     effective_build_type = BuildTypeResolver(paths_config=cfg).resolve()
-    store = WhisperModelStore(
-        paths=cfg,
-        device="cpu",
-        compute_type="int8",
-        local_files_only=True,
-    )
+    store = whisper_model_store(cfg, threads=threads, daemon=daemon)
+    cache_max_bytes = cache_max_mb * 1024 * 1024 or None
+    transcription_cache = WhisperTranscriptionCache(paths=cfg, max_bytes=cache_max_bytes)
+    segment_cache = SegmentTranscriptionCache(paths=cfg, max_bytes=cache_max_bytes)
+    decoded_audio = DecodedAudioCache(paths=cfg, max_bytes=decoded_cache_max_mb * 1024 * 1024 or None)
+    result_cache = RoleVerificationCache(paths=cfg) if incremental else None
     vad_config = VadConfig.from_overrides(
         threshold=vad_threshold,
         neg_threshold=vad_neg_threshold,
@@ -625,6 +696,12 @@ def verify_audio(
                 initial_prompt=initial_prompt,
                 homophone_max_words=homophone_max_words,
                 remove_fillers=remove_fillers,
+                transcription_cache=transcription_cache,
+                segment_transcription=per_segment,
+                segment_cache=segment_cache,
+                decoded_audio=decoded_audio,
+                batch_size=batch_size,
+                result_cache=result_cache,
             )
             vetted_ids_by_role[role_name] = verifier.vetted_ids()
             ignored_ids_by_role[role_name] = verifier.ignored_ids()
@@ -641,10 +718,14 @@ def verify_audio(
             diffs = verifier.build_diffs(results)
             if role is None:
                 combined_diffs[role_name] = diffs
-            write_start = time.perf_counter()
-            out_path = verifier.write_xlsx(results, out_path=output)
-            write_elapsed = time.perf_counter() - write_start
-            logging.info("Wrote %s in %.2fs", paths.display_path(out_path), write_elapsed)
+            out_path = output or cfg.audio_out_dir / f"{role_name}_audio_verification.xlsx"
+            if verifier.results_from_cache and _written_after_cache(out_path, result_cache, role_name):
+                logging.info("Kept %s (inputs unchanged)", paths.display_path(out_path))
+            else:
+                write_start = time.perf_counter()
+                out_path = verifier.write_xlsx(results, out_path=output)
+                write_elapsed = time.perf_counter() - write_start
+                logging.info("Wrote %s in %.2fs", paths.display_path(out_path), write_elapsed)
             missing_count = sum(1 for diff in diffs if isinstance(diff, MissingAudioDiff))
             extra_count = sum(1 for diff in diffs if isinstance(diff, ExtraAudioDiff))
             partial_count = sum(
@@ -694,6 +775,14 @@ def verify_audio(
         )
 
 
+def _written_after_cache(out_path: Path, result_cache: RoleVerificationCache | None, role: str) -> bool:
+    # A workbook older than the cached results was written by an earlier verifier and must be rewritten.
+    if result_cache is None or not out_path.exists():
+        return False
+    saved_at_ns = result_cache.saved_at_ns(role)
+    return saved_at_ns is not None and out_path.stat().st_mtime_ns >= saved_at_ns
+
+
 @whisper_app.callback(invoke_without_command=True)
 def whisper(
     ctx: typer.Context,
@@ -710,6 +799,18 @@ def whisper(
         "--clip-length-ms",
         help="Clip duration in ms (default: full length)",
     ),
+    per_segment: bool = typer.Option(
+        False,
+        "--per-segment/--whole-recording",
+        help="Transcribe the role's split segment files in batches instead of the full recording",
+    ),
+    batch_size: int = typer.Option(8, "--batch-size", help="Segments per batched Whisper call with --per-segment"),
+    threads: int = typer.Option(0, "--threads", help="CPU threads for Whisper inference (0: library default)"),
+    daemon: bool = typer.Option(
+        False,
+        "--daemon/--no-daemon",
+        help="Keep Whisper models loaded in a background daemon between runs",
+    ),
     vad_threshold: float | None = typer.Option(
         None,
         "--vad-threshold",
@@ -772,6 +873,9 @@ def whisper(
     if model_key not in MODEL_CHOICES:
         raise typer.BadParameter(f"Unknown model: {model}. Choose from {', '.join(MODEL_CHOICES)}.")
     model_name = MODEL_NAME_MAP[model_key]
+    if per_segment and (clip_from_ms or clip_length_ms is not None):
+        raise typer.BadParameter("Cannot clip audio with --per-segment")
+    validate_whisper_batching(batch_size, threads)
     vad_config = VadConfig.from_overrides(
         threshold=vad_threshold,
         neg_threshold=vad_neg_threshold,
@@ -792,9 +896,14 @@ def whisper(
         initial_prompt=initial_prompt,
         clip_from_ms=clip_from_ms,
         clip_length_ms=clip_length_ms,
+        batch_size=batch_size,
+        whisper_store=whisper_model_store(cfg, threads=threads, daemon=daemon),
     )
     try:
-        transcriber.transcribe()
+        if per_segment:
+            transcriber.transcribe_segments()
+        else:
+            transcriber.transcribe()
     except LocalEntryNotFoundError as exc:
         raise typer.BadParameter(
             f"Whisper model '{model_name}' not cached. Run: python src/build.py whisper-init --model {model_name}"
@@ -811,6 +920,8 @@ def clear_whisper_cache(
     setup_logging(cfg)
     cleaner = WhisperCacheCleaner(paths=cfg)
     removed = cleaner.clear(role)
+    # Cached verification results were aligned against the cleared transcriptions.
+    RoleVerificationCache(paths=cfg).clear(role)
     if role:
         logging.info("Cleared %d cached transcription(s) for %s", removed, role)
     else:
@@ -904,6 +1015,12 @@ def audioplay(
     ),
     voice_profiles: bool = typer.Option(False, "--voice-profiles/--no-voice-profiles", help="Use rendered voice-profile audio"),
     voice_actor: str | None = typer.Option(None, "--voice-actor", help="Select actor for voice-profile rendering"),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Maximum parts rendered and normalized in parallel (default: CPU count)",
+    ),
     play: str | None = PLAY_OPTION,
     production_source: str = PRODUCTION_SOURCE_OPTION,
     staging: bool = STAGING_OPTION,
@@ -941,6 +1058,7 @@ def audioplay(
             audio_source=audio_source,
             voice_profiles=voice_profiles,
             voice_actor=voice_actor,
+            jobs=jobs,
             ffmpeg_installation=ffmpeg_installation,
             paths_config=cfg,
             prepare=prepare,
@@ -1018,6 +1136,21 @@ def playbook(
         "--blocking-diagrams/--no-blocking-diagrams",
         help="Include packaged blocking diagram JSON assets when staging data exists.",
     ),
+    packaging: str = typer.Option(
+        "staged",
+        "--packaging",
+        help="Playbook packaging: staged (unpack to build/app, then zip) or direct (stream into the zip)",
+    ),
+    keep_app_dir: bool = typer.Option(
+        False,
+        "--keep-app-dir/--no-keep-app-dir",
+        help="With --packaging direct, also keep the unpacked Playbook in build/app.",
+    ),
+    audio_layout: str = typer.Option(
+        "files",
+        "--audio-layout",
+        help="Playbook audio layout: files (one file per segment) or sprites (one file per role, format 2.0.0)",
+    ),
 ) -> None:
     """Build a Cuemaster Playbook manifest and package."""
     cfg = paths.PathConfig(play or paths.default_play_name())
@@ -1036,6 +1169,9 @@ def playbook(
                 ffmpeg_installation=ffmpeg_installation,
                 staging=staging,
                 blocking_diagrams=blocking_diagrams,
+                packaging=packaging,
+                keep_app_dir=keep_app_dir,
+                audio_layout=audio_layout,
                 progress_reporter=RichPlaybookProgressReporter(progress),
             )
         except RuntimeError as exc:
@@ -1044,7 +1180,12 @@ def playbook(
 
 @app.command("recording-request", rich_help_panel="build")
 def recording_request(
-    role: str = typer.Option(..., "--role", "-r", help="Role to build a Recording Request for"),
+    role: str | None = typer.Option(None, "--role", "-r", help="Role to build a Recording Request for"),
+    all_roles: bool = typer.Option(
+        False,
+        "--all-roles",
+        help="Build a full-role Recording Request for every rehearsable role in one pass",
+    ),
     item: list[str] | None = typer.Option(
         None,
         "--item",
@@ -1065,9 +1206,20 @@ def recording_request(
     cfg = paths.PathConfig(play or paths.default_play_name())
     setup_logging(cfg)
     apply_production_source(cfg, production_source)
+    item_ids = selected_recording_item_ids(item, segment)
+    if all_roles:
+        if role is not None:
+            raise typer.BadParameter("Use either --role or --all-roles, not both")
+        if item_ids:
+            raise typer.BadParameter("--item cannot be combined with --all-roles")
+        for zip_path in run_all_role_recording_requests(item_reason=reason, notes=notes, paths_config=cfg):
+            typer.echo(paths.display_path(zip_path))
+        return
+    if role is None:
+        raise typer.BadParameter("Provide --role or --all-roles")
     zip_path = run_recording_request(
         role=role,
-        item_ids=selected_recording_item_ids(item, segment),
+        item_ids=item_ids,
         item_reason=reason,
         notes=notes,
         paths_config=cfg,
@@ -1223,6 +1375,12 @@ def recording_import(
     package: Path = typer.Argument(..., help="LineRecorder role recordings zip to import"),
     denoise: bool = typer.Option(False, "--denoise", help="Use included floor-noise recordings for import-time denoising"),
     trim_silence: bool = typer.Option(False, "--trim-silence", help="Trim leading and trailing silence during import"),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Maximum parallel denoise/trim jobs (default: CPU count)",
+    ),
     play: str | None = PLAY_OPTION,
     production_source: str = PRODUCTION_SOURCE_OPTION,
 ) -> None:
@@ -1236,6 +1394,7 @@ def recording_import(
         package_path=package,
         denoise=denoise,
         trim_silence=trim_silence,
+        jobs=jobs,
         paths_config=cfg,
     )
     status = "complete" if result.complete else "partial"
@@ -1248,6 +1407,48 @@ def recording_import(
     typer.echo(paths.display_path(result.transaction_manifest_path))
 
 
+@app.command("recording-import-bulk", rich_help_panel="build")
+def recording_import_bulk(
+    source: str = typer.Argument(..., help="Directory or glob of LineRecorder role recordings zips to import"),
+    denoise: bool = typer.Option(False, "--denoise", help="Use included floor-noise recordings for import-time denoising"),
+    trim_silence: bool = typer.Option(False, "--trim-silence", help="Trim leading and trailing silence during import"),
+    jobs: int | None = typer.Option(
+        None,
+        "--jobs",
+        "-j",
+        help="Maximum parallel package imports and denoise/trim jobs (default: CPU count)",
+    ),
+    play: str | None = PLAY_OPTION,
+    production_source: str = PRODUCTION_SOURCE_OPTION,
+) -> None:
+    """Import several LineRecorder role recordings packages in one pass."""
+    cfg = paths.PathConfig(play or paths.default_play_name())
+    setup_logging(cfg)
+    apply_production_source(cfg, production_source)
+    if denoise or trim_silence:
+        require_audio_tools()
+    result = run_recording_import_bulk(
+        source=source,
+        denoise=denoise,
+        trim_silence=trim_silence,
+        jobs=jobs,
+        paths_config=cfg,
+    )
+    for import_result in result.results:
+        status = "complete" if import_result.complete else "partial"
+        typer.echo(
+            f"Imported {import_result.imported_count} {status} recordings for {import_result.role}"
+            f" ({len(import_result.missing_segment_ids)} missing)"
+        )
+        for issue in import_result.issues:
+            typer.echo(f"Warning [{issue.code}]: {issue.message}")
+    for failure in result.failures:
+        typer.echo(f"Failed {paths.display_path(failure.package_path)}: {failure.message}", err=True)
+    typer.echo(paths.display_path(result.summary_path))
+    if result.failures:
+        raise typer.Exit(code=1)
+
+
 @app.command("recording-import-undo", rich_help_panel="build")
 def recording_import_undo(
     transaction: Path = typer.Argument(..., help="LineRecorder import transaction JSON to undo"),
@@ -1658,6 +1859,7 @@ def run_audioplay(
     audio_source: str = "auto",
     voice_profiles: bool = False,
     voice_actor: str | None = None,
+    jobs: int | None = None,
     ffmpeg_installation=None,
     paths_config: paths.PathConfig | None = None,
     staging: bool = True,
@@ -1667,6 +1869,8 @@ def run_audioplay(
         raise typer.BadParameter("audio-format must be one of: mp4, mp3, wav")
     if audio_source not in SUPPORTED_AUDIO_SOURCES:
         raise typer.BadParameter("audio-source must be one of: auto, canonical, cleaned")
+    if jobs is not None and jobs < 1:
+        raise typer.BadParameter("jobs must be at least 1")
     cfg = paths_config or paths.current()
     if staging:
         run_staging_export(cfg)
@@ -1674,6 +1878,7 @@ def run_audioplay(
         paths=cfg,
         progress_reporter=progress_reporter,
         ffmpeg_installation=ffmpeg_installation,
+        jobs=jobs,
     ).build(
         part=part,
         segment_spacing_ms=segment_spacing_ms,
@@ -1693,7 +1898,7 @@ def run_audioplay(
 
 
 def run_normalize(src: Path):
-    normalizer = Normalizer()
+    normalizer = Normalizer(loudness_meter=LoudnessMeter(cache_dir=paths.current().build_dir / "loudness_cache"))
     src_parent = src.parent
     out_dir = src_parent / "normalized"
     out_dir.mkdir(parents=True, exist_ok=True)
@@ -1732,10 +1937,17 @@ def run_playbook(
     ffmpeg_installation=None,
     staging: bool = True,
     blocking_diagrams: bool = True,
+    packaging: str = "staged",
+    keep_app_dir: bool = False,
+    audio_layout: str = "files",
     progress_reporter: PlaybookProgressReporter | None = None,
 ) -> Path:
     if audio_format not in ("wav", "mp3"):
         raise typer.BadParameter("audio-format must be one of: wav, mp3")
+    if packaging not in ("staged", "direct"):
+        raise typer.BadParameter("packaging must be one of: staged, direct")
+    if audio_layout not in ("files", "sprites"):
+        raise typer.BadParameter("audio-layout must be one of: files, sprites")
     if audio_source not in SUPPORTED_AUDIO_SOURCES:
         raise typer.BadParameter("audio-source must be one of: auto, canonical, cleaned")
     cfg = paths_config or paths.current()
@@ -1763,6 +1975,9 @@ def run_playbook(
         voice_profiles=voice_profiles,
         voice_actor=voice_actor,
         blocking_diagrams=effective_blocking_diagrams,
+        packaging=packaging,
+        keep_app_dir=keep_app_dir,
+        audio_layout=audio_layout,
         progress_reporter=progress_reporter,
     )
     return builder.build()
@@ -1796,6 +2011,36 @@ def run_recording_request(
     return builder.build()
 
 
+def run_all_role_recording_requests(
+    *,
+    item_reason: str | None = None,
+    notes: str | None = None,
+    paths_config: paths.PathConfig | None = None,
+) -> list[Path]:
+    cfg = paths_config or paths.current()
+    play = load_production_play(cfg)
+    build_id, build_timestamp = _read_playbook_build_metadata(cfg)
+    context_index = RecordingContextIndex(play)
+    cue_selector = PlaybookCueSelector(play=play, paths=cfg)
+    zip_paths: list[Path] = []
+    for role in play.roles:
+        if role.meta or role.name.startswith("_") or not context_index.role_blocks(role.name):
+            continue
+        builder = RecordingRequestBuilder(
+            play=play,
+            paths=cfg,
+            role=role.name,
+            build_id=build_id,
+            build_timestamp=build_timestamp,
+            item_reason=item_reason,
+            notes=notes,
+            cue_selector=cue_selector,
+            context_index=context_index,
+        )
+        zip_paths.append(builder.build())
+    return zip_paths
+
+
 def run_production_status(*, paths_config: paths.PathConfig | None = None) -> ProductionStatus:
     cfg = paths_config or paths.current()
     play = load_production_play(cfg)
@@ -1832,16 +2077,40 @@ def run_recording_import(
     package_path: Path,
     denoise: bool = False,
     trim_silence: bool = False,
+    jobs: int | None = None,
     paths_config: paths.PathConfig | None = None,
 ):
+    if jobs is not None and jobs < 1:
+        raise typer.BadParameter("jobs must be at least 1")
     cfg = paths_config or paths.current()
     play = load_production_play(cfg)
-    return RoleRecordingsImporter(paths=cfg, play=play).import_package(
+    return RoleRecordingsImporter(paths=cfg, play=play, processing_workers=jobs).import_package(
         package_path,
         processing_options=RecordingImportProcessingOptions(denoise=denoise, trim_silence=trim_silence),
     )
 
 
+def run_recording_import_bulk(
+    *,
+    source: str,
+    denoise: bool = False,
+    trim_silence: bool = False,
+    jobs: int | None = None,
+    paths_config: paths.PathConfig | None = None,
+) -> RoleRecordingsBulkImportResult:
+    if jobs is not None and jobs < 1:
+        raise typer.BadParameter("jobs must be at least 1")
+    package_paths = RoleRecordingsBulkImporter.package_paths(source)
+    if not package_paths:
+        raise typer.BadParameter(f"No role recordings packages found for {source}")
+    cfg = paths_config or paths.current()
+    play = load_production_play(cfg)
+    return RoleRecordingsBulkImporter(paths=cfg, play=play, jobs=jobs).import_packages(
+        package_paths,
+        processing_options=RecordingImportProcessingOptions(denoise=denoise, trim_silence=trim_silence),
+    )
+
+
 def run_recording_import_undo(
     *,
     transaction_path: Path,
@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from bisect import bisect_left, bisect_right
+from dataclasses import dataclass, field
+
+from stager.domain.block import Block, DescriptionBlock, DirectionBlock, RoleBlock, TitleBlock
+from stager.domain.play import Play
+from stager.domain.segment import DirectionSegment, Segment, SimultaneousSegment, SpeechSegment
+from stager.linerecorder.recording_context import RecordingContext
+
+
+@dataclass
+class RecordingContextIndex:
+    """Block positions and neighbouring speech context for a play, shared by every role's request."""
+
+    play: Play
+    _positions: dict[int, int] = field(default_factory=dict, init=False, repr=False)
+    _previous: list[RecordingContext | None] = field(default_factory=list, init=False, repr=False)
+    _next: list[RecordingContext | None] = field(default_factory=list, init=False, repr=False)
+    _role_positions: dict[str, list[int]] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        blocks = self.play.blocks
+        # Blocks are unhashable dataclasses, so positions are keyed by identity.
+        self._positions = {id(block): index for index, block in enumerate(blocks)}
+
+        previous: RecordingContext | None = None
+        for block in blocks:
+            self._previous.append(previous)
+            previous = self._last_context_for_block(block) or previous
+
+        following: RecordingContext | None = None
+        self._next = [None] * len(blocks)
+        for index in range(len(blocks) - 1, -1, -1):
+            self._next[index] = following
+            following = self._first_context_for_block(blocks[index]) or following
+
+        for index, block in enumerate(blocks):
+            if not isinstance(block, RoleBlock):
+                continue
+            for role in self._response_roles(block):
+                self._role_positions.setdefault(role, []).append(index)
+
+    def position(self, block: Block) -> int:
+        index = self._positions.get(id(block))
+        if index is None:
+            raise ValueError(f"Block {block.block_id} does not belong to play {self.play.title!r}")
+        return index
+
+    def previous_context(self, block: Block) -> RecordingContext | None:
+        return self._previous[self.position(block)]
+
+    def next_context(self, block: Block) -> RecordingContext | None:
+        return self._next[self.position(block)]
+
+    def role_blocks(self, role: str) -> list[RoleBlock]:
+        return [self.play.blocks[index] for index in self._role_positions.get(role, [])]
+
+    def blocks_between_role_blocks(self, block: RoleBlock, role: str) -> list[Block]:
+        """Return the blocks between the role's response blocks on either side of ``block``."""
+        index = self.position(block)
+        role_positions = self._role_positions.get(role, [])
+        before = bisect_left(role_positions, index)
+        after = bisect_right(role_positions, index)
+        start = 0 if before == 0 else role_positions[before - 1] + 1
+        stop = len(self.play.blocks) if after == len(role_positions) else role_positions[after]
+        return self.play.blocks[start:stop]
+
+    @staticmethod
+    def _response_roles(block: RoleBlock) -> set[str]:
+        roles: set[str] = set()
+        for segment in block.segments:
+            if isinstance(segment, SpeechSegment):
+                roles.add(segment.role)
+            elif isinstance(segment, SimultaneousSegment):
+                roles.update(segment.roles)
+        return roles
+
+    def _last_context_for_block(self, block: Block) -> RecordingContext | None:
+        if isinstance(block, RoleBlock):
+            for segment in reversed(block.segments):
+                context = self._context_for_segment(segment, block)
+                if context is not None:
+                    return context
+            return None
+        return self._context_for_narrator_block(block)
+
+    def _first_context_for_block(self, block: Block) -> RecordingContext | None:
+        if isinstance(block, RoleBlock):
+            for segment in block.segments:
+                context = self._context_for_segment(segment, block)
+                if context is not None:
+                    return context
+            return None
+        return self._context_for_narrator_block(block)
+
+    def _context_for_segment(self, segment: Segment, block: RoleBlock) -> RecordingContext | None:
+        if isinstance(segment, SpeechSegment) and not segment.role.startswith("_"):
+            return RecordingContext(speaker=segment.role, text=segment.text)
+        if isinstance(segment, SimultaneousSegment):
+            return RecordingContext(
+                speaker=block.callout or ", ".join(segment.roles),
+                text=segment.text,
+            )
+        if isinstance(segment, DirectionSegment):
+            return RecordingContext(speaker="_NARRATOR", text=segment.text)
+        return None
+
+    def _context_for_narrator_block(self, block: Block) -> RecordingContext | None:
+        if isinstance(block, TitleBlock):
+            return RecordingContext(speaker="_NARRATOR", text=block.heading)
+        if isinstance(block, (DescriptionBlock, DirectionBlock)):
+            return RecordingContext(speaker="_NARRATOR", text=block.text)
+        return None
@@ -7,10 +7,10 @@ from pathlib import Path
 import shutil
 import zipfile
 
-from stager.domain.block import BlockingBlock, DescriptionBlock, DirectionBlock, RoleBlock, TitleBlock
+from stager.domain.block import BlockingBlock, RoleBlock, TitleBlock
 from stager.domain.play import Play
-from stager.domain.segment import BlockingSegment, DescriptionSegment, DirectionSegment, Segment, SimultaneousSegment, SpeechSegment
-from stager.linerecorder.recording_context import RecordingContext
+from stager.domain.segment import BlockingSegment, DirectionSegment, SimultaneousSegment, SpeechSegment
+from stager.linerecorder.recording_context_index import RecordingContextIndex
 from stager.linerecorder.recording_request_manifest import (
     RecordingPreferences,
     RecordingRequestItem,
@@ -46,12 +46,17 @@ class RecordingRequestBuilder:
     selected_segment_ids: set[str] | None = None
     selected_item_reasons: dict[str, str] | None = None
     cue_selector: PlaybookCueSelector | None = None
+    context_index: RecordingContextIndex | None = None
     _logger: logging.Logger = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._logger = logging.getLogger(__name__)
         if self.cue_selector is None:
             self.cue_selector = PlaybookCueSelector(play=self.play, paths=self.paths)
+        if self.context_index is None:
+            self.context_index = RecordingContextIndex(self.play)
+        elif self.context_index.play is not self.play:
+            raise ValueError("Recording context index was built for a different play")
 
     @property
     def request_dir(self) -> Path:
@@ -152,9 +157,8 @@ class RecordingRequestBuilder:
         items: list[RecordingRequestItem] = []
         matched_segment_ids: set[str] = set()
         sequence = 1
-        for block in self.play.blocks:
-            if not isinstance(block, RoleBlock):
-                continue
+        assert self.context_index is not None
+        for block in self.context_index.role_blocks(self.role):
             response_segments = self._response_segments_for_role(block)
             for segment in response_segments:
                 segment_id = self._segment_request_id(segment)
@@ -178,11 +182,12 @@ class RecordingRequestBuilder:
         sequence: int,
     ) -> RecordingRequestItem:
         assert self.cue_selector is not None
+        assert self.context_index is not None
         cue = self.cue_selector.select_for_block(block)
-        previous = self._previous_context(block)
+        previous = self.context_index.previous_context(block)
         if previous is not None and previous.speaker == cue.speaker and previous.text == cue.text:
             previous = None
-        next_context = self._next_context(block)
+        next_context = self.context_index.next_context(block)
         section = self._section_for_block(block)
         segment_id = str(segment.segment_id)
         return RecordingRequestItem(
@@ -238,67 +243,20 @@ class RecordingRequestBuilder:
                 segments.append(segment)
         return segments
 
-    def _previous_context(self, block: RoleBlock) -> RecordingContext | None:
-        previous_blocks: list = []
-        for candidate in self.play.blocks:
-            if candidate is block:
-                break
-            previous_blocks.append(candidate)
-        for candidate in reversed(previous_blocks):
-            context = self._last_context_for_block(candidate)
-            if context is not None:
-                return context
-        return None
-
-    def _next_context(self, block: RoleBlock) -> RecordingContext | None:
-        seen_block = False
-        for candidate in self.play.blocks:
-            if candidate is block:
-                seen_block = True
-                continue
-            if not seen_block:
-                continue
-            context = self._first_context_for_block(candidate)
-            if context is not None:
-                return context
-        return None
-
-    def _last_context_for_block(self, block) -> RecordingContext | None:
-        if isinstance(block, RoleBlock):
-            for segment in reversed(block.segments):
-                context = self._context_for_segment(segment, block)
-                if context is not None:
-                    return context
-            return None
-        return self._context_for_narrator_block(block)
-
     def _blocking_context(self, block: RoleBlock) -> list[RecordingRequestBlocking]:
         blocking: list[RecordingRequestBlocking] = []
         seen_ids: set[str] = set()
         for segment in block.segments:
             if isinstance(segment, BlockingSegment):
                 self._append_blocking(blocking, seen_ids, segment, "inline")
-        block_index = self.play.blocks.index(block)
-        previous_index = self._adjacent_role_block_index(block_index, -1)
-        next_index = self._adjacent_role_block_index(block_index, 1)
-        start = 0 if previous_index is None else previous_index + 1
-        stop = len(self.play.blocks) if next_index is None else next_index
-        for candidate in self.play.blocks[start:stop]:
+        assert self.context_index is not None
+        for candidate in self.context_index.blocks_between_role_blocks(block, self.role):
             if isinstance(candidate, BlockingBlock) and self._blocking_targets_role(candidate.targets):
                 for segment in candidate.segments:
                     if isinstance(segment, BlockingSegment):
                         self._append_blocking(blocking, seen_ids, segment, candidate.placement)
         return blocking
 
-    def _adjacent_role_block_index(self, start_index: int, step: int) -> int | None:
-        index = start_index + step
-        while 0 <= index < len(self.play.blocks):
-            candidate = self.play.blocks[index]
-            if isinstance(candidate, RoleBlock) and self._response_segments_for_role(candidate):
-                return index
-            index += step
-        return None
-
     def _blocking_targets_role(self, targets: list[str]) -> bool:
         return "*" in targets or self.role in targets
 
@@ -323,34 +281,6 @@ class RecordingRequestBuilder:
             )
         )
 
-    def _first_context_for_block(self, block) -> RecordingContext | None:
-        if isinstance(block, RoleBlock):
-            for segment in block.segments:
-                context = self._context_for_segment(segment, block)
-                if context is not None:
-                    return context
-            return None
-        return self._context_for_narrator_block(block)
-
-    def _context_for_segment(self, segment: Segment, block: RoleBlock) -> RecordingContext | None:
-        if isinstance(segment, SpeechSegment) and not segment.role.startswith("_"):
-            return RecordingContext(speaker=segment.role, text=segment.text)
-        if isinstance(segment, SimultaneousSegment):
-            return RecordingContext(
-                speaker=block.callout or ", ".join(segment.roles),
-                text=segment.text,
-            )
-        if isinstance(segment, DirectionSegment):
-            return RecordingContext(speaker="_NARRATOR", text=segment.text)
-        return None
-
-    def _context_for_narrator_block(self, block) -> RecordingContext | None:
-        if isinstance(block, TitleBlock):
-            return RecordingContext(speaker="_NARRATOR", text=block.heading)
-        if isinstance(block, (DescriptionBlock, DirectionBlock)):
-            return RecordingContext(speaker="_NARRATOR", text=block.text)
-        return None
-
     def _section_for_block(self, block: RoleBlock) -> tuple[str, str]:
         part = self.play.getPart(block.block_id.part_id)
         section_id = "play" if block.block_id.part_id is None else f"part-{block.block_id.part_id}"
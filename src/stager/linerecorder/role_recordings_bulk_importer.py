@@ -0,0 +1,162 @@
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+from datetime import datetime, timezone
+import glob
+import json
+import logging
+import os
+from pathlib import Path
+import zipfile
+
+from stager.domain.play import Play
+from stager.linerecorder.role_recordings_importer import (
+    RecordingImportAudioProcessor,
+    RecordingImportProcessingOptions,
+    RoleRecordingsImporter,
+    RoleRecordingsImportResult,
+)
+from stager.shared import paths
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class RoleRecordingsBulkImportFailure:
+    package_path: Path
+    message: str
+
+
+@dataclass
+class RoleRecordingsBulkImportResult:
+    summary_path: Path
+    results: list[RoleRecordingsImportResult] = field(default_factory=list)
+    failures: list[RoleRecordingsBulkImportFailure] = field(default_factory=list)
+
+
+@dataclass
+class RoleRecordingsBulkImporter:
+    """Import several LineRecorder role recordings packages against one loaded play."""
+
+    paths: paths.PathConfig
+    play: Play | None = None
+    audio_processor: RecordingImportAudioProcessor = field(default_factory=RecordingImportAudioProcessor)
+    jobs: int | None = None
+
+    @staticmethod
+    def package_paths(source: str | Path) -> list[Path]:
+        source_path = Path(source)
+        if source_path.is_dir():
+            return sorted(path for path in source_path.glob("*.zip") if path.is_file())
+        if source_path.is_file():
+            return [source_path]
+        return sorted(Path(match) for match in glob.glob(str(source)) if Path(match).is_file())
+
+    def import_packages(
+        self,
+        package_paths: list[Path],
+        processing_options: RecordingImportProcessingOptions | None = None,
+    ) -> RoleRecordingsBulkImportResult:
+        if not package_paths:
+            raise RuntimeError("No role recordings packages to import")
+        self._reject_duplicate_roles(package_paths)
+        jobs = self.jobs or os.cpu_count() or 1
+        package_workers = min(jobs, len(package_paths))
+        # One importer shares the play's expected segments and production version across packages.
+        importer = RoleRecordingsImporter(
+            paths=self.paths,
+            play=self.play,
+            audio_processor=self.audio_processor,
+            processing_workers=max(1, jobs // package_workers),
+        )
+        with ThreadPoolExecutor(max_workers=package_workers, thread_name_prefix="recording-bulk-import") as executor:
+            futures = [
+                executor.submit(importer.import_package, package_path, processing_options)
+                for package_path in package_paths
+            ]
+        results: list[RoleRecordingsImportResult] = []
+        failures: list[RoleRecordingsBulkImportFailure] = []
+        for package_path, future in zip(package_paths, futures):
+            exc = future.exception()
+            if exc is None:
+                results.append(future.result())
+                continue
+            # Other packages may already be installed, so every failure is recorded rather than aborting the summary.
+            message = str(exc)
+            if not isinstance(exc, (RuntimeError, OSError, zipfile.BadZipFile)):
+                message = f"{type(exc).__name__}: {exc}"
+                logger.error("Unexpected error importing %s", paths.display_path(package_path), exc_info=exc)
+            else:
+                logger.warning("Failed to import %s: %s", paths.display_path(package_path), exc)
+            failures.append(RoleRecordingsBulkImportFailure(package_path=package_path, message=message))
+        summary_path = self._write_summary(package_paths, results, failures)
+        return RoleRecordingsBulkImportResult(summary_path=summary_path, results=results, failures=failures)
+
+    def _reject_duplicate_roles(self, package_paths: list[Path]) -> None:
+        packages_by_role: dict[str, list[Path]] = {}
+        for package_path in package_paths:
+            role = self._package_role(package_path)
+            if role is not None:
+                packages_by_role.setdefault(role, []).append(package_path)
+        duplicates = {role: role_paths for role, role_paths in packages_by_role.items() if len(role_paths) > 1}
+        if duplicates:
+            details = "; ".join(
+                f"{role}: {', '.join(paths.display_path(path) for path in role_paths)}"
+                for role, role_paths in sorted(duplicates.items())
+            )
+            raise RuntimeError(f"Multiple role recordings packages for the same role: {details}")
+
+    def _package_role(self, package_path: Path) -> str | None:
+        # Unreadable packages are reported by their own import rather than failing the batch here.
+        try:
+            with zipfile.ZipFile(package_path) as archive, archive.open("manifest.json") as manifest_file:
+                manifest = json.loads(manifest_file.read().decode("utf-8"))
+        except (KeyError, OSError, ValueError, zipfile.BadZipFile):
+            return None
+        role = manifest.get("role", {}).get("id") if isinstance(manifest, dict) else None
+        return role if isinstance(role, str) and role else None
+
+    def _write_summary(
+        self,
+        package_paths: list[Path],
+        results: list[RoleRecordingsImportResult],
+        failures: list[RoleRecordingsBulkImportFailure],
+    ) -> Path:
+        created_at = datetime.now(timezone.utc)
+        summary_path = (
+            self.paths.build_dir / "linerecorder" / "imports" / f"bulk-{created_at.strftime('%Y%m%dT%H%M%S%fZ')}.json"
+        )
+        summary_path.parent.mkdir(parents=True, exist_ok=True)
+        summary_path.write_text(
+            json.dumps(
+                {
+                    "created_at": created_at.isoformat().replace("+00:00", "Z"),
+                    "play_id": self.paths.play_name,
+                    "packages": [paths.display_path(package_path) for package_path in package_paths],
+                    "imported": [
+                        {
+                            "role_id": result.role,
+                            "imported_count": result.imported_count,
+                            "complete": result.complete,
+                            "missing_segment_ids": result.missing_segment_ids,
+                            "transaction": paths.display_path(result.transaction_manifest_path),
+                            "issues": [issue.to_dict() for issue in result.issues],
+                        }
+                        for result in results
+                    ],
+                    "failed": [
+                        {
+                            "package": paths.display_path(failure.package_path),
+                            "message": failure.message,
+                        }
+                        for failure in failures
+                    ],
+                },
+                indent=2,
+            )
+            + "\n",
+            encoding="utf-8",
+        )
+        logger.info("Wrote LineRecorder bulk import summary %s", paths.display_path(summary_path))
+        return summary_path
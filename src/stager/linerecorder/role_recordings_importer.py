@@ -1,11 +1,13 @@
 from __future__ import annotations
 
+from concurrent.futures import ThreadPoolExecutor
 from dataclasses import dataclass, field
 from datetime import datetime, timezone
 import filecmp
-import io
+import hashlib
 import json
 import logging
+import os
 from pathlib import Path, PurePosixPath
 import re
 import shutil
@@ -13,6 +15,8 @@ import subprocess
 import wave
 import zipfile
 
+import numpy as np
+
 from stager.domain.block import RoleBlock
 from stager.domain.play import Play
 from stager.domain.segment import SimultaneousSegment, SpeechSegment
@@ -22,6 +26,7 @@ from stager.shared.package_format_version import FormatVersionDecision, PackageF
 from stager.shared import paths
 
 logger = logging.getLogger(__name__)
+COPY_CHUNK_SIZE = 1024 * 1024
 PRODUCTION_ID_RE = re.compile(r"^[A-Z0-9]+(?:\.[A-Z0-9]+)*-[0-9]+(?:\.[0-9]+)?[a-z]?(?::[sdm][0-9]+)?$")
 
 
@@ -73,6 +78,10 @@ class RoleRecordingImportJob:
     member: zipfile.ZipInfo
     target_path: Path
     floor_noise: "FloorNoiseImportItem | None" = None
+    incoming_path: Path | None = None
+    sha256: str | None = None
+    processed_path: Path | None = None
+    processed_sha256: str | None = None
 
 
 @dataclass
@@ -85,6 +94,25 @@ class FloorNoiseImportItem:
     artifact_path: Path | None = None
 
 
+class _ExtractingReader:
+    """Read a package member once, writing and hashing bytes as the WAV reader consumes them."""
+
+    def __init__(self, source, target) -> None:
+        self._source = source
+        self._target = target
+        self.digest = hashlib.sha256()
+
+    def read(self, size: int = -1) -> bytes:
+        data = self._source.read(size)
+        self._target.write(data)
+        self.digest.update(data)
+        return data
+
+    def drain(self) -> None:
+        while self.read(COPY_CHUNK_SIZE):
+            pass
+
+
 @dataclass
 class RecordingImportProcessingOptions:
     denoise: bool = False
@@ -148,6 +176,14 @@ class RoleRecordingsImporter:
     paths: paths.PathConfig
     play: Play | None = None
     audio_processor: RecordingImportAudioProcessor = field(default_factory=RecordingImportAudioProcessor)
+    processing_workers: int | None = None
+    _expected_segments: dict[str, dict[str, ExpectedRecordingSegment]] | None = field(
+        default=None,
+        init=False,
+        repr=False,
+    )
+    _current_production_version: str | None = field(default=None, init=False, repr=False)
+    _current_production_loaded: bool = field(default=False, init=False, repr=False)
 
     def import_package(
         self,
@@ -183,38 +219,37 @@ class RoleRecordingsImporter:
                 )
             self._assign_floor_noise(import_jobs, floor_noise_items)
 
-            issues = self._analyze_package_audio(archive, import_jobs, package_path)
-            issues.extend(self._extra_audio_issues(archive, import_jobs))
-            transaction_manifest_path = self._write_import_transaction(
-                archive=archive,
-                package_path=package_path,
-                manifest=manifest,
-                import_jobs=import_jobs,
-                floor_noise_items=floor_noise_items,
-                issues=issues,
-                processing_options=options,
-            )
+            transaction_dir = self._new_transaction_dir()
+            try:
+                issues = []
+                for import_job in import_jobs:
+                    issues.extend(self._ingest_recording(archive, import_job, transaction_dir, package_path))
+                issues.extend(self._extra_audio_issues(archive, import_jobs))
+                self._ingest_floor_noise(archive, floor_noise_items, transaction_dir)
+                self._process_recordings(import_jobs, transaction_dir, options)
+                transaction_manifest_path = self._write_import_transaction(
+                    transaction_dir=transaction_dir,
+                    package_path=package_path,
+                    manifest=manifest,
+                    import_jobs=import_jobs,
+                    floor_noise_items=floor_noise_items,
+                    issues=issues,
+                    processing_options=options,
+                )
+            except Exception:
+                shutil.rmtree(transaction_dir, ignore_errors=True)
+                raise
 
+        try:
             for import_job in import_jobs:
-                target_path = import_job.target_path
-                incoming_path = transaction_manifest_path.parent / "incoming" / import_job.audio_path
-                processed_path = transaction_manifest_path.parent / "processed" / import_job.audio_path
-                copy_source_path = incoming_path
-                if options.denoise or options.trim_silence:
-                    if options.denoise and import_job.floor_noise is None:
-                        logger.info("No floor noise available for %s; importing without denoise", import_job.segment_id)
-                    self.audio_processor.process(
-                        input_path=incoming_path,
-                        output_path=processed_path,
-                        floor_noise_path=import_job.floor_noise.artifact_path if import_job.floor_noise else None,
-                        floor_noise_duration_ms=import_job.floor_noise.duration_ms if import_job.floor_noise else None,
-                        options=options,
-                    )
-                    copy_source_path = processed_path
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(copy_source_path, target_path)
-                written_paths.append(target_path)
-                logger.info("Imported LineRecorder segment %s", paths.display_path(target_path))
+                install_source_path = import_job.processed_path or import_job.incoming_path
+                assert install_source_path is not None
+                self._install_file(install_source_path, import_job.target_path)
+                written_paths.append(import_job.target_path)
+                logger.info("Imported LineRecorder segment %s", paths.display_path(import_job.target_path))
+        except Exception:
+            self._rollback_install(import_jobs[: len(written_paths) + 1], transaction_dir)
+            raise
 
         return RoleRecordingsImportResult(
             role=role,
@@ -240,13 +275,13 @@ class RoleRecordingsImporter:
         for imported in transaction["imported"]:
             target_path = self._transaction_target_path(imported["target_path"])
             incoming_path = self._transaction_artifact_path(imported["incoming_path"], transaction_manifest_path)
-            if target_path.exists() and not filecmp.cmp(target_path, incoming_path, shallow=False):
+            expected_sha256 = imported.get("processed_sha256", imported.get("sha256"))
+            if target_path.exists() and self._changed_since_import(target_path, incoming_path, expected_sha256):
                 raise RuntimeError(f"Refusing to undo changed segment: {paths.display_path(target_path)}")
 
             if imported["existed_before"]:
                 backup_path = self._transaction_artifact_path(imported["backup_path"], transaction_manifest_path)
-                target_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(backup_path, target_path)
+                self._install_file(backup_path, target_path, link=False)
                 restored_count += 1
                 logger.info("Restored LineRecorder import backup %s", paths.display_path(target_path))
             else:
@@ -267,6 +302,8 @@ class RoleRecordingsImporter:
                 return json.loads(manifest_file.read().decode("utf-8"))
         except KeyError as exc:
             raise RuntimeError(f"Missing manifest.json in {paths.display_path(package_path)}") from exc
+        except ValueError as exc:
+            raise RuntimeError(f"Invalid manifest.json in {paths.display_path(package_path)}: {exc}") from exc
 
     def _validate_manifest(self, manifest: dict, package_path: Path) -> None:
         if manifest.get("schema_version") != 1:
@@ -315,8 +352,7 @@ class RoleRecordingsImporter:
 
     def _warn_on_production_version_mismatch(self, manifest: dict, package_path: Path) -> None:
         package_version = manifest.get("production", {}).get("version")
-        current = ProductionVersionStore(self.paths).current()
-        current_version = str(current.production_version) if current is not None else None
+        current_version = self._current_production()
         if package_version is None or current_version is None or package_version == current_version:
             return
         logger.warning(
@@ -326,6 +362,13 @@ class RoleRecordingsImporter:
             current_version,
         )
 
+    def _current_production(self) -> str | None:
+        if not self._current_production_loaded:
+            current = ProductionVersionStore(self.paths).current()
+            self._current_production_version = str(current.production_version) if current is not None else None
+            self._current_production_loaded = True
+        return self._current_production_version
+
     def _validate_recording(self, recording: dict, role: str, package_path: Path) -> None:
         self._validate_production_id(recording.get("id"), "id", package_path)
         self._validate_production_id(recording.get("line_id"), "line_id", package_path)
@@ -401,16 +444,27 @@ class RoleRecordingsImporter:
 
     def _expected_segments_for_role(self, role: str) -> dict[str, ExpectedRecordingSegment]:
         assert self.play is not None
-        expected: dict[str, ExpectedRecordingSegment] = {}
-        for block in self.play.blocks:
-            if not isinstance(block, RoleBlock):
-                continue
-            for segment in block.segments:
-                if isinstance(segment, SpeechSegment) and segment.role == role:
-                    expected[str(segment.segment_id)] = self._expected_segment(block, segment, role)
-                elif isinstance(segment, SimultaneousSegment) and role in segment.roles:
-                    expected[str(segment.segment_id)] = self._expected_segment(block, segment, role)
-        return expected
+        # Every role's expected segments come from one walk of the play, shared by all imported packages.
+        if self._expected_segments is None:
+            expected: dict[str, dict[str, ExpectedRecordingSegment]] = {}
+            for block in self.play.blocks:
+                if not isinstance(block, RoleBlock):
+                    continue
+                for segment in block.segments:
+                    if isinstance(segment, SpeechSegment):
+                        segment_roles = [segment.role]
+                    elif isinstance(segment, SimultaneousSegment):
+                        segment_roles = list(segment.roles)
+                    else:
+                        continue
+                    for segment_role in segment_roles:
+                        expected.setdefault(segment_role, {})[str(segment.segment_id)] = self._expected_segment(
+                            block,
+                            segment,
+                            segment_role,
+                        )
+            self._expected_segments = expected
+        return self._expected_segments.get(role, {})
 
     def _expected_segment(
         self,
@@ -513,18 +567,19 @@ class RoleRecordingsImporter:
             if candidates:
                 import_job.floor_noise = candidates[-1]
 
-    def _analyze_package_audio(
+    def _ingest_recording(
         self,
         archive: zipfile.ZipFile,
-        import_jobs: list[RoleRecordingImportJob],
+        import_job: RoleRecordingImportJob,
+        transaction_dir: Path,
         package_path: Path,
     ) -> list[RoleRecordingImportIssue]:
-        issues = []
-        for import_job in import_jobs:
-            with archive.open(import_job.member) as source:
-                audio_bytes = source.read()
+        incoming_path = transaction_dir / "incoming" / import_job.audio_path
+        incoming_path.parent.mkdir(parents=True, exist_ok=True)
+        with archive.open(import_job.member) as source, incoming_path.open("wb") as target:
+            reader = _ExtractingReader(source, target)
             try:
-                with wave.open(io.BytesIO(audio_bytes), "rb") as wav:
+                with wave.open(reader, "rb") as wav:
                     if wav.getnchannels() < 1:
                         raise RuntimeError(
                             f"Invalid WAV channel count for segment {import_job.segment_id} in {paths.display_path(package_path)}"
@@ -546,17 +601,72 @@ class RoleRecordingsImporter:
                 raise RuntimeError(
                     f"Unreadable WAV for segment {import_job.segment_id} in {paths.display_path(package_path)}"
                 ) from exc
-            issues.extend(
-                self._audio_quality_issues(
-                    import_job=import_job,
-                    channels=channels,
-                    sample_width=sample_width,
-                    sample_rate=sample_rate,
-                    frame_count=frame_count,
-                    frames=frames,
-                )
-            )
-        return issues
+            # Trailing chunks after the sample data still belong in the imported file.
+            reader.drain()
+        import_job.incoming_path = incoming_path
+        import_job.sha256 = reader.digest.hexdigest()
+        return self._audio_quality_issues(
+            import_job=import_job,
+            channels=channels,
+            sample_width=sample_width,
+            sample_rate=sample_rate,
+            frame_count=frame_count,
+            frames=frames,
+        )
+
+    def _ingest_floor_noise(
+        self,
+        archive: zipfile.ZipFile,
+        floor_noise_items: list[FloorNoiseImportItem],
+        transaction_dir: Path,
+    ) -> None:
+        for floor_noise in floor_noise_items:
+            artifact_path = transaction_dir / "floor_noise" / floor_noise.audio_path
+            artifact_path.parent.mkdir(parents=True, exist_ok=True)
+            with archive.open(floor_noise.member) as source, artifact_path.open("wb") as target:
+                shutil.copyfileobj(source, target, COPY_CHUNK_SIZE)
+            floor_noise.artifact_path = artifact_path
+
+    def _process_recordings(
+        self,
+        import_jobs: list[RoleRecordingImportJob],
+        transaction_dir: Path,
+        options: RecordingImportProcessingOptions,
+    ) -> None:
+        if not (options.denoise or options.trim_silence) or not import_jobs:
+            return
+        max_workers = min(self.processing_workers or os.cpu_count() or 1, len(import_jobs))
+        executor = ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="recording-import")
+        try:
+            futures = [
+                executor.submit(self._process_recording, import_job, transaction_dir, options)
+                for import_job in import_jobs
+            ]
+            # Results are collected in manifest order so the first failing take is the one reported.
+            for future in futures:
+                future.result()
+        finally:
+            executor.shutdown(wait=True, cancel_futures=True)
+
+    def _process_recording(
+        self,
+        import_job: RoleRecordingImportJob,
+        transaction_dir: Path,
+        options: RecordingImportProcessingOptions,
+    ) -> None:
+        assert import_job.incoming_path is not None
+        if options.denoise and import_job.floor_noise is None:
+            logger.info("No floor noise available for %s; importing without denoise", import_job.segment_id)
+        processed_path = transaction_dir / "processed" / import_job.audio_path
+        self.audio_processor.process(
+            input_path=import_job.incoming_path,
+            output_path=processed_path,
+            floor_noise_path=import_job.floor_noise.artifact_path if import_job.floor_noise else None,
+            floor_noise_duration_ms=import_job.floor_noise.duration_ms if import_job.floor_noise else None,
+            options=options,
+        )
+        import_job.processed_path = processed_path
+        import_job.processed_sha256 = self._file_sha256(processed_path)
 
     def _audio_quality_issues(
         self,
@@ -583,12 +693,13 @@ class RoleRecordingsImporter:
                 )
             )
 
-        samples = self._normalized_samples(frames, sample_width)
-        if not samples:
+        samples = self._normalized_samples(frames, sample_width, channels)
+        if not samples.size:
             return issues
-        peak = max(abs(sample) for sample in samples)
-        rms = (sum(sample * sample for sample in samples) / len(samples)) ** 0.5
-        clipped_count = sum(1 for sample in samples if abs(sample) >= 0.999)
+        magnitudes = np.abs(samples)
+        peak = float(magnitudes.max())
+        rms = float(np.sqrt(np.dot(samples, samples) / samples.size))
+        clipped_count = int(np.count_nonzero(magnitudes >= 0.999))
         if peak <= 0.0001:
             issues.append(
                 RoleRecordingImportIssue(
@@ -605,7 +716,7 @@ class RoleRecordingsImporter:
                     message=f"{import_job.segment_id} appears too quiet",
                 )
             )
-        if clipped_count / len(samples) >= 0.01:
+        if clipped_count / samples.size >= 0.01:
             issues.append(
                 RoleRecordingImportIssue(
                     code="clipped",
@@ -623,24 +734,21 @@ class RoleRecordingsImporter:
             )
         return issues
 
-    def _normalized_samples(self, frames: bytes, sample_width: int) -> list[float]:
-        samples = []
-        for offset in range(0, len(frames), sample_width):
-            sample_bytes = frames[offset : offset + sample_width]
-            if len(sample_bytes) != sample_width:
-                break
-            if sample_width == 1:
-                sample = (sample_bytes[0] - 128) / 128
-            elif sample_width == 2:
-                sample = int.from_bytes(sample_bytes, "little", signed=True) / 32768
-            elif sample_width == 3:
-                sample = int.from_bytes(sample_bytes + (b"\xff" if sample_bytes[-1] & 0x80 else b"\x00"), "little", signed=True) / 8388608
-            elif sample_width == 4:
-                sample = int.from_bytes(sample_bytes, "little", signed=True) / 2147483648
-            else:
-                return []
-            samples.append(sample)
-        return samples
+    def _normalized_samples(self, frames: bytes, sample_width: int, channels: int = 1) -> np.ndarray:
+        # Whole frames only; samples from every channel are analysed together.
+        usable = len(frames) - len(frames) % (sample_width * max(channels, 1))
+        if sample_width == 1:
+            return (np.frombuffer(frames, dtype=np.uint8, count=usable).astype(np.float64) - 128) / 128
+        if sample_width == 2:
+            return np.frombuffer(frames, dtype="<i2", count=usable // 2) / 32768
+        if sample_width == 3:
+            packed = np.frombuffer(frames, dtype=np.uint8, count=usable).reshape(-1, 3).astype(np.int32)
+            values = packed[:, 0] | (packed[:, 1] << 8) | (packed[:, 2] << 16)
+            values = np.where(values & 0x800000, values - 0x1000000, values)
+            return values / 8388608
+        if sample_width == 4:
+            return np.frombuffer(frames, dtype="<i4", count=usable // 4) / 2147483648
+        return np.zeros(0)
 
     def _extra_audio_issues(
         self,
@@ -660,7 +768,7 @@ class RoleRecordingsImporter:
     def _write_import_transaction(
         self,
         *,
-        archive: zipfile.ZipFile,
+        transaction_dir: Path,
         package_path: Path,
         manifest: dict,
         import_jobs: list[RoleRecordingImportJob],
@@ -668,42 +776,32 @@ class RoleRecordingsImporter:
         issues: list[RoleRecordingImportIssue],
         processing_options: RecordingImportProcessingOptions,
     ) -> Path:
-        transaction_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
-        transaction_dir = self.paths.build_dir / "linerecorder" / "imports" / transaction_id
         imported = []
         floor_noise_manifest = []
 
         for floor_noise in floor_noise_items:
-            artifact_path = transaction_dir / "floor_noise" / floor_noise.audio_path
-            artifact_path.parent.mkdir(parents=True, exist_ok=True)
-            with archive.open(floor_noise.member) as source, artifact_path.open("wb") as target:
-                target.write(source.read())
-            floor_noise.artifact_path = artifact_path
+            assert floor_noise.artifact_path is not None
             floor_noise_manifest.append(
                 {
                     "id": floor_noise.id,
                     "audio_path": floor_noise.audio_path,
-                    "artifact_path": paths.display_path(artifact_path),
+                    "artifact_path": paths.display_path(floor_noise.artifact_path),
                     "recorded_at": floor_noise.recorded_at,
                     "duration_ms": floor_noise.duration_ms,
                 }
             )
 
         for import_job in import_jobs:
+            assert import_job.incoming_path is not None
             original_path = transaction_dir / "original" / import_job.audio_path
-            incoming_path = transaction_dir / "incoming" / import_job.audio_path
+            incoming_path = import_job.incoming_path
             backup_path = transaction_dir / "backups" / import_job.audio_path
             existed_before = import_job.target_path.exists()
 
-            original_path.parent.mkdir(parents=True, exist_ok=True)
-            with archive.open(import_job.member) as source, original_path.open("wb") as target:
-                target.write(source.read())
-            incoming_path.parent.mkdir(parents=True, exist_ok=True)
-            shutil.copy2(original_path, incoming_path)
-
+            self._link_or_copy(incoming_path, original_path)
             if existed_before:
-                backup_path.parent.mkdir(parents=True, exist_ok=True)
-                shutil.copy2(import_job.target_path, backup_path)
+                # The target is replaced rather than rewritten, so the backup can share its inode.
+                self._link_or_copy(import_job.target_path, backup_path)
 
             item = {
                 "segment_id": import_job.segment_id,
@@ -711,6 +809,7 @@ class RoleRecordingsImporter:
                 "incoming_path": paths.display_path(incoming_path),
                 "original_path": paths.display_path(original_path),
                 "existed_before": existed_before,
+                "sha256": import_job.sha256,
             }
             self._put_optional(item, "id", import_job.id)
             self._put_optional(item, "line_id", import_job.line_id)
@@ -720,13 +819,16 @@ class RoleRecordingsImporter:
             self._put_optional(item, "floor_noise_id", import_job.floor_noise.id if import_job.floor_noise else None)
             if existed_before:
                 item["backup_path"] = paths.display_path(backup_path)
+            if import_job.processed_path is not None:
+                item["processed_path"] = paths.display_path(import_job.processed_path)
+                item["processed_sha256"] = import_job.processed_sha256
             imported.append(item)
 
         transaction_manifest_path = transaction_dir / "import.json"
         transaction_manifest_path.write_text(
             json.dumps(
                 {
-                    "id": transaction_id,
+                    "id": transaction_dir.name,
                     "created_at": datetime.now(timezone.utc).isoformat().replace("+00:00", "Z"),
                     "source_package": paths.display_path(package_path),
                     "play_id": manifest["play"]["id"],
@@ -749,6 +851,59 @@ class RoleRecordingsImporter:
         logger.info("Wrote LineRecorder import transaction %s", paths.display_path(transaction_manifest_path))
         return transaction_manifest_path
 
+    def _new_transaction_dir(self) -> Path:
+        imports_dir = self.paths.build_dir / "linerecorder" / "imports"
+        imports_dir.mkdir(parents=True, exist_ok=True)
+        while True:
+            transaction_id = datetime.now(timezone.utc).strftime("%Y%m%dT%H%M%S%fZ")
+            try:
+                (imports_dir / transaction_id).mkdir()
+            except FileExistsError:
+                # Concurrent imports can start within the same microsecond.
+                continue
+            return imports_dir / transaction_id
+
+    def _install_file(self, source_path: Path, target_path: Path, *, link: bool = True) -> None:
+        # Stage beside the target and rename over it so a linked target never rewrites a shared inode.
+        # Tools that later change segments (cleanup promotion, re-splitting) replace them the same way.
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        staging_path = target_path.with_name(f".{target_path.name}.importing")
+        staging_path.unlink(missing_ok=True)
+        if link:
+            self._link_or_copy(source_path, staging_path)
+        else:
+            shutil.copy2(source_path, staging_path)
+        os.replace(staging_path, target_path)
+
+    def _link_or_copy(self, source_path: Path, target_path: Path) -> None:
+        target_path.parent.mkdir(parents=True, exist_ok=True)
+        try:
+            os.link(source_path, target_path)
+        except OSError:
+            shutil.copy2(source_path, target_path)
+
+    def _rollback_install(self, import_jobs: list[RoleRecordingImportJob], transaction_dir: Path) -> None:
+        for import_job in reversed(import_jobs):
+            backup_path = transaction_dir / "backups" / import_job.audio_path
+            if backup_path.exists():
+                self._install_file(backup_path, import_job.target_path, link=False)
+            else:
+                import_job.target_path.unlink(missing_ok=True)
+        shutil.rmtree(transaction_dir, ignore_errors=True)
+        logger.warning("Rolled back incomplete LineRecorder import %s", transaction_dir.name)
+
+    def _changed_since_import(self, target_path: Path, incoming_path: Path, sha256: str | None) -> bool:
+        if sha256 is None:
+            return not filecmp.cmp(target_path, incoming_path, shallow=False)
+        return self._file_sha256(target_path) != sha256
+
+    def _file_sha256(self, path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open("rb") as source:
+            for chunk in iter(lambda: source.read(COPY_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
     def _put_optional(self, item: dict, key: str, value: str | None) -> None:
         if value is not None:
             item[key] = value
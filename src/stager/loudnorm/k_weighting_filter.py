@@ -0,0 +1,80 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+import math
+
+import numpy as np
+
+# BS.1770 pre-filter (high shelf) and RLB (high pass) parameters, as used by libebur128.
+SHELF_HZ = 1681.974450955533
+SHELF_GAIN_DB = 3.999843853973347
+SHELF_Q = 0.7071752369554196
+HIGH_PASS_HZ = 38.13547087602444
+HIGH_PASS_Q = 0.5003270373238773
+TAIL_TOLERANCE = 1e-9
+FFT_SIZE = 32768
+
+
+@dataclass
+class KWeightingFilter:
+    """Streaming K-weighting: both BS.1770 biquads folded into one impulse response applied by FFT overlap-save."""
+    sample_rate_hz: int
+    channels: int = 1
+    _impulse: np.ndarray = field(init=False, repr=False)
+    _spectrum: np.ndarray = field(init=False, repr=False)
+    _fft_size: int = field(init=False, repr=False)
+    _history: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        self._impulse = self._impulse_response()
+        taps = len(self._impulse)
+        self._fft_size = max(FFT_SIZE, 1 << (4 * taps - 1).bit_length())
+        self._spectrum = np.fft.rfft(self._impulse, self._fft_size)
+        self._history = np.zeros((taps - 1, self.channels))
+
+    @property
+    def impulse(self) -> np.ndarray:
+        return self._impulse
+
+    def coefficients(self) -> list[tuple[tuple[float, float, float], tuple[float, float, float]]]:
+        k = math.tan(math.pi * SHELF_HZ / self.sample_rate_hz)
+        vh = 10 ** (SHELF_GAIN_DB / 20)
+        vb = vh ** 0.4996667741545416
+        a0 = 1 + k / SHELF_Q + k * k
+        shelf = (
+            ((vh + vb * k / SHELF_Q + k * k) / a0, 2 * (k * k - vh) / a0, (vh - vb * k / SHELF_Q + k * k) / a0),
+            (1.0, 2 * (k * k - 1) / a0, (1 - k / SHELF_Q + k * k) / a0),
+        )
+        k = math.tan(math.pi * HIGH_PASS_HZ / self.sample_rate_hz)
+        a0 = 1 + k / HIGH_PASS_Q + k * k
+        high_pass = ((1.0, -2.0, 1.0), (1.0, 2 * (k * k - 1) / a0, (1 - k / HIGH_PASS_Q + k * k) / a0))
+        return [shelf, high_pass]
+
+    def process(self, samples: np.ndarray) -> np.ndarray:
+        """Filter ``(frames, channels)`` samples, continuing from the previous call."""
+        frames = samples.shape[0]
+        taps = len(self._impulse)
+        step = self._fft_size - taps + 1
+        blocks = -(-frames // step)
+        data = np.zeros((self.channels, taps - 1 + blocks * step))
+        data[:, : taps - 1] = self._history.T
+        data[:, taps - 1 : taps - 1 + frames] = samples.T
+        self._history = data[:, frames : frames + taps - 1].T.copy()
+        windows = np.lib.stride_tricks.sliding_window_view(data, self._fft_size, axis=-1)[:, ::step]
+        filtered = np.fft.irfft(np.fft.rfft(windows, self._fft_size) * self._spectrum, self._fft_size)
+        return filtered[..., taps - 1 :].reshape(self.channels, blocks * step)[:, :frames].T
+
+    def _impulse_response(self) -> np.ndarray:
+        # The recurrence runs once per filter; the response decays within a fraction of a second.
+        length = self.sample_rate_hz
+        response = np.zeros(length)
+        response[0] = 1.0
+        for (b0, b1, b2), (_, a1, a2) in self.coefficients():
+            x1 = x2 = y1 = y2 = 0.0
+            values = response.tolist()
+            for n, x0 in enumerate(values):
+                y0 = b0 * x0 + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+                values[n] = y0
+                x2, x1, y2, y1 = x1, x0, y1, y0
+            response = np.array(values)
+        significant = np.flatnonzero(np.abs(response) > TAIL_TOLERANCE * np.abs(response).max())
+        return response[: significant[-1] + 1]
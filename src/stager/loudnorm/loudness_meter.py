@@ -0,0 +1,147 @@
+from __future__ import annotations
+from dataclasses import dataclass
+import hashlib
+import json
+import logging
+import os
+import threading
+from pathlib import Path
+
+import numpy as np
+import soundfile
+
+from stager.loudnorm.k_weighting_filter import KWeightingFilter
+from stager.loudnorm.true_peak_meter import TruePeakMeter
+from stager.shared import paths
+logger = logging.getLogger(__name__)
+
+ABSOLUTE_GATE_LUFS = -70.0
+RELATIVE_GATE_LU = -10.0
+RANGE_GATE_LU = -20.0
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class LoudnessMeter:
+    """
+    EBU R128 measurement in-process: integrated loudness, threshold, LRA and true peak,
+    keyed by the same metric names the loudnorm summary parser produces.
+    """
+    cache_dir: Path | None = None
+    chunk_seconds: int = 30
+    cache_version: str = "1"
+
+    def measure(self, input_file: str) -> dict[str, float] | None:
+        """Return measured values, or None when the file cannot be decoded without ffmpeg."""
+        path = Path(input_file)
+        digest = self._file_digest(path) if self.cache_dir is not None else None
+        if digest is not None:
+            cached = self._load(digest)
+            if cached is not None:
+                logger.info("Using cached loudness measurements for %s", paths.display_path(path))
+                return cached
+        try:
+            sound = soundfile.SoundFile(str(path))
+        except RuntimeError as exc:
+            logger.info("Cannot decode %s in-process: %s", paths.display_path(path), exc)
+            return None
+        with sound:
+            values = self._measure(sound)
+        if digest is not None:
+            self._save(digest, values)
+        return values
+
+    def _measure(self, sound: soundfile.SoundFile) -> dict[str, float]:
+        rate = sound.samplerate
+        weights = self._channel_weights(sound.channels)
+        weighting = KWeightingFilter(sample_rate_hz=rate, channels=sound.channels)
+        true_peak = TruePeakMeter(channels=sound.channels)
+        hop = round(rate * 0.1)
+        energies: list[np.ndarray] = []
+        pending = np.zeros(0)
+        for chunk in sound.blocks(blocksize=rate * self.chunk_seconds, dtype="float64", always_2d=True):
+            true_peak.process(chunk)
+            power = np.concatenate([pending, (weighting.process(chunk) ** 2) @ weights])
+            complete = len(power) // hop * hop
+            energies.append(power[:complete].reshape(-1, hop).mean(axis=1))
+            pending = power[complete:]
+        # 100 ms mean squares; gating blocks are 400 ms every 100 ms, LRA blocks are 3 s every second.
+        slices = np.concatenate(energies) if energies else np.zeros(0)
+        momentary = self._windows(slices, 4, 1)
+        short_term = self._windows(slices, 30, 10)
+        integrated, threshold = self._integrated(momentary)
+        return {
+            "lufs": round(integrated, 1),
+            "true_peak": round(true_peak.decibels(), 1),
+            "loudness_range": round(self._loudness_range(short_term), 1),
+            "loudness_threshold": round(threshold, 1),
+        }
+
+    @staticmethod
+    def _channel_weights(channels: int) -> np.ndarray:
+        if channels == 5:
+            return np.array([1.0, 1.0, 1.0, 1.41, 1.41])
+        if channels == 6:
+            # L R C LFE Ls Rs; the LFE channel does not count.
+            return np.array([1.0, 1.0, 1.0, 0.0, 1.41, 1.41])
+        return np.ones(channels)
+
+    @staticmethod
+    def _windows(slices: np.ndarray, width: int, hop: int) -> np.ndarray:
+        if len(slices) < width:
+            return np.zeros(0)
+        return np.convolve(slices, np.full(width, 1.0 / width), mode="valid")[::hop]
+
+    @staticmethod
+    def _loudness(power: np.ndarray | float) -> np.ndarray | float:
+        with np.errstate(divide="ignore"):
+            return -0.691 + 10 * np.log10(power)
+
+    def _integrated(self, blocks: np.ndarray) -> tuple[float, float]:
+        loudness = self._loudness(blocks)
+        audible = blocks[loudness > ABSOLUTE_GATE_LUFS]
+        if audible.size == 0:
+            return float("-inf"), float("-inf")
+        threshold = float(self._loudness(audible.mean())) + RELATIVE_GATE_LU
+        gated = blocks[(loudness > ABSOLUTE_GATE_LUFS) & (loudness > threshold)]
+        return float(self._loudness(gated.mean())), threshold
+
+    def _loudness_range(self, blocks: np.ndarray) -> float:
+        loudness = self._loudness(blocks)
+        audible = blocks[loudness > ABSOLUTE_GATE_LUFS]
+        if audible.size == 0:
+            return 0.0
+        threshold = float(self._loudness(audible.mean())) + RANGE_GATE_LU
+        gated = np.sort(loudness[(loudness > ABSOLUTE_GATE_LUFS) & (loudness > threshold)])
+        last = len(gated) - 1
+        return float(gated[round(last * 0.95)] - gated[round(last * 0.10)])
+
+    def _file_digest(self, path: Path) -> str:
+        digest = hashlib.sha256()
+        with path.open("rb") as source:
+            for chunk in iter(lambda: source.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _cache_path(self, digest: str) -> Path:
+        return self.cache_dir / f"{digest}.json"
+
+    def _load(self, digest: str) -> dict[str, float] | None:
+        cache_path = self._cache_path(digest)
+        if not cache_path.exists():
+            return None
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            logger.warning("Ignoring unreadable loudness cache %s", paths.display_path(cache_path))
+            return None
+        if payload.get("cache_version") != self.cache_version:
+            return None
+        return {name: float(value) for name, value in payload["values"].items()}
+
+    def _save(self, digest: str, values: dict[str, float]) -> None:
+        cache_path = self._cache_path(digest)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        staging.write_text(json.dumps({"cache_version": self.cache_version, "values": values}), encoding="utf-8")
+        os.replace(staging, cache_path)
@@ -21,14 +21,16 @@ class MeasurementsParser:
             logger.info(output)
             raise ValueError("Could not parse measurements from output.")  # Or handle the error as needed
 
+        return self.measurements_from_values(match.groupdict())
+
+    def measurements_from_values(self, values: dict[str, str | float]) -> Measurements:
         measurements: Measurements = Measurements()
-        for name, value in match.groupdict().items():
-            metric = self.metrics.for_name(name)
+        for name, value in values.items():
             normalizable = True
-            if value=="-inf":
+            if value in ("-inf", float("-inf")):
                 measurement = -100 # should work for LUFS, dBTP, and LU unites
                 normalizable = False
-            elif value=="+inf":
+            elif value in ("+inf", float("inf")):
                 measurement = +100
                 normalizable = False
             else:
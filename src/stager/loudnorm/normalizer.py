@@ -5,6 +5,7 @@ import logging
 import shutil
 from typing import Protocol
 
+from stager.loudnorm.loudness_meter import LoudnessMeter
 from stager.loudnorm.measurements_parser import MeasurementsParser
 from stager.loudnorm.measurements import Measurements, Phase
 from stager.loudnorm.metric import Metrics
@@ -26,12 +27,17 @@ class Normalizer:
     metrics: Metrics = field(default_factory=Metrics)
     command_runner: CommandRunner = subprocess.run
     output_sample_rate_hz: int = 44100
+    loudness_meter: LoudnessMeter | None = None
     measures_parser: MeasurementsParser = field(init=False)
 
     def __post_init__(self):
         self.measures_parser = MeasurementsParser(metrics = self.metrics)
 
     def measure(self, input_file: str) -> Measurements:
+        if self.loudness_meter is not None:
+            values = self.loudness_meter.measure(input_file)
+            if values is not None:
+                return self.measures_parser.measurements_from_values(values)
         options = [
             f"{FILTER}=print_format=summary",
         ]
@@ -0,0 +1,59 @@
+from __future__ import annotations
+from dataclasses import dataclass, field
+
+import numpy as np
+
+OVERSAMPLING = 4
+TAPS_PER_PHASE = 12
+SCREEN_FRAMES = 64
+
+
+@dataclass
+class TruePeakMeter:
+    """4x oversampled peak; only windows loud enough to raise the running peak are interpolated."""
+    channels: int = 1
+    peak: float = field(init=False, default=0.0)
+    _phases: np.ndarray = field(init=False, repr=False)
+    _gain_bound: float = field(init=False, repr=False)
+    _history: np.ndarray = field(init=False, repr=False)
+
+    def __post_init__(self):
+        taps = OVERSAMPLING * TAPS_PER_PHASE
+        offsets = np.arange(taps) - (taps - 1) / 2
+        kernel = np.sinc(offsets / OVERSAMPLING) * np.kaiser(taps, 5.0)
+        # phases[p, k] weights x[m - k] for output sample 4m + p.
+        phases = kernel.reshape(TAPS_PER_PHASE, OVERSAMPLING).T
+        self._phases = phases / phases.sum(axis=1, keepdims=True)
+        # No interpolated value can exceed this multiple of the loudest sample in its window.
+        self._gain_bound = float(np.abs(self._phases).sum(axis=1).max())
+        self._history = np.zeros((TAPS_PER_PHASE - 1, self.channels))
+
+    def process(self, samples: np.ndarray) -> None:
+        if samples.shape[0] == 0:
+            return
+        data = np.concatenate([self._history, samples])
+        self._history = data[-(TAPS_PER_PHASE - 1) :].copy()
+        magnitudes = np.abs(data[:, 0])
+        for channel in range(1, self.channels):
+            np.maximum(magnitudes, np.abs(data[:, channel]), out=magnitudes)
+        self.peak = max(self.peak, float(magnitudes[TAPS_PER_PHASE - 1 :].max()))
+        if self.peak == 0.0:
+            return
+        # Outputs in screen block b read frames from blocks b and b + 1; skip blocks that cannot beat the peak.
+        blocks = -(-len(data) // SCREEN_FRAMES)
+        screened = np.zeros(blocks * SCREEN_FRAMES)
+        screened[: len(data)] = magnitudes
+        block_peaks = screened.reshape(blocks, SCREEN_FRAMES).max(axis=1)
+        reach = np.maximum(block_peaks, np.append(block_peaks[1:], 0.0))
+        loud_blocks = np.flatnonzero(reach * self._gain_bound > self.peak)
+        candidates = (loud_blocks[:, None] * SCREEN_FRAMES + np.arange(SCREEN_FRAMES)).ravel()
+        candidates = candidates[candidates < len(data) - (TAPS_PER_PHASE - 1)]
+        if candidates.size == 0:
+            return
+        # Output m reads data[m : m + TAPS_PER_PHASE], newest sample first.
+        windows = data[candidates[:, None] + np.arange(TAPS_PER_PHASE)[::-1]]
+        interpolated = np.swapaxes(windows, 1, 2) @ self._phases.T
+        self.peak = max(self.peak, float(np.abs(interpolated).max()))
+
+    def decibels(self) -> float:
+        return float(20 * np.log10(self.peak)) if self.peak > 0 else float("-inf")
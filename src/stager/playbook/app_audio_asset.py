@@ -13,13 +13,16 @@ class AppAudioAsset:
     duration_ms: int
     required: bool = True
     cue_start_offsets: list[AppCueStartOffset] = field(default_factory=list)
+    offset_ms: int | None = None
 
     def to_dict(self) -> dict[str, Any]:
         data: dict[str, Any] = {
             "path": self.path.as_posix(),
-            "duration_ms": self.duration_ms,
-            "required": self.required,
         }
+        if self.offset_ms is not None:
+            data["offset_ms"] = self.offset_ms
+        data["duration_ms"] = self.duration_ms
+        data["required"] = self.required
         if self.cue_start_offsets:
             data["cue_start_offsets"] = [
                 offset.to_dict()
@@ -0,0 +1,89 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import itertools
+import logging
+from pathlib import Path
+
+from stager.shared import paths
+
+
+CALLOUT_EXTENSIONS = (".wav", ".mp3")
+
+
+@dataclass
+class CalloutSourceIndex:
+    """One-time index of built callout audio used to resolve callout names without directory walks."""
+
+    base_dir: Path
+    _files: dict[str, Path] = field(default_factory=dict, init=False, repr=False)
+    _by_normalized_stem: dict[str, Path] = field(default_factory=dict, init=False, repr=False)
+    _resolved: dict[str, Path | None] = field(default_factory=dict, init=False, repr=False)
+    _logger: logging.Logger = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+        if not self.base_dir.exists():
+            return
+        for candidate_file in sorted(self.base_dir.rglob("*")):
+            if not candidate_file.is_file():
+                continue
+            self._files[candidate_file.relative_to(self.base_dir).as_posix()] = candidate_file
+            if candidate_file.suffix.lower() not in CALLOUT_EXTENSIONS:
+                continue
+            # Walk in sorted order so the first normalized match wins fallback lookups.
+            self._by_normalized_stem.setdefault(self.normalize_name(candidate_file.stem), candidate_file)
+
+    def resolve(self, callout: str) -> Path | None:
+        if callout not in self._resolved:
+            self._resolved[callout] = self._resolve(callout)
+        return self._resolved[callout]
+
+    def _resolve(self, callout: str) -> Path | None:
+        candidate_names = self.candidate_names(callout)
+        for candidate_name, ext in itertools.product(candidate_names, CALLOUT_EXTENSIONS):
+            direct = self._files.get(f"{candidate_name}{ext}")
+            if direct is not None:
+                return direct
+            nested = self._files.get(f"{candidate_name}/{candidate_name}{ext}")
+            if nested is not None:
+                return nested
+
+        fallback = self._fallback_for({self.normalize_name(name) for name in candidate_names})
+        if fallback is not None:
+            self._logger.warning(
+                "Resolved callout '%s' using fallback source %s",
+                callout,
+                paths.display_path(fallback),
+            )
+        return fallback
+
+    def _fallback_for(self, target_keys: set[str]) -> Path | None:
+        matches = [self._by_normalized_stem[key] for key in target_keys if key in self._by_normalized_stem]
+        if not matches:
+            return None
+        return min(matches, key=lambda path: path.relative_to(self.base_dir).parts)
+
+    @staticmethod
+    def candidate_names(callout: str) -> list[str]:
+        candidates: list[str] = []
+
+        def append(name: str) -> None:
+            if name and name not in candidates:
+                candidates.append(name)
+
+        append(callout)
+        append(callout.replace("-", " "))
+        append(callout.replace(" ", "-"))
+
+        if "-" in callout:
+            base = callout.split("-", 1)[0]
+            append(base)
+            append(base.replace(" ", "-"))
+            append(base.replace("-", " "))
+
+        return candidates
+
+    @staticmethod
+    def normalize_name(value: str) -> str:
+        return value.replace("-", " ").strip().lower()
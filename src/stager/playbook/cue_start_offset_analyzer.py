@@ -2,14 +2,40 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 from pathlib import Path
-from statistics import median
+from typing import Any
 
+import numpy as np
 from pydub import AudioSegment
 
 from stager.playbook.app_cue_start_offset import AppCueStartOffset
+from stager.playbook.cue_start_offset_cache import CueStartOffsetCache
 from stager.playbook.cue_window_presets import CueWindowPresets
 
 
+_SAMPLE_DTYPES = {1: np.int8, 2: np.dtype("<i2"), 4: np.dtype("<i4")}
+
+
+@dataclass(frozen=True)
+class _EnergyEnvelope:
+    """Cumulative per-millisecond energy of the mono cue tail starting at ``first_ms``."""
+
+    cumulative_energy: np.ndarray
+    frame_rate: int
+    first_ms: int
+
+    def frame_at(self, position_ms: np.ndarray | int) -> np.ndarray:
+        return np.asarray(position_ms, dtype=np.int64) * self.frame_rate // 1000
+
+    def rms(self, start_ms: np.ndarray, end_ms: np.ndarray) -> np.ndarray:
+        frame_counts = self.frame_at(end_ms) - self.frame_at(start_ms)
+        last_index = len(self.cumulative_energy) - 1
+        start_index = np.clip(start_ms - self.first_ms, 0, last_index)
+        end_index = np.clip(end_ms - self.first_ms, 0, last_index)
+        energy = self.cumulative_energy[end_index] - self.cumulative_energy[start_index]
+        mean_square = np.where(frame_counts > 0, energy / np.maximum(frame_counts, 1), 0.0)
+        return np.floor(np.sqrt(np.maximum(mean_square, 0.0)))
+
+
 @dataclass
 class CueStartOffsetAnalyzer:
     windows_ms: list[int] = field(
@@ -19,19 +45,62 @@ class CueStartOffsetAnalyzer:
     rms_window_ms: int = 40
     hop_ms: int = 20
     quiet_ratio: float = 0.35
+    cache: CueStartOffsetCache | None = None
 
     def analyze(self, audio_path: Path, duration_ms: int) -> list[AppCueStartOffset]:
         if audio_path.suffix.lower() != ".wav":
             return []
-        audio = AudioSegment.from_file(audio_path).set_channels(1)
-        return [
-            self._offset_for_window(audio, duration_ms, window_ms)
+        settings = self._cache_settings(duration_ms)
+        if self.cache is not None:
+            cached = self.cache.load(audio_path, settings)
+            if cached is not None:
+                return cached
+        envelope = self._energy_envelope(audio_path, duration_ms)
+        offsets = [
+            self._offset_for_window(envelope, duration_ms, window_ms)
             for window_ms in self.windows_ms
         ]
+        if self.cache is not None:
+            self.cache.store(audio_path, settings, offsets)
+        return offsets
+
+    def _cache_settings(self, duration_ms: int) -> dict[str, Any]:
+        return {
+            "duration_ms": duration_ms,
+            "windows_ms": list(self.windows_ms),
+            "search_radius_ms": self.search_radius_ms,
+            "rms_window_ms": self.rms_window_ms,
+            "hop_ms": self.hop_ms,
+            "quiet_ratio": self.quiet_ratio,
+        }
+
+    def _energy_envelope(self, audio_path: Path, duration_ms: int) -> _EnergyEnvelope:
+        audio = AudioSegment.from_file(audio_path)
+        # Only the tail that any requested window can search needs an envelope.
+        longest_window_ms = max(self.windows_ms, default=0)
+        first_ms = max(0, duration_ms - longest_window_ms - self.search_radius_ms)
+        envelope = _EnergyEnvelope(np.zeros(1), audio.frame_rate, first_ms)
+        first_frame = int(envelope.frame_at(first_ms))
+        samples = np.frombuffer(audio.raw_data, dtype=_SAMPLE_DTYPES[audio.sample_width])
+        samples = samples.reshape(-1, audio.channels)[first_frame:]
+        mono = samples[:, 0].astype(np.float64)
+        for channel in range(1, audio.channels):
+            mono += samples[:, channel]
+        if audio.channels > 1:
+            mono /= audio.channels
+        np.square(mono, out=mono)
+        if not len(mono):
+            return envelope
+        # Bucket the energy at millisecond frame boundaries, matching how pydub slices by milliseconds.
+        boundaries = envelope.frame_at(np.arange(first_ms, duration_ms + 1)) - first_frame
+        boundaries = boundaries[boundaries < len(mono)]
+        cumulative_energy = np.zeros(len(boundaries) + 1)
+        np.cumsum(np.add.reduceat(mono, boundaries), out=cumulative_energy[1:])
+        return _EnergyEnvelope(cumulative_energy, audio.frame_rate, first_ms)
 
     def _offset_for_window(
         self,
-        audio: AudioSegment,
+        envelope: _EnergyEnvelope,
         duration_ms: int,
         requested_window_ms: int,
     ) -> AppCueStartOffset:
@@ -46,7 +115,7 @@ class CueStartOffsetAnalyzer:
         search_start_ms = max(0, target_start_ms - self.search_radius_ms)
         search_end_ms = min(duration_ms, target_start_ms + self.search_radius_ms)
         boundary_ms = self._best_boundary(
-            audio,
+            envelope,
             search_start_ms,
             search_end_ms,
             target_start_ms,
@@ -65,48 +134,43 @@ class CueStartOffsetAnalyzer:
 
     def _best_boundary(
         self,
-        audio: AudioSegment,
+        envelope: _EnergyEnvelope,
         search_start_ms: int,
         search_end_ms: int,
         target_start_ms: int,
     ) -> int | None:
-        samples = self._smoothed_rms_samples(audio, search_start_ms, search_end_ms)
-        if not samples:
+        positions, smoothed = self._smoothed_rms_samples(envelope, search_start_ms, search_end_ms)
+        if not len(positions):
             return None
 
-        threshold = max(1.0, median(rms for _, rms in samples) * self.quiet_ratio)
-        candidates = [(position, rms) for position, rms in samples if rms <= threshold]
-        if not candidates:
+        threshold = max(1.0, float(np.median(smoothed)) * self.quiet_ratio)
+        quiet = smoothed <= threshold
+        if not quiet.any():
             return None
 
-        return min(
-            candidates,
-            key=lambda sample: (
-                sample[1],
-                abs(sample[0] - target_start_ms),
-                0 if sample[0] <= target_start_ms else 1,
-            ),
-        )[0]
+        candidates = positions[quiet]
+        distances = np.abs(candidates - target_start_ms)
+        after_target = candidates > target_start_ms
+        best = np.lexsort((after_target, distances, smoothed[quiet]))[0]
+        return int(candidates[best])
 
     def _smoothed_rms_samples(
         self,
-        audio: AudioSegment,
+        envelope: _EnergyEnvelope,
         search_start_ms: int,
         search_end_ms: int,
-    ) -> list[tuple[int, float]]:
-        raw_samples: list[tuple[int, int]] = []
-        for position_ms in range(search_start_ms, search_end_ms, self.hop_ms):
-            end_ms = min(position_ms + self.rms_window_ms, search_end_ms)
-            if end_ms <= position_ms:
-                continue
-            raw_samples.append((position_ms, audio[position_ms:end_ms].rms))
-
-        smoothed: list[tuple[int, float]] = []
-        for index, (position_ms, rms) in enumerate(raw_samples):
-            nearby = [rms]
-            if index > 0:
-                nearby.append(raw_samples[index - 1][1])
-            if index + 1 < len(raw_samples):
-                nearby.append(raw_samples[index + 1][1])
-            smoothed.append((position_ms, sum(nearby) / len(nearby)))
-        return smoothed
+    ) -> tuple[np.ndarray, np.ndarray]:
+        positions = np.arange(search_start_ms, search_end_ms, self.hop_ms, dtype=np.int64)
+        if not len(positions):
+            return positions, np.zeros(0)
+        ends = np.minimum(positions + self.rms_window_ms, search_end_ms)
+        raw = envelope.rms(positions, ends)
+
+        # Average each hop with its immediate neighbours.
+        totals = raw.copy()
+        counts = np.ones(len(raw))
+        totals[1:] += raw[:-1]
+        counts[1:] += 1
+        totals[:-1] += raw[1:]
+        counts[:-1] += 1
+        return positions, totals / counts
@@ -0,0 +1,93 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+from pathlib import Path
+from typing import Any
+
+from stager.playbook.app_cue_start_offset import AppCueStartOffset
+from stager.shared import paths
+
+
+@dataclass
+class CueStartOffsetCache:
+    """Persist cue-start offsets keyed by cue audio content hash and analyzer settings."""
+
+    paths_config: paths.PathConfig
+    cache_version: str = "1"
+    _entries: dict[str, list[dict[str, Any]]] | None = field(default=None, init=False, repr=False)
+    _file_hashes: dict[str, dict[str, Any]] = field(default_factory=dict, init=False, repr=False)
+    _dirty: bool = field(default=False, init=False, repr=False)
+    _logger: logging.Logger = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def cache_path(self) -> Path:
+        return self.paths_config.build_dir / "playbook_cache" / "cue_start_offsets.json"
+
+    def load(self, audio_path: Path, settings: dict[str, Any]) -> list[AppCueStartOffset] | None:
+        entries = self._load_entries()
+        cached = entries.get(self.cache_key(audio_path, settings))
+        if cached is None:
+            return None
+        return [AppCueStartOffset(**offset) for offset in cached]
+
+    def store(self, audio_path: Path, settings: dict[str, Any], offsets: list[AppCueStartOffset]) -> None:
+        entries = self._load_entries()
+        entries[self.cache_key(audio_path, settings)] = [offset.to_dict() for offset in offsets]
+        self._dirty = True
+
+    def save(self) -> None:
+        if not self._dirty or self._entries is None:
+            return
+        payload = {
+            "cache_version": self.cache_version,
+            "files": self._file_hashes,
+            "entries": self._entries,
+        }
+        self.cache_path.parent.mkdir(parents=True, exist_ok=True)
+        self.cache_path.write_text(json.dumps(payload, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+        self._dirty = False
+        self._logger.debug("Saved cue start offset cache %s", paths.display_path(self.cache_path))
+
+    def cache_key(self, audio_path: Path, settings: dict[str, Any]) -> str:
+        payload = {"content_hash": self.content_hash(audio_path), "settings": settings}
+        encoded = json.dumps(payload, sort_keys=True, separators=(",", ":")).encode("utf-8")
+        return hashlib.sha256(encoded).hexdigest()
+
+    def content_hash(self, audio_path: Path) -> str:
+        self._load_entries()
+        stat = audio_path.stat()
+        key = str(audio_path.resolve())
+        known = self._file_hashes.get(key)
+        if known is not None and known.get("mtime_ns") == stat.st_mtime_ns and known.get("size") == stat.st_size:
+            return known["content_hash"]
+        digest = hashlib.sha256()
+        with audio_path.open("rb") as source:
+            for chunk in iter(lambda: source.read(1024 * 1024), b""):
+                digest.update(chunk)
+        content_hash = digest.hexdigest()
+        self._file_hashes[key] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "content_hash": content_hash}
+        self._dirty = True
+        return content_hash
+
+    def _load_entries(self) -> dict[str, list[dict[str, Any]]]:
+        if self._entries is not None:
+            return self._entries
+        self._entries = {}
+        if not self.cache_path.exists():
+            return self._entries
+        try:
+            payload = json.loads(self.cache_path.read_text(encoding="utf-8"))
+        except (json.JSONDecodeError, OSError):
+            self._logger.warning("Ignoring unreadable cue start offset cache %s", paths.display_path(self.cache_path))
+            return self._entries
+        if payload.get("cache_version") != self.cache_version:
+            return self._entries
+        self._entries = payload.get("entries", {})
+        self._file_hashes = payload.get("files", {})
+        return self._entries
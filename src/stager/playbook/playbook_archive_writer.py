@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path, PurePosixPath
+import shutil
+import zipfile
+
+from stager.shared import paths
+
+
+STORED_SUFFIXES = frozenset({".wav", ".mp3"})
+
+
+@dataclass
+class PlaybookArchiveWriter:
+    """Write Playbook entries into the package zip, storing audio without recompression."""
+
+    zip_path: Path
+    mirror_dir: Path | None = None
+    _archive: zipfile.ZipFile | None = field(default=None, init=False, repr=False)
+    _partial_path: Path | None = field(default=None, init=False, repr=False)
+    _entries: set[str] = field(default_factory=set, init=False, repr=False)
+
+    def __enter__(self) -> PlaybookArchiveWriter:
+        self.open()
+        return self
+
+    def __exit__(self, exc_type, exc, traceback) -> None:
+        self.close(commit=exc_type is None)
+
+    def open(self) -> None:
+        self.zip_path.parent.mkdir(parents=True, exist_ok=True)
+        self._partial_path = self.zip_path.with_name(f"{self.zip_path.name}.partial")
+        self._archive = zipfile.ZipFile(self._partial_path, "w")
+        self._entries.clear()
+
+    def close(self, *, commit: bool = True) -> None:
+        if self._archive is None or self._partial_path is None:
+            return
+        self._archive.close()
+        self._archive = None
+        if commit:
+            self._partial_path.replace(self.zip_path)
+        else:
+            self._partial_path.unlink(missing_ok=True)
+        self._partial_path = None
+
+    def has_entry(self, arcname: PurePosixPath | str) -> bool:
+        return PurePosixPath(arcname).as_posix() in self._entries
+
+    def write_file(self, source_path: Path, arcname: PurePosixPath | str) -> None:
+        entry = PurePosixPath(arcname).as_posix()
+        if not self._claim(entry):
+            return
+        self._require_archive().write(source_path, entry, compress_type=self.compress_type_for(entry))
+        mirror_path = self._mirror_path(entry)
+        if mirror_path is not None:
+            shutil.copy2(source_path, mirror_path)
+
+    def write_bytes(self, arcname: PurePosixPath | str, data: bytes) -> None:
+        entry = PurePosixPath(arcname).as_posix()
+        if not self._claim(entry):
+            return
+        self._require_archive().writestr(entry, data, compress_type=self.compress_type_for(entry))
+        mirror_path = self._mirror_path(entry)
+        if mirror_path is not None:
+            mirror_path.write_bytes(data)
+
+    def write_text(self, arcname: PurePosixPath | str, text: str) -> None:
+        self.write_bytes(arcname, text.encode("utf-8"))
+
+    def write_tree(self, root_dir: Path) -> None:
+        for path in sorted(root_dir.rglob("*")):
+            if path.is_file():
+                self._require_archive().write(
+                    path,
+                    path.relative_to(root_dir).as_posix(),
+                    compress_type=self.compress_type_for(path.name),
+                )
+
+    @staticmethod
+    def compress_type_for(arcname: str) -> int:
+        if PurePosixPath(arcname).suffix.lower() in STORED_SUFFIXES:
+            return zipfile.ZIP_STORED
+        return zipfile.ZIP_DEFLATED
+
+    def _claim(self, entry: str) -> bool:
+        # Assets shared between categories (a cue that is also context audio) are packaged once.
+        if entry in self._entries:
+            return False
+        self._entries.add(entry)
+        return True
+
+    def _mirror_path(self, entry: str) -> Path | None:
+        if self.mirror_dir is None:
+            return None
+        mirror_path = self.mirror_dir / entry
+        mirror_path.parent.mkdir(parents=True, exist_ok=True)
+        return mirror_path
+
+    def _require_archive(self) -> zipfile.ZipFile:
+        if self._archive is None:
+            raise RuntimeError(f"Playbook archive is not open: {paths.display_path(self.zip_path)}")
+        return self._archive
@@ -1,17 +1,19 @@
 from __future__ import annotations
 
 from dataclasses import dataclass
+from io import BytesIO
 from pathlib import Path, PurePosixPath
 import shutil
 
 from pydub import AudioSegment
 
+from stager.playbook.playbook_archive_writer import PlaybookArchiveWriter
 from stager.shared import paths
 
 
 @dataclass
 class PackagedAudio:
-    path: Path
+    path: Path | None
     manifest_path: PurePosixPath
 
 
@@ -25,7 +27,14 @@ class PlaybookAudioPackager:
         if self.audio_format not in ("wav", "mp3"):
             raise ValueError("audio_format must be one of: wav, mp3")
 
-    def package(self, source_path: Path, destination_dir: Path) -> PackagedAudio:
+    def package(
+        self,
+        source_path: Path,
+        destination_dir: Path,
+        archive: PlaybookArchiveWriter | None = None,
+    ) -> PackagedAudio:
+        if archive is not None:
+            return self._package_into_archive(source_path, destination_dir, archive)
         destination = destination_dir / source_path.with_suffix(f".{self.audio_format}").name
         destination.parent.mkdir(parents=True, exist_ok=True)
         if self.audio_format == "wav":
@@ -37,7 +46,35 @@ class PlaybookAudioPackager:
             manifest_path=PurePosixPath(destination.relative_to(self.app_dir).as_posix()),
         )
 
-    def _export_mp3(self, source_path: Path, destination: Path) -> None:
+    def _package_into_archive(
+        self,
+        source_path: Path,
+        destination_dir: Path,
+        archive: PlaybookArchiveWriter,
+    ) -> PackagedAudio:
+        destination = destination_dir / source_path.with_suffix(f".{self.audio_format}").name
+        manifest_path = PurePosixPath(destination.relative_to(self.app_dir).as_posix())
+        if not archive.has_entry(manifest_path):
+            self._write_archive_entry(source_path, manifest_path, archive)
+        return PackagedAudio(
+            path=destination if archive.mirror_dir is not None else None,
+            manifest_path=manifest_path,
+        )
+
+    def _write_archive_entry(
+        self,
+        source_path: Path,
+        manifest_path: PurePosixPath,
+        archive: PlaybookArchiveWriter,
+    ) -> None:
+        if self.audio_format == "wav":
+            archive.write_file(source_path, manifest_path)
+            return
+        buffer = BytesIO()
+        self._export_mp3(source_path, buffer)
+        archive.write_bytes(manifest_path, buffer.getvalue())
+
+    def _export_mp3(self, source_path: Path, destination: Path | BytesIO) -> None:
         try:
             AudioSegment.from_file(source_path).export(
                 destination,
@@ -47,5 +84,10 @@ class PlaybookAudioPackager:
         except Exception as exc:
             raise RuntimeError(
                 "Unable to export Playbook MP3 asset "
-                f"{paths.display_path(source_path)} to {paths.display_path(destination)}"
+                f"{paths.display_path(source_path)} to {self._display_destination(destination)}"
             ) from exc
+
+    def _display_destination(self, destination: Path | BytesIO) -> str:
+        if isinstance(destination, Path):
+            return paths.display_path(destination)
+        return "Playbook package"
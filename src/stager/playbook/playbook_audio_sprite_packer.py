@@ -0,0 +1,136 @@
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from io import BytesIO
+from pathlib import Path, PurePosixPath
+import shutil
+import tempfile
+import wave
+
+from pydub import AudioSegment
+
+from stager.playbook.playbook_archive_writer import PlaybookArchiveWriter
+
+
+@dataclass(frozen=True)
+class PackagedSpriteClip:
+    manifest_path: PurePosixPath
+    offset_ms: int
+
+
+@dataclass
+class _SpriteSpool:
+    path: Path
+    writer: wave.Wave_write
+    frame_rate: int
+    channels: int
+    sample_width: int
+    frames: int = 0
+    clips: dict[Path, PackagedSpriteClip] = field(default_factory=dict)
+
+
+@dataclass
+class PlaybookAudioSpritePacker:
+    """Concatenate each role's Playbook audio into one sprite file with per-clip offsets."""
+
+    app_dir: Path
+    audio_format: str = "wav"
+    mp3_bitrate: str = "128k"
+    gap_ms: int = 50
+    _spool_dir: tempfile.TemporaryDirectory | None = field(default=None, init=False, repr=False)
+    _spools: dict[str, _SpriteSpool] = field(default_factory=dict, init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        if self.audio_format not in ("wav", "mp3"):
+            raise ValueError("audio_format must be one of: wav, mp3")
+
+    def sprite_manifest_path(self, role: str) -> PurePosixPath:
+        return PurePosixPath("audio", "sprites", f"{role}.{self.audio_format}")
+
+    def add(self, source_path: Path, role: str) -> PackagedSpriteClip:
+        spool = self._spools.get(role)
+        if spool is not None and source_path in spool.clips:
+            return spool.clips[source_path]
+        audio = AudioSegment.from_file(source_path)
+        if spool is None:
+            spool = self._open_spool(role, audio)
+        elif spool.frames:
+            self._write_gap(spool)
+        audio = audio.set_frame_rate(spool.frame_rate).set_channels(spool.channels).set_sample_width(spool.sample_width)
+        clip = PackagedSpriteClip(
+            manifest_path=self.sprite_manifest_path(role),
+            offset_ms=round(spool.frames * 1000 / spool.frame_rate),
+        )
+        spool.writer.writeframesraw(audio.raw_data)
+        spool.frames += int(audio.frame_count())
+        spool.clips[source_path] = clip
+        return clip
+
+    def finish(self, archive: PlaybookArchiveWriter | None = None) -> list[PurePosixPath]:
+        written: list[PurePosixPath] = []
+        try:
+            for role, spool in self._spools.items():
+                spool.writer.close()
+                manifest_path = self.sprite_manifest_path(role)
+                self._write_sprite(spool.path, manifest_path, archive)
+                written.append(manifest_path)
+        finally:
+            self.close()
+        return written
+
+    def close(self) -> None:
+        for spool in self._spools.values():
+            spool.writer.close()
+        self._spools.clear()
+        if self._spool_dir is not None:
+            self._spool_dir.cleanup()
+            self._spool_dir = None
+
+    def _open_spool(self, role: str, audio: AudioSegment) -> _SpriteSpool:
+        if self._spool_dir is None:
+            self._spool_dir = tempfile.TemporaryDirectory(prefix="playbook-sprites-")
+        spool_path = Path(self._spool_dir.name) / f"{role}.wav"
+        writer = wave.open(str(spool_path), "wb")
+        writer.setnchannels(audio.channels)
+        writer.setsampwidth(audio.sample_width)
+        writer.setframerate(audio.frame_rate)
+        spool = _SpriteSpool(
+            path=spool_path,
+            writer=writer,
+            frame_rate=audio.frame_rate,
+            channels=audio.channels,
+            sample_width=audio.sample_width,
+        )
+        self._spools[role] = spool
+        return spool
+
+    def _write_gap(self, spool: _SpriteSpool) -> None:
+        gap_frames = int(spool.frame_rate * self.gap_ms / 1000)
+        spool.writer.writeframesraw(b"\x00" * gap_frames * spool.channels * spool.sample_width)
+        spool.frames += gap_frames
+
+    def _write_sprite(
+        self,
+        spool_path: Path,
+        manifest_path: PurePosixPath,
+        archive: PlaybookArchiveWriter | None,
+    ) -> None:
+        if self.audio_format == "wav":
+            if archive is not None:
+                archive.write_file(spool_path, manifest_path)
+                return
+            destination = self.app_dir / manifest_path
+            destination.parent.mkdir(parents=True, exist_ok=True)
+            shutil.move(spool_path, destination)
+            return
+        buffer = BytesIO()
+        try:
+            AudioSegment.from_wav(spool_path).export(buffer, format="mp3", bitrate=self.mp3_bitrate)
+        except Exception as exc:
+            raise RuntimeError(f"Unable to export Playbook MP3 audio sprite {manifest_path}") from exc
+        if archive is not None:
+            archive.write_bytes(manifest_path, buffer.getvalue())
+            return
+        destination = self.app_dir / manifest_path
+        destination.parent.mkdir(parents=True, exist_ok=True)
+        destination.write_bytes(buffer.getvalue())
@@ -3,12 +3,10 @@ from __future__ import annotations
 from datetime import datetime
 from datetime import timezone
 from dataclasses import dataclass, field
-import itertools
 import logging
-from pathlib import Path
+from pathlib import Path, PurePosixPath
 from uuid import uuid4
 import shutil
-import zipfile
 
 from stager.domain.block import BlockingBlock, DescriptionBlock, DirectionBlock, RoleBlock, TitleBlock
 from stager.domain.play import Play
@@ -32,9 +30,13 @@ from stager.playbook.app_response_segment import AppResponseSegment
 from stager.playbook.app_role import AppRole
 from stager.playbook.app_section import AppSection
 from stager.playbook.cue_start_offset_analyzer import CueStartOffsetAnalyzer
+from stager.playbook.cue_start_offset_cache import CueStartOffsetCache
+from stager.playbook.callout_source_index import CalloutSourceIndex
 from stager.playbook.cue_selection import CueSelection
+from stager.playbook.playbook_archive_writer import PlaybookArchiveWriter
 from stager.playbook.playbook_audio_work_item import PlaybookAudioWorkItem
 from stager.playbook.playbook_audio_packager import PlaybookAudioPackager
+from stager.playbook.playbook_audio_sprite_packer import PlaybookAudioSpritePacker
 from stager.playbook.playbook_cue_selector import PlaybookCueSelector
 from stager.playbook.playbook_progress_reporter import PlaybookProgressReporter
 from stager.playbook.staging_bundle_builder import PlaybookStagingBundleBuilder
@@ -63,12 +65,23 @@ class PlaybookBuilder:
     blocking_diagrams: bool = True
     build_id: str | None = None
     build_timestamp: str | None = None
+    packaging: str = "staged"
+    keep_app_dir: bool = False
+    audio_layout: str = "files"
+    _cue_start_offset_cache: CueStartOffsetCache | None = field(default=None, init=False, repr=False)
+    _callout_index: CalloutSourceIndex | None = field(default=None, init=False, repr=False)
+    _sprite_packer: PlaybookAudioSpritePacker | None = field(default=None, init=False, repr=False)
+    _archive: PlaybookArchiveWriter | None = field(default=None, init=False, repr=False)
     _manifest_assets: list[AppAudioAsset] = field(default_factory=list, init=False, repr=False)
     _audio_asset_cache: dict[tuple[Path, str, str], AppAudioAsset] = field(default_factory=dict, init=False, repr=False)
     _logger: logging.Logger = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._logger = logging.getLogger(__name__)
+        if self.packaging not in ("staged", "direct"):
+            raise ValueError("packaging must be one of: staged, direct")
+        if self.audio_layout not in ("files", "sprites"):
+            raise ValueError("audio_layout must be one of: files, sprites")
         base_audio_selector = CleanedAudioSelector(paths_config=self.paths, audio_source=self.audio_source)
         if self.voice_profiles:
             self.audio_selector = VoiceProfileAudioSelector(
@@ -82,7 +95,8 @@ class PlaybookBuilder:
         if self.selector is None:
             self.selector = PlaybookCueSelector(play=self.play, paths=self.paths, audio_selector=self.audio_selector)
         if self.cue_start_offset_analyzer is None:
-            self.cue_start_offset_analyzer = CueStartOffsetAnalyzer()
+            self._cue_start_offset_cache = CueStartOffsetCache(paths_config=self.paths)
+            self.cue_start_offset_analyzer = CueStartOffsetAnalyzer(cache=self._cue_start_offset_cache)
         if self.audio_packager is None:
             self.audio_packager = PlaybookAudioPackager(
                 app_dir=self.app_dir,
@@ -99,21 +113,56 @@ class PlaybookBuilder:
 
     def build(self) -> Path:
         self._manifest_assets.clear()
+        self._callout_index = CalloutSourceIndex(self.paths.build_dir / "audio" / "callouts")
         if self.app_dir.exists():
             shutil.rmtree(self.app_dir)
         self.app_dir.mkdir(parents=True, exist_ok=True)
+        if self.packaging == "direct":
+            self._build_direct_zip()
+        else:
+            manifest = self._build_manifest_with_progress()
+            self._write_manifest(manifest)
+            self._write_zip()
+        self._logger.info("Wrote Playbook package %s", paths.display_path(self.zip_path))
+        return self.zip_path
+
+    def _build_direct_zip(self) -> None:
+        mirror_dir = self.app_dir if self.keep_app_dir else None
+        with PlaybookArchiveWriter(self.zip_path, mirror_dir=mirror_dir) as archive:
+            self._archive = archive
+            try:
+                manifest = self._build_manifest_with_progress()
+                archive.write_text("manifest.json", manifest.to_json())
+            finally:
+                self._archive = None
+        # Later commands read build metadata from the unpacked manifest, so it is always kept.
+        if mirror_dir is None:
+            self._write_manifest(manifest)
+
+    def _build_manifest_with_progress(self) -> AppManifest:
         audio_work_items = self.plan_audio_work()
         if self.progress_reporter is not None:
             self.progress_reporter.start_audio_packaging(len(audio_work_items))
-        manifest = self.build_manifest()
+        if self.audio_layout == "sprites":
+            self._sprite_packer = PlaybookAudioSpritePacker(app_dir=self.app_dir, audio_format=self.audio_format)
+        try:
+            manifest = self.build_manifest()
+            if self._sprite_packer is not None:
+                self._sprite_packer.finish(archive=self._archive)
+        finally:
+            if self._sprite_packer is not None:
+                self._sprite_packer.close()
+                self._sprite_packer = None
+        if self._cue_start_offset_cache is not None:
+            self._cue_start_offset_cache.save()
         if self.progress_reporter is not None:
             self.progress_reporter.finish_audio_packaging()
+        return manifest
+
+    def _write_manifest(self, manifest: AppManifest) -> None:
         manifest_path = self.app_dir / "manifest.json"
         manifest_path.write_text(manifest.to_json(), encoding="utf-8")
         self._logger.info("Wrote Playbook manifest %s", paths.display_path(manifest_path))
-        self._write_zip()
-        self._logger.info("Wrote Playbook package %s", paths.display_path(self.zip_path))
-        return self.zip_path
 
     def build_manifest(self) -> AppManifest:
         staging = self._build_staging_bundle() if self.blocking_diagrams else None
@@ -127,11 +176,20 @@ class PlaybookBuilder:
             context=self._build_context_blocks(),
             assets=self._manifest_assets,
             staging=staging,
-            format_version="1.1.0" if staging is not None else "1.0.0",
+            format_version=self._format_version(staging is not None),
         )
 
+    def _format_version(self, includes_staging: bool) -> str:
+        if self.audio_layout == "sprites":
+            return "2.0.0"
+        return "1.1.0" if includes_staging else "1.0.0"
+
     def _build_staging_bundle(self):
-        result = PlaybookStagingBundleBuilder(paths_config=self.paths, app_dir=self.app_dir).build()
+        result = PlaybookStagingBundleBuilder(
+            paths_config=self.paths,
+            app_dir=self.app_dir,
+            archive=self._archive,
+        ).build()
         if result is None:
             return None
         self._logger.info("Wrote Playbook staging bundle %s", paths.display_path(result.manifest_path))
@@ -458,53 +516,9 @@ class PlaybookBuilder:
         return self._resolve_callout_source(block.callout)
 
     def _resolve_callout_source(self, callout: str) -> Path | None:
-        base_dir = self.paths.build_dir / "audio" / "callouts"
-        if not base_dir.exists():
-            return None
-
-        candidate_names = self._callout_candidate_names(callout)
-        for candidate_name, ext in itertools.product(candidate_names, (".wav", ".mp3")):
-            direct = base_dir / f"{candidate_name}{ext}"
-            if direct.exists():
-                return direct
-            nested = base_dir / candidate_name / f"{candidate_name}{ext}"
-            if nested.exists():
-                return nested
-
-        target_keys = {self._normalize_callout_name(name) for name in candidate_names}
-        for candidate_file in sorted(base_dir.rglob("*")):
-            if not candidate_file.is_file() or candidate_file.suffix.lower() not in {".wav", ".mp3"}:
-                continue
-            if self._normalize_callout_name(candidate_file.stem) in target_keys:
-                self._logger.warning(
-                    "Resolved callout '%s' using fallback source %s",
-                    callout,
-                    paths.display_path(candidate_file),
-                )
-                return candidate_file
-        return None
-
-    def _callout_candidate_names(self, callout: str) -> list[str]:
-        candidates: list[str] = []
-
-        def append(name: str) -> None:
-            if name and name not in candidates:
-                candidates.append(name)
-
-        append(callout)
-        append(callout.replace("-", " "))
-        append(callout.replace(" ", "-"))
-
-        if "-" in callout:
-            base = callout.split("-", 1)[0]
-            append(base)
-            append(base.replace(" ", "-"))
-            append(base.replace("-", " "))
-
-        return candidates
-
-    def _normalize_callout_name(self, value: str) -> str:
-        return value.replace("-", " ").strip().lower()
+        if self._callout_index is None:
+            self._callout_index = CalloutSourceIndex(self.paths.build_dir / "audio" / "callouts")
+        return self._callout_index.resolve(callout)
 
     def _required_production_id(self, production_id: str | None, description: str) -> str:
         if production_id is None:
@@ -533,26 +547,34 @@ class PlaybookBuilder:
         if category == "cue":
             assert self.cue_start_offset_analyzer is not None
             cue_start_offsets = self.cue_start_offset_analyzer.analyze(source_path, duration_ms)
-        assert self.audio_packager is not None
-        packaged_audio = self.audio_packager.package(
-            source_path,
-            self.app_dir / "audio" / destination_dir / role,
-        )
-        asset = AppAudioAsset(
-            path=packaged_audio.manifest_path,
-            duration_ms=duration_ms,
-            required=True,
-            cue_start_offsets=cue_start_offsets,
-        )
+        if self._sprite_packer is not None and destination_dir == "segments":
+            clip = self._sprite_packer.add(source_path, role)
+            asset = AppAudioAsset(
+                path=clip.manifest_path,
+                duration_ms=duration_ms,
+                required=True,
+                cue_start_offsets=cue_start_offsets,
+                offset_ms=clip.offset_ms,
+            )
+        else:
+            asset = AppAudioAsset(
+                path=self._package_audio_file(source_path, self.app_dir / "audio" / destination_dir / role),
+                duration_ms=duration_ms,
+                required=True,
+                cue_start_offsets=cue_start_offsets,
+            )
         self._manifest_assets.append(asset)
         self._audio_asset_cache[cache_key] = asset
         if self.progress_reporter is not None:
             self.progress_reporter.audio_packaged(role, segment_id, category)
         return asset
 
+    def _package_audio_file(self, source_path: Path, destination: Path) -> PurePosixPath:
+        assert self.audio_packager is not None
+        if self._archive is not None:
+            return self.audio_packager.package(source_path, destination, archive=self._archive).manifest_path
+        return self.audio_packager.package(source_path, destination).manifest_path
+
     def _write_zip(self) -> None:
-        self.zip_path.parent.mkdir(parents=True, exist_ok=True)
-        with zipfile.ZipFile(self.zip_path, "w", compression=zipfile.ZIP_DEFLATED) as archive:
-            for path in sorted(self.app_dir.rglob("*")):
-                if path.is_file():
-                    archive.write(path, path.relative_to(self.app_dir).as_posix())
+        with PlaybookArchiveWriter(self.zip_path) as archive:
+            archive.write_tree(self.app_dir)
@@ -1,6 +1,6 @@
 from __future__ import annotations
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from pathlib import Path
 
 from stager.domain.block import DescriptionBlock, DirectionBlock, RoleBlock, TitleBlock
@@ -16,20 +16,52 @@ class PlaybookCueSelector:
     play: Play
     paths: paths.PathConfig
     audio_selector: CleanedAudioSelector | None = None
+    _positions: dict[int, int] | None = field(default=None, init=False, repr=False)
+    _previous_in_part: list[int | None] = field(default_factory=list, init=False, repr=False)
+    _last_in_part: dict[int | None, int] = field(default_factory=dict, init=False, repr=False)
+    _selections: dict[int, CueSelection | None] = field(default_factory=dict, init=False, repr=False)
 
     def select_for_block(self, block: RoleBlock) -> CueSelection:
-        preceding = []
-        for candidate in self.play.blocks:
-            if candidate is block:
+        positions = self._block_positions()
+        index = positions.get(id(block))
+        if index is None:
+            candidate_index = self._last_in_part.get(block.block_id.part_id)
+        else:
+            candidate_index = self._previous_in_part[index]
+        selection = self._selection_at_or_before(candidate_index)
+        if selection is not None:
+            return selection
+        return self._first_line_selection(block)
+
+    def _block_positions(self) -> dict[int, int]:
+        if self._positions is not None:
+            return self._positions
+        # Link each block to the previous block in its part so cue lookups never rescan the play.
+        self._positions = {}
+        self._previous_in_part = []
+        self._last_in_part = {}
+        for index, candidate in enumerate(self.play.blocks):
+            part_id = candidate.block_id.part_id
+            self._positions[id(candidate)] = index
+            self._previous_in_part.append(self._last_in_part.get(part_id))
+            self._last_in_part[part_id] = index
+        return self._positions
+
+    def _selection_at_or_before(self, index: int | None) -> CueSelection | None:
+        visited: list[int] = []
+        selection = None
+        while index is not None:
+            if index in self._selections:
+                selection = self._selections[index]
                 break
-            if candidate.block_id.part_id != block.block_id.part_id:
-                continue
-            preceding.append(candidate)
-        for candidate in reversed(preceding):
-            selection = self._selection_for_candidate(candidate)
+            visited.append(index)
+            selection = self._selection_for_candidate(self.play.blocks[index])
             if selection is not None:
-                return selection
-        return self._first_line_selection(block)
+                break
+            index = self._previous_in_part[index]
+        for visited_index in visited:
+            self._selections[visited_index] = selection
+        return selection
 
     def _selection_for_candidate(self, block) -> CueSelection | None:
         if isinstance(block, (TitleBlock, DescriptionBlock, DirectionBlock)):
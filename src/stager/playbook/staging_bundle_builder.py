@@ -7,6 +7,7 @@ from pathlib import Path
 from typing import Any
 
 from stager.playbook.app_staging import AppStaging
+from stager.playbook.playbook_archive_writer import PlaybookArchiveWriter
 from stager.shared import paths
 from stager.staging.diagram_state_builder import DiagramStateBuilder
 from stager.staging.model import BlockingBeat, StagingDocument
@@ -30,9 +31,16 @@ class StagingBundleResult:
 
 
 class PlaybookStagingBundleBuilder:
-    def __init__(self, *, paths_config: paths.PathConfig, app_dir: Path) -> None:
+    def __init__(
+        self,
+        *,
+        paths_config: paths.PathConfig,
+        app_dir: Path,
+        archive: PlaybookArchiveWriter | None = None,
+    ) -> None:
         self.paths_config = paths_config
         self.app_dir = app_dir
+        self.archive = archive
         self.bundle_dir = app_dir / "staging"
         self.diagram_builder = DiagramStateBuilder()
 
@@ -43,15 +51,16 @@ class PlaybookStagingBundleBuilder:
         document = StagingParser().parse(staging_path.read_text(encoding="utf-8"))
         if not document.snapshots:
             return None
-        self.bundle_dir.mkdir(parents=True, exist_ok=True)
-        (self.bundle_dir / "checkpoints").mkdir(parents=True, exist_ok=True)
-        (self.bundle_dir / "deltas").mkdir(parents=True, exist_ok=True)
+        if self.archive is None:
+            self.bundle_dir.mkdir(parents=True, exist_ok=True)
+            (self.bundle_dir / "checkpoints").mkdir(parents=True, exist_ok=True)
+            (self.bundle_dir / "deltas").mkdir(parents=True, exist_ok=True)
 
         checkpoint_records: list[dict[str, Any]] = []
         delta_records: list[dict[str, Any]] = []
         file_paths: list[Path] = []
         icons_path = self.bundle_dir / "icons.svg"
-        icons_path.write_text("\n".join(StageSvgIconLibrary().defs()) + "\n", encoding="utf-8")
+        self._write_text(icons_path, "\n".join(StageSvgIconLibrary().defs()) + "\n")
         file_paths.append(icons_path)
         for scene_id in sorted(document.snapshots):
             checkpoint_state = self._scene_state(document, scene_id)
@@ -190,7 +199,13 @@ class PlaybookStagingBundleBuilder:
         return ops
 
     def _write_json(self, path: Path, data: dict[str, Any]) -> None:
-        path.write_text(json.dumps(data, indent=2, sort_keys=False) + "\n", encoding="utf-8")
+        self._write_text(path, json.dumps(data, indent=2, sort_keys=False) + "\n")
+
+    def _write_text(self, path: Path, text: str) -> None:
+        if self.archive is not None:
+            self.archive.write_text(self._manifest_path(path), text)
+        else:
+            path.write_text(text, encoding="utf-8")
 
     def _manifest_path(self, path: Path) -> str:
         return path.relative_to(self.app_dir).as_posix()
@@ -8,12 +8,14 @@ from stager.audio.segment_build_service import SegmentBuildService
 from stager.domain.block import RoleBlock
 from stager.domain.play import Play
 from stager.domain.segment import SimultaneousSegment, SpeechSegment
+from stager.linerecorder.recording_context_index import RecordingContextIndex
 from stager.linerecorder.recording_request_builder import RecordingRequestBuilder
 from stager.linerecorder.role_recordings_importer import (
     RecordingImportProcessingOptions,
     RoleRecordingsImporter,
     RoleRecordingsImportResult,
 )
+from stager.playbook.playbook_cue_selector import PlaybookCueSelector
 from stager.production.cast_config import CastConfig
 from stager.production.production_status import ProductionStatusService
 from stager.production_publication.production_publisher import ProductionPublisher
@@ -70,6 +72,8 @@ class RecordingWorkflowService:
             if self._recording_method(selected_role, cast_config) != "whole-role"
         )
         build_id, build_timestamp = self._read_playbook_build_metadata()
+        context_index = RecordingContextIndex(self.play)
+        cue_selector = PlaybookCueSelector(play=self.play, paths=self.paths_config)
         requests = []
         for selected_role in request_roles:
             selected_item_ids, item_reasons, request_kind = self._request_selection(
@@ -91,6 +95,8 @@ class RecordingWorkflowService:
                 selected_segment_ids=selected_item_ids,
                 selected_item_reasons=item_reasons,
                 notes=request_notes,
+                cue_selector=cue_selector,
+                context_index=context_index,
             )
             path = builder.build()
             manifest = json.loads((builder.request_dir / "manifest.json").read_text(encoding="utf-8"))
@@ -6,7 +6,9 @@ from pathlib import Path
 from stager.domain.block import RoleBlock
 from stager.domain.play import Play
 from stager.domain.segment import SimultaneousSegment, SpeechSegment
+from stager.linerecorder.recording_context_index import RecordingContextIndex
 from stager.linerecorder.recording_request_builder import RecordingRequestBuilder
+from stager.playbook.playbook_cue_selector import PlaybookCueSelector
 from stager.shared import paths
 
 
@@ -39,6 +41,8 @@ class PublishedRecordingRequestBuilder:
                     for role in segment.roles:
                         if not role.startswith("_"):
                             selected_by_role.setdefault(role, set()).add(segment_id)
+        context_index = RecordingContextIndex(self.play)
+        cue_selector = PlaybookCueSelector(play=self.play, paths=self.paths_config)
         zip_paths: list[Path] = []
         for role, item_ids in sorted(selected_by_role.items()):
             zip_paths.append(
@@ -52,6 +56,8 @@ class PublishedRecordingRequestBuilder:
                     selected_segment_ids=item_ids,
                     selected_item_reasons=reasons_by_item,
                     notes=f"Production update {self.version_label}.",
+                    cue_selector=cue_selector,
+                    context_index=context_index,
                 ).build()
             )
         return zip_paths
@@ -0,0 +1,61 @@
+#!/usr/bin/env python3
+"""One write-only report worksheet whose column styles are resolved once per sheet."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from openpyxl.cell import WriteOnlyCell
+from openpyxl.worksheet._write_only import WriteOnlyWorksheet
+
+
+@dataclass
+class XlsxReportSheet:
+    worksheet: WriteOnlyWorksheet
+    headers: list[str]
+    column_styles: dict[str, str] = field(default_factory=dict)
+    _styled_cells: dict[tuple[int, str], WriteOnlyCell] = field(init=False, repr=False, default_factory=dict)
+    _column_cells: list[tuple[int, WriteOnlyCell]] = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._column_cells = [
+            (idx, self._styled_cell(idx, self.column_styles[header]))
+            for idx, header in enumerate(self.headers)
+            if header in self.column_styles
+        ]
+
+    def append_header(self, header_styles: dict[str, str]) -> None:
+        cells: list[object] = list(self.headers)
+        for idx, header in enumerate(self.headers):
+            if header in header_styles:
+                cell = WriteOnlyCell(self.worksheet, value=header)
+                cell.style = header_styles[header]
+                cells[idx] = cell
+        self.worksheet.append(cells)
+
+    def append_row(self, row: dict[str, object], styles: dict[str, str] | None = None) -> None:
+        self.append([row.get(header, "") for header in self.headers], styles)
+
+    def append(self, values: list[object], styles: dict[str, str] | None = None) -> None:
+        """Append one data row; ``styles`` overrides the column style for named headers in this row only."""
+        # Empty strings are left out of the sheet XML; they display the same as the blank cell.
+        cells = [None if value == "" else value for value in values]
+        for idx, cell in self._column_cells:
+            cell.value = cells[idx]
+            cells[idx] = cell
+        if styles:
+            for header, style in styles.items():
+                idx = self.headers.index(header)
+                cell = self._styled_cell(idx, style)
+                cell.value = None if values[idx] == "" else values[idx]
+                cells[idx] = cell
+        self.worksheet.append(cells)
+
+    def _styled_cell(self, idx: int, style: str) -> WriteOnlyCell:
+        # The worksheet serializes each row as it is appended, so one styled cell per column is reused.
+        key = (idx, style)
+        cell = self._styled_cells.get(key)
+        if cell is None:
+            cell = WriteOnlyCell(self.worksheet)
+            cell.style = style
+            self._styled_cells[key] = cell
+        return cell
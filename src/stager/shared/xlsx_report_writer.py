@@ -0,0 +1,88 @@
+#!/usr/bin/env python3
+"""Stream report rows into a write-only openpyxl workbook with named styles."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+from pathlib import Path
+from typing import Callable
+
+from openpyxl import Workbook
+from openpyxl.styles import Alignment, NamedStyle, PatternFill
+from openpyxl.utils import get_column_letter
+
+from stager.shared.xlsx_report_sheet import XlsxReportSheet
+
+RIGHT = "report_right"
+CENTER = "report_center"
+WRAP = "report_wrap"
+DECIMAL = "report_decimal"
+RIGHT_WARNING = "report_right_warning"
+RIGHT_MISSING = "report_right_missing"
+
+REPORT_STYLES: dict[str, Callable[[], NamedStyle]] = {
+    RIGHT: lambda: NamedStyle(name=RIGHT, alignment=Alignment(horizontal="right")),
+    CENTER: lambda: NamedStyle(name=CENTER, alignment=Alignment(horizontal="center")),
+    WRAP: lambda: NamedStyle(name=WRAP, alignment=Alignment(horizontal="left", vertical="top", wrapText=True)),
+    DECIMAL: lambda: NamedStyle(name=DECIMAL, number_format="0.0", alignment=Alignment(horizontal="right")),
+    RIGHT_WARNING: lambda: NamedStyle(
+        name=RIGHT_WARNING,
+        alignment=Alignment(horizontal="right"),
+        fill=PatternFill(start_color="FFFF00", end_color="FFFF00", fill_type="solid"),
+    ),
+    RIGHT_MISSING: lambda: NamedStyle(
+        name=RIGHT_MISSING,
+        alignment=Alignment(horizontal="right"),
+        fill=PatternFill(start_color="FF0000", end_color="FF0000", fill_type="solid"),
+    ),
+}
+
+
+@dataclass
+class XlsxReportWriter:
+    """Rows are written once with their final style, so no cell is revisited after it is appended."""
+
+    _workbook: Workbook = field(init=False, repr=False)
+    _registered: set[str] = field(init=False, repr=False, default_factory=set)
+
+    def __post_init__(self) -> None:
+        self._workbook = Workbook(write_only=True)
+
+    def add_sheet(
+        self,
+        title: str,
+        headers: list[str],
+        widths: dict[str, float] | None = None,
+        column_styles: dict[str, str] | None = None,
+        header_styles: dict[str, str] | None = None,
+        hidden: set[str] | None = None,
+        row_styles: set[str] | None = None,
+    ) -> XlsxReportSheet:
+        column_styles = column_styles or {}
+        header_styles = header_styles or {}
+        for style in {*column_styles.values(), *header_styles.values(), *(row_styles or set())}:
+            self._register_style(style)
+        ws = self._workbook.create_sheet(title=title[:31])
+        # Write-only sheets take column settings up front, before the first row is streamed.
+        for idx, header in enumerate(headers, start=1):
+            dimension = ws.column_dimensions[get_column_letter(idx)]
+            if widths and header in widths:
+                dimension.width = widths[header]
+            if hidden and header in hidden:
+                dimension.hidden = True
+        sheet = XlsxReportSheet(worksheet=ws, headers=headers, column_styles=column_styles)
+        sheet.append_header(header_styles)
+        return sheet
+
+    def save(self, out_path: Path) -> Path:
+        out_path.parent.mkdir(parents=True, exist_ok=True)
+        self._workbook.save(out_path)
+        return out_path
+
+    def _register_style(self, name: str) -> None:
+        if name in self._registered:
+            return
+        factory = REPORT_STYLES.get(name)
+        if factory is None:
+            raise ValueError(f"Unknown report style: {name}")
+        self._workbook.add_named_style(factory())
+        self._registered.add(name)
@@ -0,0 +1,99 @@
+#!/usr/bin/env python3
+"""Transcribe many short segment files through faster-whisper's batched pipeline."""
+from __future__ import annotations
+
+from bisect import bisect_right
+from dataclasses import dataclass, field
+import logging
+from pathlib import Path
+from typing import Any
+
+import numpy as np
+from faster_whisper import BatchedInferencePipeline, WhisperModel, decode_audio
+
+from stager.transcription.whisper_daemon_client import RemoteWhisperModel
+
+SAMPLING_RATE = 16000
+
+
+@dataclass
+class BatchedSegmentTranscriber:
+    """Pack short segment files into clip lists and transcribe them in fixed-size batches."""
+
+    model: WhisperModel | RemoteWhisperModel
+    batch_size: int = 8
+    max_clip_seconds: float = 28.0
+    pipeline: Any | None = None
+    _logger: logging.Logger = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+        if self.batch_size < 1:
+            raise ValueError("batch_size must be at least 1")
+        if self.pipeline is None and not isinstance(self.model, RemoteWhisperModel):
+            self.pipeline = BatchedInferencePipeline(model=self.model)
+
+    def transcribe(self, audio_paths: list[Path], **transcribe_kwargs: Any) -> list[list[dict]]:
+        """Return raw words per path, timed relative to the start of each file."""
+        if isinstance(self.model, RemoteWhisperModel):
+            return self.model.transcribe_batched(audio_paths, self.batch_size, **transcribe_kwargs)
+        words_by_index: list[list[dict]] = [[] for _ in audio_paths]
+        short: list[tuple[int, np.ndarray]] = []
+        for index, audio_path in enumerate(audio_paths):
+            audio = decode_audio(str(audio_path), sampling_rate=SAMPLING_RATE)
+            duration = audio.shape[0] / SAMPLING_RATE
+            # The batched pipeline only decodes the first 30s of a clip.
+            if duration > self.max_clip_seconds:
+                segments, _info = self.model.transcribe(audio, **transcribe_kwargs)
+                words_by_index[index] = self._raw_words(segments, [0.0], [duration])[0]
+            elif audio.shape[0]:
+                short.append((index, audio))
+        for batch_start in range(0, len(short), self.batch_size):
+            batch = short[batch_start : batch_start + self.batch_size]
+            batch_words = self._transcribe_batch([audio for _index, audio in batch], transcribe_kwargs)
+            for (index, _audio), words in zip(batch, batch_words):
+                words_by_index[index] = words
+        self._logger.debug(
+            "Batched %d of %d segment file(s) in batches of %d",
+            len(short),
+            len(audio_paths),
+            self.batch_size,
+        )
+        return words_by_index
+
+    def _transcribe_batch(self, clips: list[np.ndarray], transcribe_kwargs: dict[str, Any]) -> list[list[dict]]:
+        starts: list[float] = []
+        clip_timestamps: list[dict[str, float]] = []
+        position = 0
+        for clip in clips:
+            starts.append(position / SAMPLING_RATE)
+            position += clip.shape[0]
+            clip_timestamps.append({"start": starts[-1], "end": position / SAMPLING_RATE})
+        # Explicit clips replace VAD chunking, so each segment file is decoded as one chunk.
+        segments, _info = self.pipeline.transcribe(
+            np.concatenate(clips),
+            clip_timestamps=clip_timestamps,
+            batch_size=self.batch_size,
+            **transcribe_kwargs,
+        )
+        return self._raw_words(segments, starts, [clip["end"] for clip in clip_timestamps])
+
+    def _raw_words(self, segments, starts: list[float], ends: list[float]) -> list[list[dict]]:
+        words_by_clip: list[list[dict]] = [[] for _ in starts]
+        for segment in segments:
+            for word in segment.words or []:
+                raw = word.word.strip()
+                if not raw:
+                    continue
+                midpoint = (float(word.start) + float(word.end)) / 2.0
+                clip_index = max(0, bisect_right(starts, midpoint) - 1)
+                offset = starts[clip_index]
+                duration = ends[clip_index] - offset
+                words_by_clip[clip_index].append(
+                    {
+                        "word": raw,
+                        "start": min(max(float(word.start) - offset, 0.0), duration),
+                        "end": min(max(float(word.end) - offset, 0.0), duration),
+                    }
+                )
+        return words_by_clip
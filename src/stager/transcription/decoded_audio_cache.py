@@ -0,0 +1,125 @@
+#!/usr/bin/env python3
+"""Cache recordings decoded to Whisper's 16 kHz mono float32 input as memory-mappable arrays."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+
+import numpy as np
+from faster_whisper import decode_audio
+
+from stager.shared import paths
+from stager.transcription.whisper_cache_store import DECODED_DIR_NAME, DEFAULT_DECODED_MAX_BYTES, WhisperCacheStore
+
+SAMPLING_RATE = 16000
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class DecodedAudioCache:
+    paths: paths.PathConfig
+    cache_version: str = "1"
+    max_bytes: int | None = DEFAULT_DECODED_MAX_BYTES
+    _logger: logging.Logger = field(init=False, repr=False)
+    _cache_dir: Path = field(init=False, repr=False)
+    _store: WhisperCacheStore = field(init=False, repr=False)
+    _lock: threading.Lock = field(init=False, repr=False, default_factory=threading.Lock)
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+        # Decoded arrays are evicted in their own store, so a full-cast run cannot push timelines out or vice versa.
+        self._store = WhisperCacheStore.for_directory(
+            self.paths.build_dir / "whisper_cache" / DECODED_DIR_NAME,
+            self.max_bytes,
+        )
+        self._cache_dir = self._store.cache_dir
+
+    @property
+    def cache_dir(self) -> Path:
+        return self._cache_dir
+
+    def load(self, audio_path: Path) -> np.ndarray:
+        """Return the recording as a read-only memory-mapped 16 kHz mono float32 array."""
+        return np.load(self.cache_path(audio_path), mmap_mode="r")
+
+    def clip(self, audio_path: Path, from_ms: int = 0, length_ms: int | None = None) -> np.ndarray:
+        if from_ms < 0:
+            raise RuntimeError("clip_from_ms must be >= 0")
+        if length_ms is not None and length_ms <= 0:
+            raise RuntimeError("clip_length_ms must be > 0 when provided")
+        audio = self.load(audio_path)
+        start = from_ms * SAMPLING_RATE // 1000
+        stop = None if length_ms is None else start + length_ms * SAMPLING_RATE // 1000
+        return audio[start:stop]
+
+    def cache_path(self, audio_path: Path) -> Path:
+        target = self._cache_dir / f"{self.audio_digest(audio_path)}-v{self.cache_version}.npy"
+        if target.exists():
+            self._logger.debug("Using decoded audio %s for %s", target.name, paths.display_path(audio_path))
+            if not self._store.touch(WhisperCacheStore.decoded_key(target)):
+                # Arrays decoded before they were tracked join the budget on first use.
+                self._track(target, audio_path)
+            return target
+        samples = decode_audio(str(audio_path), sampling_rate=SAMPLING_RATE)
+        target.parent.mkdir(parents=True, exist_ok=True)
+        staging = target.with_name(f".{target.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        with staging.open("wb") as handle:
+            np.save(handle, samples.astype(np.float32, copy=False))
+        os.replace(staging, target)
+        self._track(target, audio_path)
+        self._logger.info(
+            "Decoded %s to %s (%.1fs at %d Hz)",
+            paths.display_path(audio_path),
+            paths.display_path(target),
+            len(samples) / SAMPLING_RATE,
+            SAMPLING_RATE,
+        )
+        return target
+
+    def _track(self, target: Path, audio_path: Path) -> None:
+        meta = {"kind": "decoded", "audio_path": str(audio_path), "role": audio_path.stem}
+        self._store.add_file(WhisperCacheStore.decoded_key(target), target.name, meta)
+
+    def audio_digest(self, audio_path: Path) -> str:
+        # Hashing a multi-hour recording is slow, so digests are reused while size and mtime are unchanged.
+        stat = audio_path.stat()
+        source = str(audio_path.resolve())
+        with self._lock:
+            index = self._read_index()
+            entry = index.get(source)
+            if entry and entry.get("mtime_ns") == stat.st_mtime_ns and entry.get("size") == stat.st_size:
+                return entry["sha256"]
+        digest = hashlib.sha256()
+        with audio_path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        sha256 = digest.hexdigest()
+        with self._lock:
+            index = self._read_index()
+            index[source] = {"mtime_ns": stat.st_mtime_ns, "size": stat.st_size, "sha256": sha256}
+            self._write_index(index)
+        return sha256
+
+    def _index_path(self) -> Path:
+        return self._cache_dir / "index.json"
+
+    def _read_index(self) -> dict[str, dict]:
+        index_path = self._index_path()
+        if not index_path.exists():
+            return {}
+        try:
+            return json.loads(index_path.read_text(encoding="utf-8"))
+        except ValueError:
+            return {}
+
+    def _write_index(self, index: dict[str, dict]) -> None:
+        index_path = self._index_path()
+        index_path.parent.mkdir(parents=True, exist_ok=True)
+        staging = index_path.with_name(f".{index_path.name}.{os.getpid()}.tmp")
+        staging.write_text(json.dumps(index, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+        os.replace(staging, index_path)
@@ -0,0 +1,108 @@
+#!/usr/bin/env python3
+"""Load Whisper models through a resident daemon, falling back to the in-process store."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import logging
+import os
+from pathlib import Path
+import subprocess
+import sys
+import tempfile
+import time
+
+from faster_whisper import WhisperModel
+
+from stager.transcription.whisper_daemon_client import RemoteWhisperModel, WhisperDaemonClient
+from stager.transcription.whisper_model_store import WhisperModelStore
+
+
+@dataclass
+class ResidentWhisperModelStore:
+    store: WhisperModelStore
+    idle_timeout_s: float = 600.0
+    auto_start: bool = True
+    start_timeout_s: float = 10.0
+    socket_path: Path | None = None
+    _logger: logging.Logger = field(init=False, repr=False)
+    _client: WhisperDaemonClient = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+        if self.socket_path is None:
+            self.socket_path = self.default_socket_path(self.store)
+        self._client = WhisperDaemonClient(socket_path=self.socket_path)
+
+    @staticmethod
+    def default_socket_path(store: WhisperModelStore) -> Path:
+        # One daemon per model directory and decoder settings; unix socket paths must stay short.
+        settings = f"{store.cache_dir.resolve()}|{store.device}|{store.compute_type}|{store.cpu_threads}"
+        digest = hashlib.sha256(settings.encode("utf-8")).hexdigest()[:12]
+        return Path(tempfile.gettempdir()) / f"stager-whisper-{os.getuid()}-{digest}.sock"
+
+    def load(self, model_name: str) -> RemoteWhisperModel | WhisperModel:
+        if self._ensure_daemon():
+            model = RemoteWhisperModel(client=self._client, model_name=model_name)
+            try:
+                model.load()
+            except (OSError, RuntimeError, ValueError) as exc:
+                self._logger.warning("Whisper daemon could not load %s (%s); loading in-process", model_name, exc)
+            else:
+                self._logger.info("Using resident whisper model %s from %s", model_name, self.socket_path)
+                return model
+        return self.store.load(model_name)
+
+    def _ensure_daemon(self) -> bool:
+        if self._client.is_running():
+            return True
+        if not self.auto_start:
+            return False
+        if getattr(sys, "frozen", False):
+            # A packaged build's executable is the app itself, so it cannot run the daemon module.
+            self._logger.warning(
+                "Whisper daemon cannot be started from a packaged build; loading models in-process. "
+                "Run from a source checkout to keep models resident."
+            )
+            return False
+        self._start_daemon()
+        deadline = time.monotonic() + self.start_timeout_s
+        while time.monotonic() < deadline:
+            if self._client.is_running():
+                return True
+            time.sleep(0.1)
+        self._logger.warning("Whisper daemon did not start on %s; loading models in-process", self.socket_path)
+        return False
+
+    def _start_daemon(self) -> None:
+        log_path = self.store.paths.logs_dir / "whisper-daemon.log"
+        log_path.parent.mkdir(parents=True, exist_ok=True)
+        cmd = [
+            sys.executable,
+            "-m",
+            "stager.transcription.whisper_daemon",
+            "--socket",
+            str(self.socket_path),
+            "--root",
+            str(self.store.paths.root),
+            "--device",
+            self.store.device,
+            "--compute-type",
+            self.store.compute_type,
+            "--cpu-threads",
+            str(self.store.cpu_threads),
+            "--idle-timeout",
+            str(self.idle_timeout_s),
+        ]
+        env = os.environ.copy()
+        env["PYTHONPATH"] = os.pathsep.join(filter(None, [str(self.store.paths.root), env.get("PYTHONPATH")]))
+        self._logger.info("Starting whisper daemon on %s", self.socket_path)
+        with log_path.open("ab") as log_file:
+            subprocess.Popen(
+                cmd,
+                env=env,
+                stdin=subprocess.DEVNULL,
+                stdout=log_file,
+                stderr=log_file,
+                start_new_session=True,
+            )
@@ -5,14 +5,16 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 import logging
 from pathlib import Path
-import subprocess
-import tempfile
 
+import numpy as np
 from faster_whisper import WhisperModel
 
 from stager.shared import paths
+from stager.transcription.batched_segment_transcriber import BatchedSegmentTranscriber
+from stager.transcription.decoded_audio_cache import DecodedAudioCache
 from stager.transcription.vad_config import VadConfig
 from stager.transcription.whisper_model_store import WhisperModelStore
+from stager.transcription.resident_whisper_model_store import ResidentWhisperModelStore
 
 
 @dataclass
@@ -22,7 +24,7 @@ class RoleWhisperTranscriber:
     model_name: str = "medium.en"
     device: str = "cpu"
     compute_type: str = "int8"
-    whisper_store: WhisperModelStore | None = None
+    whisper_store: WhisperModelStore | ResidentWhisperModelStore | None = None
     vad_filter: bool = True
     vad_config: VadConfig | None = None
     no_speech_threshold: float | None = None
@@ -31,6 +33,8 @@ class RoleWhisperTranscriber:
     initial_prompt: str | None = None
     clip_from_ms: int = 0
     clip_length_ms: int | None = None
+    batch_size: int = 8
+    decoded_audio: DecodedAudioCache | None = None
 
     _logger: logging.Logger = field(init=False, repr=False)
     _model: WhisperModel | None = field(init=False, repr=False, default=None)
@@ -44,33 +48,22 @@ class RoleWhisperTranscriber:
                 compute_type=self.compute_type,
                 local_files_only=True,
             )
+        if self.decoded_audio is None:
+            self.decoded_audio = DecodedAudioCache(paths=self.paths)
 
     def transcribe(self, recording_path: Path | None = None, out_path: Path | None = None) -> Path:
         path = recording_path or (self.paths.recordings_dir / f"{self.role}.wav")
         if not path.exists():
             raise RuntimeError(f"Recording not found for role {self.role}: {paths.display_path(path)}")
-        clip_path = self._clip_audio(path)
-        if clip_path is not None:
-            path = clip_path
+        audio = self._decoded_clip(path)
         vad_parameters = None
         if self.vad_filter and self.vad_config is not None:
             vad_parameters = self.vad_config.to_transcribe_parameters()
         vad_label = self._format_vad_label(vad_parameters)
         model = self._load_model()
-        transcribe_kwargs = {
-            "vad_filter": self.vad_filter,
-            "vad_parameters": vad_parameters,
-            "condition_on_previous_text": self.condition_on_previous_text,
-        }
-        if self.no_speech_threshold is not None:
-            transcribe_kwargs["no_speech_threshold"] = self.no_speech_threshold
-        if self.log_prob_threshold is not None:
-            transcribe_kwargs["log_prob_threshold"] = self.log_prob_threshold
-        if self.initial_prompt is not None:
-            transcribe_kwargs["initial_prompt"] = self.initial_prompt
         segments, info = model.transcribe(
-            str(path),
-            **transcribe_kwargs,
+            audio,
+            **self._transcribe_kwargs(vad_parameters),
         )
         lines: list[str] = []
         for segment in segments:
@@ -86,6 +79,58 @@ class RoleWhisperTranscriber:
         self._logger.info("Wrote whisper transcript to %s (%s)", paths.display_path(target), vad_label)
         return target
 
+    def transcribe_segments(self, segments_dir: Path | None = None, out_path: Path | None = None) -> Path:
+        """Transcribe every split segment file for the role in batches and write one line per segment."""
+        source_dir = segments_dir or (self.paths.segments_dir / self.role)
+        segment_paths = sorted(source_dir.glob("*.wav"), key=self._segment_sort_key) if source_dir.is_dir() else []
+        if not segment_paths:
+            raise RuntimeError(f"No segment audio found for role {self.role}: {paths.display_path(source_dir)}")
+        vad_parameters = None
+        if self.vad_filter and self.vad_config is not None:
+            vad_parameters = self.vad_config.to_transcribe_parameters()
+        transcriber = BatchedSegmentTranscriber(model=self._load_model(), batch_size=self.batch_size)
+        words_by_segment = transcriber.transcribe(
+            segment_paths,
+            word_timestamps=True,
+            **self._transcribe_kwargs(vad_parameters),
+        )
+        lines: list[str] = []
+        for segment_path, words in zip(segment_paths, words_by_segment):
+            if not words:
+                continue
+            start_ms = int(round(words[0]["start"] * 1000))
+            end_ms = int(round(words[-1]["end"] * 1000))
+            text = " ".join(word["word"] for word in words)
+            lines.append(f"{segment_path.stem} {start_ms}-{end_ms}: {text}")
+        target = out_path or (self.paths.audio_out_dir / f"{self.role}_segments_nlp.txt")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        target.write_text("\n".join(lines).rstrip() + "\n", encoding="utf-8")
+        self._logger.info(
+            "Wrote whisper transcript for %d segment(s) to %s (batch size %d)",
+            len(segment_paths),
+            paths.display_path(target),
+            self.batch_size,
+        )
+        return target
+
+    def _transcribe_kwargs(self, vad_parameters: dict[str, float | int | None] | None) -> dict[str, object]:
+        transcribe_kwargs: dict[str, object] = {
+            "vad_filter": self.vad_filter,
+            "vad_parameters": vad_parameters,
+            "condition_on_previous_text": self.condition_on_previous_text,
+        }
+        if self.no_speech_threshold is not None:
+            transcribe_kwargs["no_speech_threshold"] = self.no_speech_threshold
+        if self.log_prob_threshold is not None:
+            transcribe_kwargs["log_prob_threshold"] = self.log_prob_threshold
+        if self.initial_prompt is not None:
+            transcribe_kwargs["initial_prompt"] = self.initial_prompt
+        return transcribe_kwargs
+
+    @staticmethod
+    def _segment_sort_key(path: Path) -> tuple[tuple[int, int | str], ...]:
+        return tuple((0, int(part)) if part.isdigit() else (1, part) for part in path.stem.split("_"))
+
     def _load_model(self) -> WhisperModel:
         if self.whisper_store is None:
             raise RuntimeError("Whisper model store is not configured")
@@ -93,40 +138,18 @@ class RoleWhisperTranscriber:
             self._model = self.whisper_store.load(self.model_name)
         return self._model
 
-    def _clip_audio(self, path: Path) -> Path | None:
-        if self.clip_from_ms <= 0 and self.clip_length_ms is None:
-            return None
-        if self.clip_from_ms < 0:
-            raise RuntimeError("clip_from_ms must be >= 0")
-        if self.clip_length_ms is not None and self.clip_length_ms <= 0:
-            raise RuntimeError("clip_length_ms must be > 0 when provided")
-        start_seconds = self.clip_from_ms / 1000.0
-        tmp = tempfile.NamedTemporaryFile(suffix=".wav", delete=False)
-        tmp_path = Path(tmp.name)
-        tmp.close()
-        cmd = [
-            "ffmpeg",
-            "-hide_banner",
-            "-loglevel",
-            "error",
-            "-y",
-            "-ss",
-            f"{start_seconds:.3f}",
-            "-i",
-            str(path),
-        ]
-        if self.clip_length_ms is not None:
-            cmd.extend(["-t", f"{self.clip_length_ms / 1000.0:.3f}"])
-        cmd.extend(["-ar", "16000", "-ac", "1", str(tmp_path)])
-        subprocess.run(cmd, check=True)
-        self._logger.info(
-            "Clipped audio for %s to %s (from %dms, length %s)",
-            self.role,
-            tmp_path,
-            self.clip_from_ms,
-            f"{self.clip_length_ms}ms" if self.clip_length_ms is not None else "full",
-        )
-        return tmp_path
+    def _decoded_clip(self, path: Path) -> np.ndarray:
+        if self.decoded_audio is None:
+            raise RuntimeError("Decoded audio cache is not configured")
+        audio = self.decoded_audio.clip(path, from_ms=self.clip_from_ms, length_ms=self.clip_length_ms)
+        if self.clip_from_ms > 0 or self.clip_length_ms is not None:
+            self._logger.info(
+                "Clipped audio for %s (from %dms, length %s)",
+                self.role,
+                self.clip_from_ms,
+                f"{self.clip_length_ms}ms" if self.clip_length_ms is not None else "full",
+            )
+        return audio
 
     def _format_vad_label(self, vad_parameters: dict[str, float | int | None] | None) -> str:
         if not self.vad_filter:
@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""Cache whisper transcriptions of segment audio by content hash and decoding options."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+from pathlib import Path
+
+from stager.shared import paths
+from stager.transcription.whisper_cache_store import DEFAULT_MAX_BYTES, WhisperCacheStore
+
+HASH_CHUNK_SIZE = 1024 * 1024
+
+
+@dataclass
+class SegmentTranscriptionCache:
+    paths: paths.PathConfig
+    cache_version: str = "1"
+    max_bytes: int | None = DEFAULT_MAX_BYTES
+    _logger: logging.Logger = field(init=False, repr=False)
+    _store: WhisperCacheStore = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+        self._store = WhisperCacheStore.for_directory(self.paths.build_dir / "whisper_cache", self.max_bytes)
+
+    def load(self, options: dict, audio_path: Path) -> list[dict] | None:
+        entry_key = self._entry_key(options, self.audio_digest(audio_path))
+        meta = self._store.metadata(entry_key)
+        if meta is None or meta.get("cache_version") != self.cache_version:
+            return None
+        words = self._store.read(entry_key)
+        if words is not None:
+            self._logger.debug("Using cached segment transcription for %s", paths.display_path(audio_path))
+        return words
+
+    def save(self, options: dict, audio_path: Path, raw_words: list[dict], role: str | None = None) -> None:
+        audio_digest = self.audio_digest(audio_path)
+        meta = {
+            "cache_version": self.cache_version,
+            "audio_path": str(audio_path),
+            "audio_sha256": audio_digest,
+            "role": role,
+            "key": options,
+        }
+        entry_key = self._entry_key(options, audio_digest)
+        self._store.put(entry_key, meta, raw_words)
+        self._logger.debug("Saved segment transcription cache %s", entry_key)
+
+    @staticmethod
+    def audio_digest(audio_path: Path) -> str:
+        digest = hashlib.sha256()
+        with audio_path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    def _entry_key(self, options: dict, audio_digest: str) -> str:
+        encoded = json.dumps({"segment_sha256": audio_digest, "options": options}, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
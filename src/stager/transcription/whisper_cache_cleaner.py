@@ -8,6 +8,7 @@ import logging
 from pathlib import Path
 
 from stager.shared import paths
+from stager.transcription.whisper_cache_store import DECODED_DIR_NAME, DEFAULT_DECODED_MAX_BYTES, WhisperCacheStore
 
 
 @dataclass
@@ -23,8 +24,16 @@ class WhisperCacheCleaner:
     def clear(self, role: str | None = None) -> int:
         if not self._cache_dir.exists():
             return 0
-        removed = 0
-        for path in self._cache_dir.glob("*.json"):
+        removed = self._clear_decoded_audio(role)
+        store = WhisperCacheStore.for_directory(self._cache_dir)
+        removed += store.remove(
+            [key for key, meta in store.entries().items() if role is None or self._matches_role(meta, role)]
+        )
+        # Entries written before the indexed store were one JSON file per transcription.
+        decoded_dir = self._cache_dir / DECODED_DIR_NAME
+        for path in self._cache_dir.rglob("*.json"):
+            if path.parent == decoded_dir:
+                continue
             if role is not None:
                 payload = json.loads(path.read_text(encoding="utf-8"))
                 if not self._matches_role(payload, role):
@@ -33,6 +42,29 @@ class WhisperCacheCleaner:
             removed += 1
         return removed
 
+    def _clear_decoded_audio(self, role: str | None) -> int:
+        decoded_dir = self._cache_dir / DECODED_DIR_NAME
+        index_path = decoded_dir / "index.json"
+        if not index_path.exists():
+            return 0
+        store = WhisperCacheStore.for_directory(decoded_dir, DEFAULT_DECODED_MAX_BYTES)
+        index = json.loads(index_path.read_text(encoding="utf-8"))
+        cleared = {source: entry for source, entry in index.items() if role is None or Path(source).stem == role}
+        kept_digests = {entry["sha256"] for source, entry in index.items() if source not in cleared}
+        removed = 0
+        for entry in cleared.values():
+            if entry["sha256"] in kept_digests:
+                continue
+            for path in decoded_dir.glob(f"{entry['sha256']}-*.npy"):
+                path.unlink()
+                store.remove([WhisperCacheStore.decoded_key(path)])
+                removed += 1
+        remaining = {source: entry for source, entry in index.items() if source not in cleared}
+        index_path.write_text(json.dumps(remaining, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+        return removed
+
     def _matches_role(self, payload: dict, role: str) -> bool:
+        if payload.get("role") is not None:
+            return payload["role"] == role
         audio_path = payload["audio_path"]
         return Path(audio_path).stem == role
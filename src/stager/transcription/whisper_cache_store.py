@@ -0,0 +1,249 @@
+#!/usr/bin/env python3
+"""Size-bounded store of cached Whisper word timelines or decoded audio with an append-only index."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+import time
+from typing import ClassVar
+
+import numpy as np
+
+from stager.shared import paths
+
+DEFAULT_MAX_BYTES = 1024 * 1024 * 1024
+# Decoded recordings take about 230 MB per hour, so they get their own budget instead of crowding out timelines.
+DEFAULT_DECODED_MAX_BYTES = 8 * 1024 * 1024 * 1024
+DECODED_DIR_NAME = "decoded"
+INDEX_NAME = "index.jsonl"
+
+
+@dataclass
+class WhisperCacheStore:
+    """Word timelines stored as columnar ``.npz`` entries, plus tracked files such as decoded audio, evicted
+    least-recently-used past ``max_bytes``."""
+
+    cache_dir: Path
+    max_bytes: int | None = DEFAULT_MAX_BYTES
+    _logger: logging.Logger = field(init=False, repr=False)
+    _lock: threading.RLock = field(init=False, repr=False, default_factory=threading.RLock)
+    _entries: dict[str, dict] = field(init=False, repr=False, default_factory=dict)
+    _total_bytes: int = field(init=False, repr=False, default=0)
+    _index_lines: int = field(init=False, repr=False, default=0)
+
+    _stores: ClassVar[dict[Path, WhisperCacheStore]] = {}
+    _stores_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+        # The directory is created by the first write, so opening a store leaves no trace.
+        self._replay_index()
+
+    @classmethod
+    def for_directory(cls, cache_dir: Path, max_bytes: int | None = DEFAULT_MAX_BYTES) -> WhisperCacheStore:
+        """Share one store per directory so every cache in the process sees the same index and budget."""
+        key = cache_dir.resolve()
+        with cls._stores_lock:
+            store = cls._stores.get(key)
+            if store is None:
+                store = cls(cache_dir=cache_dir, max_bytes=max_bytes)
+                cls._stores[key] = store
+                return store
+            if store.max_bytes != max_bytes:
+                # The latest caller's budget applies from the next write on.
+                store._logger.debug(
+                    "Whisper cache budget for %s changed from %s to %s bytes",
+                    paths.display_path(cache_dir),
+                    store.max_bytes,
+                    max_bytes,
+                )
+                store.max_bytes = max_bytes
+            if not store.cache_dir.exists():
+                # A directory removed by a clean starts over with an empty index; holders keep the same store.
+                with store._lock:
+                    store._entries = {}
+                    store._total_bytes = 0
+                    store._index_lines = 0
+            return store
+
+    @staticmethod
+    def decoded_key(decoded_path: Path) -> str:
+        return f"decoded-{decoded_path.stem}"
+
+    @property
+    def total_bytes(self) -> int:
+        return self._total_bytes
+
+    def metadata(self, key: str) -> dict | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            return None if entry is None else dict(entry["meta"])
+
+    def entries(self) -> dict[str, dict]:
+        with self._lock:
+            return {key: dict(entry["meta"]) for key, entry in self._entries.items()}
+
+    def read(self, key: str) -> list[dict] | None:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            entry_path = self.cache_dir / entry["file"]
+            try:
+                with np.load(entry_path, allow_pickle=False) as data:
+                    words = self._decode_words(data)
+            except (OSError, ValueError, KeyError):
+                self._logger.warning("Dropping unreadable whisper cache entry %s", paths.display_path(entry_path))
+                self._remove_entry(key)
+                return None
+            self.touch(key)
+            return words
+
+    def touch(self, key: str) -> bool:
+        """Mark an entry as recently used; returns False when the store does not track ``key``."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return False
+            entry["last_used"] = time.time_ns()
+            self._append_index({"op": "touch", "key": key, "last_used": entry["last_used"]})
+            return True
+
+    def put(self, key: str, meta: dict, words: list[dict]) -> None:
+        with self._lock:
+            self.cache_dir.mkdir(parents=True, exist_ok=True)
+            file_name = f"{key}.npz"
+            entry_path = self.cache_dir / file_name
+            staging = entry_path.with_name(f".{file_name}.{os.getpid()}.{threading.get_ident()}.tmp")
+            with staging.open("wb") as handle:
+                np.savez_compressed(handle, **self._encode_words(words))
+            os.replace(staging, entry_path)
+            self._track(key, file_name, meta)
+
+    def add_file(self, key: str, file_name: str, meta: dict) -> None:
+        """Track a file already written below the cache directory so it counts against the same budget."""
+        with self._lock:
+            self._track(key, file_name, meta)
+
+    def _track(self, key: str, file_name: str, meta: dict) -> None:
+        if key in self._entries:
+            self._total_bytes -= self._entries[key]["size"]
+        entry = {
+            "file": file_name,
+            "size": (self.cache_dir / file_name).stat().st_size,
+            "last_used": time.time_ns(),
+            "meta": meta,
+        }
+        self._entries[key] = entry
+        self._total_bytes += entry["size"]
+        self._append_index({"op": "put", "key": key, **entry})
+        self._evict(keep=key)
+
+    def remove(self, keys: list[str]) -> int:
+        with self._lock:
+            removed = 0
+            for key in keys:
+                if key in self._entries:
+                    self._remove_entry(key)
+                    removed += 1
+            return removed
+
+    def _evict(self, keep: str) -> None:
+        if self.max_bytes is None or self._total_bytes <= self.max_bytes:
+            return
+        evicted = 0
+        for key in sorted(self._entries, key=lambda entry_key: self._entries[entry_key]["last_used"]):
+            if self._total_bytes <= self.max_bytes:
+                break
+            if key == keep:
+                continue
+            self._remove_entry(key)
+            evicted += 1
+        self._logger.info(
+            "Evicted %d whisper cache entr%s to stay within %.0f MB",
+            evicted,
+            "y" if evicted == 1 else "ies",
+            self.max_bytes / (1024 * 1024),
+        )
+
+    def _remove_entry(self, key: str) -> None:
+        entry = self._entries.pop(key)
+        self._total_bytes -= entry["size"]
+        (self.cache_dir / entry["file"]).unlink(missing_ok=True)
+        self._append_index({"op": "remove", "key": key})
+
+    @staticmethod
+    def _encode_words(words: list[dict]) -> dict[str, np.ndarray]:
+        # Repeated words share one slot in a newline-joined string table.
+        table: dict[str, int] = {}
+        word_index = np.fromiter(
+            (table.setdefault(word["word"], len(table)) for word in words),
+            dtype=np.int32,
+            count=len(words),
+        )
+        return {
+            "start": np.fromiter((word["start"] for word in words), dtype=np.float64, count=len(words)),
+            "end": np.fromiter((word["end"] for word in words), dtype=np.float64, count=len(words)),
+            "word_index": word_index,
+            "strings": np.frombuffer("\n".join(table).encode("utf-8"), dtype=np.uint8),
+        }
+
+    @staticmethod
+    def _decode_words(data: np.lib.npyio.NpzFile) -> list[dict]:
+        strings = data["strings"].tobytes().decode("utf-8").split("\n")
+        return [
+            {"word": strings[index], "start": start, "end": end}
+            for index, start, end in zip(
+                data["word_index"].tolist(),
+                data["start"].tolist(),
+                data["end"].tolist(),
+            )
+        ]
+
+    def _index_path(self) -> Path:
+        return self.cache_dir / INDEX_NAME
+
+    def _replay_index(self) -> None:
+        index_path = self._index_path()
+        if not index_path.exists():
+            return
+        with index_path.open(encoding="utf-8") as handle:
+            for line in handle:
+                self._index_lines += 1
+                try:
+                    record = json.loads(line)
+                except ValueError:
+                    continue
+                key = record.get("key")
+                if record.get("op") == "put":
+                    self._entries[key] = {name: record[name] for name in ("file", "size", "last_used", "meta")}
+                elif record.get("op") == "touch" and key in self._entries:
+                    self._entries[key]["last_used"] = record["last_used"]
+                elif record.get("op") == "remove":
+                    self._entries.pop(key, None)
+        # Entries whose files vanished outside the store no longer count against the budget.
+        self._entries = {
+            key: entry for key, entry in self._entries.items() if (self.cache_dir / entry["file"]).exists()
+        }
+        self._total_bytes = sum(entry["size"] for entry in self._entries.values())
+        if self._index_lines > 2 * len(self._entries) + 100:
+            self._compact_index()
+
+    def _append_index(self, record: dict) -> None:
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        with self._index_path().open("a", encoding="utf-8") as handle:
+            handle.write(json.dumps(record, sort_keys=True, separators=(",", ":")) + "\n")
+        self._index_lines += 1
+
+    def _compact_index(self) -> None:
+        index_path = self._index_path()
+        staging = index_path.with_name(f".{INDEX_NAME}.{os.getpid()}.tmp")
+        with staging.open("w", encoding="utf-8") as handle:
+            for key, entry in self._entries.items():
+                handle.write(json.dumps({"op": "put", "key": key, **entry}, sort_keys=True, separators=(",", ":")) + "\n")
+        os.replace(staging, index_path)
+        self._index_lines = len(self._entries)
@@ -0,0 +1,157 @@
+#!/usr/bin/env python3
+"""Serve Whisper transcriptions from resident models over a local unix socket."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+from pathlib import Path
+import socket
+import socketserver
+import sys
+from typing import Any
+
+import numpy as np
+
+from stager.shared import paths
+from stager.transcription.batched_segment_transcriber import BatchedSegmentTranscriber
+from stager.transcription.whisper_model_store import WhisperModelStore
+
+
+@dataclass
+class WhisperDaemon:
+    """Keep Whisper models loaded between CLI runs and exit after ``idle_timeout_s`` without requests."""
+
+    socket_path: Path
+    store: WhisperModelStore
+    idle_timeout_s: float = 600.0
+    _logger: logging.Logger = field(init=False, repr=False)
+    _idle: bool = field(init=False, repr=False, default=False)
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+
+    def serve(self) -> None:
+        if self._socket_in_use():
+            self._logger.info("Whisper daemon already listening on %s", self.socket_path)
+            return
+        self.socket_path.unlink(missing_ok=True)
+        self.socket_path.parent.mkdir(parents=True, exist_ok=True)
+        daemon = self
+
+        class Handler(socketserver.StreamRequestHandler):
+            def handle(self) -> None:
+                line = self.rfile.readline()
+                if not line:
+                    return
+                request = json.loads(line.decode("utf-8"))
+                if "audio_samples" in request:
+                    request["audio"] = np.frombuffer(self.rfile.read(request["audio_samples"] * 4), dtype=np.float32)
+                response = daemon.handle(request)
+                self.wfile.write(json.dumps(response, separators=(",", ":")).encode("utf-8") + b"\n")
+
+        class Server(socketserver.UnixStreamServer):
+            timeout = self.idle_timeout_s
+
+            def handle_timeout(self) -> None:
+                daemon._idle = True
+
+        with Server(str(self.socket_path), Handler) as server:
+            self.socket_path.chmod(0o600)
+            self._logger.info("Whisper daemon listening on %s", self.socket_path)
+            try:
+                # Requests are served one at a time so concurrent clients share one copy of each model.
+                while not self._idle:
+                    server.handle_request()
+            finally:
+                self.socket_path.unlink(missing_ok=True)
+        self._logger.info("Whisper daemon idle for %.0fs; exiting", self.idle_timeout_s)
+
+    def handle(self, request: dict[str, Any]) -> dict[str, Any]:
+        op = request.get("op")
+        try:
+            if op == "ping":
+                return {"ok": True}
+            if op == "load":
+                self.store.load(request["model_name"])
+                return {"ok": True}
+            if op == "transcribe":
+                return {"ok": True, "segments": self._transcribe(request)}
+            if op == "transcribe_batched":
+                return {"ok": True, "words": self._transcribe_batched(request)}
+            if op == "shutdown":
+                self._idle = True
+                return {"ok": True}
+        except Exception as exc:  # noqa: BLE001 - every failure is reported to the client
+            self._logger.exception("Whisper daemon request %s failed", op)
+            return {"ok": False, "error": f"{type(exc).__name__}: {exc}"}
+        return {"ok": False, "error": f"Unknown whisper daemon request: {op}"}
+
+    def _transcribe(self, request: dict[str, Any]) -> list[dict[str, Any]]:
+        model = self.store.load(request["model_name"])
+        if "audio_file" in request:
+            start = int(request["audio_offset"])
+            audio = np.load(request["audio_file"], mmap_mode="r")[start : start + int(request["audio_length"])]
+        else:
+            audio = request["audio"] if "audio" in request else request["audio_path"]
+        segments, _info = model.transcribe(audio, **request.get("options", {}))
+        return [
+            {
+                "text": segment.text,
+                "start": float(segment.start),
+                "end": float(segment.end),
+                "words": None
+                if segment.words is None
+                else [
+                    {"word": word.word, "start": float(word.start), "end": float(word.end)}
+                    for word in segment.words
+                ],
+            }
+            for segment in segments
+        ]
+
+    def _transcribe_batched(self, request: dict[str, Any]) -> list[list[dict]]:
+        transcriber = BatchedSegmentTranscriber(
+            model=self.store.load(request["model_name"]),
+            batch_size=int(request.get("batch_size", 8)),
+        )
+        return transcriber.transcribe(
+            [Path(audio_path) for audio_path in request["audio_paths"]],
+            **request.get("options", {}),
+        )
+
+    def _socket_in_use(self) -> bool:
+        if not self.socket_path.exists():
+            return False
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as probe:
+            try:
+                probe.connect(str(self.socket_path))
+            except OSError:
+                return False
+        return True
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Serve Whisper transcriptions from resident models.")
+    parser.add_argument("--socket", type=Path, required=True, help="Unix socket path to listen on")
+    parser.add_argument("--root", type=Path, default=paths.ROOT, help="Project src directory (locates .whisper)")
+    parser.add_argument("--device", default="cpu")
+    parser.add_argument("--compute-type", default="int8")
+    parser.add_argument("--cpu-threads", type=int, default=0)
+    parser.add_argument("--idle-timeout", type=float, default=600.0, help="Exit after this many idle seconds")
+    args = parser.parse_args()
+
+    logging.basicConfig(level=logging.INFO, stream=sys.stderr, format="%(asctime)s %(levelname)s %(message)s")
+    WhisperDaemon(
+        socket_path=args.socket,
+        store=WhisperModelStore(
+            paths=paths.PathConfig(paths.DEFAULT_PLAY_NAME, root=args.root),
+            device=args.device,
+            compute_type=args.compute_type,
+            local_files_only=True,
+            cpu_threads=args.cpu_threads,
+        ),
+        idle_timeout_s=args.idle_timeout,
+    ).serve()
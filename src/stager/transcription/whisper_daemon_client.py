@@ -0,0 +1,123 @@
+#!/usr/bin/env python3
+"""Talk to a resident Whisper daemon and expose its models like faster-whisper models."""
+from __future__ import annotations
+
+from dataclasses import dataclass
+import json
+from pathlib import Path
+import socket
+from typing import Any
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class RemoteWord:
+    word: str
+    start: float
+    end: float
+
+
+@dataclass(frozen=True)
+class RemoteSegment:
+    text: str
+    start: float
+    end: float
+    words: list[RemoteWord] | None = None
+
+
+@dataclass
+class WhisperDaemonClient:
+    socket_path: Path
+    request_timeout_s: float | None = None
+
+    def is_running(self) -> bool:
+        try:
+            return bool(self.request({"op": "ping"}).get("ok"))
+        except (OSError, RuntimeError, ValueError):
+            # A stale socket, a daemon that hangs up, or a half-written reply all mean "not usable".
+            return False
+
+    def request(self, payload: dict[str, Any], body: bytes | None = None) -> dict[str, Any]:
+        with socket.socket(socket.AF_UNIX, socket.SOCK_STREAM) as connection:
+            connection.settimeout(self.request_timeout_s)
+            connection.connect(str(self.socket_path))
+            with connection.makefile("rwb") as stream:
+                stream.write(json.dumps(payload, separators=(",", ":")).encode("utf-8") + b"\n")
+                if body is not None:
+                    stream.write(body)
+                stream.flush()
+                line = stream.readline()
+        if not line:
+            raise RuntimeError(f"Whisper daemon closed the connection on {self.socket_path}")
+        return json.loads(line.decode("utf-8"))
+
+    def call(self, payload: dict[str, Any], body: bytes | None = None) -> dict[str, Any]:
+        response = self.request(payload, body)
+        if not response.get("ok"):
+            raise RuntimeError(f"Whisper daemon request failed: {response.get('error')}")
+        return response
+
+
+@dataclass
+class RemoteWhisperModel:
+    """Stand-in for ``WhisperModel`` that runs transcriptions inside the daemon."""
+
+    client: WhisperDaemonClient
+    model_name: str
+
+    def load(self) -> None:
+        self.client.call({"op": "load", "model_name": self.model_name})
+
+    def transcribe(self, audio: str | Path | np.ndarray, **options: Any) -> tuple[list[RemoteSegment], None]:
+        payload: dict[str, Any] = {"op": "transcribe", "model_name": self.model_name, "options": options}
+        body = None
+        mapped = self._mapped_range(audio) if isinstance(audio, np.ndarray) else None
+        if mapped is not None:
+            # Arrays from the decoded-audio cache are sent as a file range the daemon maps itself.
+            payload["audio_file"], payload["audio_offset"] = mapped
+            payload["audio_length"] = int(audio.shape[0])
+        elif isinstance(audio, np.ndarray):
+            # Other decoded samples travel as raw float32 after the JSON header line.
+            samples = np.ascontiguousarray(audio, dtype=np.float32)
+            payload["audio_samples"] = int(samples.shape[0])
+            body = samples.tobytes()
+        else:
+            payload["audio_path"] = str(Path(audio).resolve())
+        response = self.client.call(payload, body)
+        segments = [
+            RemoteSegment(
+                text=segment["text"],
+                start=segment["start"],
+                end=segment["end"],
+                words=None
+                if segment["words"] is None
+                else [RemoteWord(**word) for word in segment["words"]],
+            )
+            for segment in response["segments"]
+        ]
+        return segments, None
+
+    @staticmethod
+    def _mapped_range(audio: np.ndarray) -> tuple[str, int] | None:
+        """Return the ``.npy`` file and start sample of a contiguous slice of a memory-mapped float32 array."""
+        if not isinstance(audio, np.memmap) or not audio.filename or audio.ndim != 1:
+            return None
+        if audio.dtype != np.float32 or not audio.flags["C_CONTIGUOUS"] or Path(audio.filename).suffix != ".npy":
+            return None
+        root = audio
+        while isinstance(root.base, np.ndarray):
+            root = root.base
+        return str(Path(audio.filename).resolve()), (audio.ctypes.data - root.ctypes.data) // audio.itemsize
+
+    def transcribe_batched(self, audio_paths: list[Path], batch_size: int, **options: Any) -> list[list[dict]]:
+        response = self.client.call(
+            {
+                "op": "transcribe_batched",
+                "model_name": self.model_name,
+                "audio_paths": [str(path.resolve()) for path in audio_paths],
+                "batch_size": batch_size,
+                "options": options,
+            }
+        )
+        return response["words"]
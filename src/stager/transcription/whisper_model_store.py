@@ -18,9 +18,10 @@ class WhisperModelStore:
     device: str = "cpu"
     compute_type: str = "int8"
     local_files_only: bool = True
+    cpu_threads: int = 0
     _logger: logging.Logger = field(init=False, repr=False)
 
-    _model_cache: ClassVar[dict[tuple[str, str, str, bool, Path], WhisperModel]] = {}
+    _model_cache: ClassVar[dict[tuple[str, str, str, bool, Path, int], WhisperModel]] = {}
 
     def __post_init__(self) -> None:
         self._logger = logging.getLogger(__name__)
@@ -31,7 +32,7 @@ class WhisperModelStore:
 
     def load(self, model_name: str) -> WhisperModel:
         cache_dir = self.cache_dir
-        key = (model_name, self.device, self.compute_type, self.local_files_only, cache_dir)
+        key = (model_name, self.device, self.compute_type, self.local_files_only, cache_dir, self.cpu_threads)
         if key not in self._model_cache:
             cache_dir.mkdir(parents=True, exist_ok=True)
             self._logger.info(
@@ -46,5 +47,6 @@ class WhisperModelStore:
                 compute_type=self.compute_type,
                 download_root=str(cache_dir),
                 local_files_only=self.local_files_only,
+                cpu_threads=self.cpu_threads,
             )
         return self._model_cache[key]
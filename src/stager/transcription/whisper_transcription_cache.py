@@ -10,74 +10,78 @@ from pathlib import Path
 import re
 
 from stager.shared import paths
+from stager.transcription.whisper_cache_store import DEFAULT_MAX_BYTES, WhisperCacheStore
 
 
 @dataclass
 class WhisperTranscriptionCache:
     paths: paths.PathConfig
     cache_version: str = "1"
+    max_bytes: int | None = DEFAULT_MAX_BYTES
     _logger: logging.Logger = field(init=False, repr=False)
-    _cache_dir: Path = field(init=False, repr=False)
+    _store: WhisperCacheStore = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._logger = logging.getLogger(__name__)
-        self._cache_dir = self.paths.build_dir / "whisper_cache"
+        self._store = WhisperCacheStore.for_directory(self.paths.build_dir / "whisper_cache", self.max_bytes)
 
     def load(self, cache_key: dict, audio_path: Path) -> list[dict] | None:
-        entry_path = None
-        for candidate in self._cache_paths(cache_key):
-            if candidate.exists():
-                entry_path = candidate
-                break
-        if entry_path is None:
+        entry_key = self._entry_key(cache_key)
+        meta = self._store.metadata(entry_key)
+        if meta is None:
+            return self._load_legacy(cache_key, audio_path)
+        if not self._matches_recording(meta, audio_path):
             return None
-        payload = json.loads(entry_path.read_text(encoding="utf-8"))
-        if payload.get("cache_version") != self.cache_version:
-            return None
-        stat = audio_path.stat()
-        if payload.get("audio_mtime_ns") != stat.st_mtime_ns:
-            return None
-        if payload.get("audio_size") != stat.st_size:
-            return None
-        words = payload.get("raw_words")
-        if words is None:
-            words = payload.get("words")
+        words = self._store.read(entry_key)
         if words is None:
-            raise RuntimeError(f"Missing cached transcription in {paths.display_path(entry_path)}")
+            return None
         self._logger.debug("Using cached transcription for %s", paths.display_path(audio_path))
         return words
 
     def save(self, cache_key: dict, audio_path: Path, raw_words: list[dict]) -> None:
         stat = audio_path.stat()
-        payload = {
+        meta = {
             "cache_version": self.cache_version,
             "audio_path": str(audio_path),
             "audio_mtime_ns": stat.st_mtime_ns,
             "audio_size": stat.st_size,
+            "role": Path(cache_key.get("audio_path") or audio_path).stem,
             "key": cache_key,
-            "raw_words": raw_words,
         }
-        self._cache_dir.mkdir(parents=True, exist_ok=True)
-        entry_path = self._cache_paths(cache_key)[0]
-        entry_path.write_text(json.dumps(payload, indent=2, sort_keys=True), encoding="utf-8")
-        self._logger.debug("Saved transcription cache %s", paths.display_path(entry_path))
+        entry_key = self._entry_key(cache_key)
+        self._store.put(entry_key, meta, raw_words)
+        self._logger.debug("Saved transcription cache %s", entry_key)
 
-    def _cache_paths(self, cache_key: dict) -> list[Path]:
-        encoded = json.dumps(cache_key, sort_keys=True, separators=(",", ":"))
-        digest = hashlib.sha256(encoded.encode("utf-8")).hexdigest()
-        role_prefix = self._role_prefix(cache_key)
+    def _matches_recording(self, meta: dict, audio_path: Path) -> bool:
+        if meta.get("cache_version") != self.cache_version:
+            return False
+        stat = audio_path.stat()
+        return meta.get("audio_mtime_ns") == stat.st_mtime_ns and meta.get("audio_size") == stat.st_size
+
+    def _load_legacy(self, cache_key: dict, audio_path: Path) -> list[dict] | None:
+        # Older versions wrote one JSON file per transcription; a hit moves it into the store.
+        entry_key = self._entry_key(cache_key)
+        role_prefix = re.sub(r"[^A-Za-z0-9_-]+", "_", Path(cache_key.get("audio_path") or "").stem)
+        candidates = [f"{entry_key}.json"]
         if role_prefix:
-            return [
-                self._cache_dir / f"{role_prefix}-{digest}.json",
-                self._cache_dir / f"{digest}.json",
-            ]
-        return [self._cache_dir / f"{digest}.json"]
+            candidates.insert(0, f"{role_prefix}-{entry_key}.json")
+        for name in candidates:
+            legacy_path = self._store.cache_dir / name
+            if not legacy_path.exists():
+                continue
+            try:
+                payload = json.loads(legacy_path.read_text(encoding="utf-8"))
+            except (OSError, ValueError):
+                return None
+            words = payload.get("raw_words", payload.get("words"))
+            if words is None or not self._matches_recording(payload, audio_path):
+                return None
+            self.save(cache_key, audio_path, words)
+            legacy_path.unlink(missing_ok=True)
+            self._logger.info("Imported legacy transcription cache %s", paths.display_path(legacy_path))
+            return words
+        return None
 
-    def _role_prefix(self, cache_key: dict) -> str | None:
-        audio_path = cache_key.get("audio_path")
-        if not audio_path:
-            return None
-        role = Path(audio_path).stem
-        if not role:
-            return None
-        return re.sub(r"[^A-Za-z0-9_-]+", "_", role)
+    def _entry_key(self, cache_key: dict) -> str:
+        encoded = json.dumps(cache_key, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
@@ -4,6 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 import logging
+from pathlib import Path
 import time
 
 from stager.verification.audio_verifier_diff import AudioVerifierDiff
@@ -24,26 +25,31 @@ class AudioVerifierDiffBuilder:
     problems_window_before: int = 2
     problems_window_after: int = 2
     problems_gap_words: int = 4
-    differ: InlineTextDiffer = field(init=False)
-    problems_differ: InlineTextDiffer = field(init=False)
+    build_root: Path | None = None
+    differ: InlineTextDiffer | None = None
+    problems_differ: InlineTextDiffer | None = None
     _logger: logging.Logger = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._logger = logging.getLogger(__name__)
-        self.differ = InlineTextDiffer(
-            window_before=self.window_before,
-            window_after=self.window_after,
-            name_tokens=self.name_tokens,
-            equivalencies=self.equivalencies,
-            homophone_max_words=self.homophone_max_words,
-        )
-        self.problems_differ = InlineTextDiffer(
-            window_before=self.problems_window_before,
-            window_after=self.problems_window_after,
-            name_tokens=self.name_tokens,
-            equivalencies=self.equivalencies,
-            homophone_max_words=self.homophone_max_words,
-        )
+        if self.differ is None:
+            self.differ = InlineTextDiffer(
+                window_before=self.window_before,
+                window_after=self.window_after,
+                name_tokens=self.name_tokens,
+                equivalencies=self.equivalencies,
+                homophone_max_words=self.homophone_max_words,
+                build_root=self.build_root,
+            )
+        if self.problems_differ is None:
+            self.problems_differ = InlineTextDiffer(
+                window_before=self.problems_window_before,
+                window_after=self.problems_window_after,
+                name_tokens=self.name_tokens,
+                equivalencies=self.equivalencies,
+                homophone_max_words=self.homophone_max_words,
+                build_root=self.build_root,
+            )
 
     def build(self, results: dict) -> list[AudioVerifierDiff]:
         start_time = time.perf_counter()
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from openpyxl.utils import get_column_letter
-
+from stager.shared.xlsx_report_writer import CENTER, RIGHT, WRAP, XlsxReportWriter
 from stager.verification.audio_verifier_diff import AudioVerifierDiff
 from stager.verification.extra_audio_diff import ExtraAudioDiff
 from stager.verification.match_audio_diff import MatchAudioDiff
@@ -81,7 +80,8 @@ class AudioVerifierProblemsSheetBuilder:
 
     def write_sheet(
         self,
-        ws,
+        report: XlsxReportWriter,
+        title: str,
         diffs_by_role: dict[str, list[AudioVerifierDiff]],
         role_order: list[str] | None = None,
         vetted_ids_by_role: dict[str, set[str]] | None = None,
@@ -91,7 +91,26 @@ class AudioVerifierProblemsSheetBuilder:
         include_ignored: bool = False,
         include_problems: bool = False,
     ) -> None:
-        ws.append(self.headers)
+        sheet = report.add_sheet(
+            title,
+            self.headers,
+            widths={
+                "ROLE": 20,
+                "type": 4,
+                "id": 10,
+                "offset": 10,
+                "len": 8,
+                "dc": 5,
+                "diff": 72,
+            },
+            column_styles={
+                "type": CENTER,
+                "offset": RIGHT,
+                "len": RIGHT,
+                "dc": RIGHT,
+                "diff": WRAP,
+            },
+        )
         rows = self.build_rows(
             diffs_by_role,
             role_order=role_order,
@@ -103,8 +122,7 @@ class AudioVerifierProblemsSheetBuilder:
             include_problems=include_problems,
         )
         for row in rows:
-            ws.append([row.get(header, "") for header in self.headers])
-        self._format_columns(ws)
+            sheet.append_row(row)
 
     def _diff_type(self, diff: AudioVerifierDiff) -> str | None:
         if isinstance(diff, ExtraAudioDiff):
@@ -128,37 +146,3 @@ class AudioVerifierProblemsSheetBuilder:
             heard = str(row.get("heard", "")).strip()
             return f"+{heard}" if heard else ""
         return str(row.get("diff", ""))
-
-    def _format_columns(self, ws) -> None:
-        widths = {
-            "ROLE": 20,
-            "type": 4,
-            "id": 10,
-            "offset": 10,
-            "len": 8,
-            "dc": 5,
-            "diff": 72,
-        }
-        for idx, header in enumerate(self.headers, start=1):
-            col_letter = get_column_letter(idx)
-            if header in widths:
-                ws.column_dimensions[col_letter].width = widths[header]
-            if header in {"offset", "len", "dc"}:
-                for cell in ws[col_letter]:
-                    if cell.row == 1:
-                        continue
-                    cell.alignment = cell.alignment.copy(horizontal="right")
-            if header == "type":
-                for cell in ws[col_letter]:
-                    if cell.row == 1:
-                        continue
-                    cell.alignment = cell.alignment.copy(horizontal="center")
-            if header == "diff":
-                for cell in ws[col_letter]:
-                    if cell.row == 1:
-                        continue
-                    cell.alignment = cell.alignment.copy(
-                        horizontal="left",
-                        vertical="top",
-                        wrapText=True,
-                    )
@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from openpyxl.utils import get_column_letter
-
+from stager.shared.xlsx_report_writer import CENTER, RIGHT, WRAP, XlsxReportWriter
 from stager.verification.audio_verifier_diff import AudioVerifierDiff
 
 
@@ -26,42 +25,30 @@ class AudioVerifierSheetBuilder:
                 "expected",
             ]
 
-    def write_sheet(self, ws, diffs: list[AudioVerifierDiff]) -> None:
-        ws.append(self.headers)
+    def write_sheet(self, report: XlsxReportWriter, title: str, diffs: list[AudioVerifierDiff]) -> None:
+        sheet = report.add_sheet(
+            title,
+            self.headers,
+            widths={
+                "status": 4,
+                "id": 10,
+                "offset": 10,
+                "len": 8,
+                "dc": 6,
+                "diff": 36,
+                "heard": 36,
+                "expected": 36,
+            },
+            column_styles={
+                "status": CENTER,
+                "offset": RIGHT,
+                "len": RIGHT,
+                "dc": RIGHT,
+                "diff": WRAP,
+                "heard": WRAP,
+                "expected": WRAP,
+            },
+            header_styles={"status": CENTER},
+        )
         for diff in diffs:
-            row = diff.to_row()
-            ws.append([row.get(header, "") for header in self.headers])
-        self._format_columns(ws)
-
-    def _format_columns(self, ws) -> None:
-        widths = {
-            "status": 4,
-            "id": 10,
-            "offset": 10,
-            "len": 8,
-            "dc": 6,
-            "diff": 36,
-            "heard": 36,
-            "expected": 36,
-        }
-        for idx, header in enumerate(self.headers, start=1):
-            col_letter = get_column_letter(idx)
-            if header in widths:
-                ws.column_dimensions[col_letter].width = widths[header]
-            if header in {"offset", "len", "dc"}:
-                for cell in ws[col_letter]:
-                    if cell.row == 1:
-                        continue
-                    cell.alignment = cell.alignment.copy(horizontal="right")
-            if header == "status":
-                for cell in ws[col_letter]:
-                    cell.alignment = cell.alignment.copy(horizontal="center")
-            if header in {"diff", "heard", "expected"}:
-                for cell in ws[col_letter]:
-                    if cell.row == 1:
-                        continue
-                    cell.alignment = cell.alignment.copy(
-                        horizontal="left",
-                        vertical="top",
-                        wrapText=True,
-                    )
+            sheet.append_row(diff.to_row())
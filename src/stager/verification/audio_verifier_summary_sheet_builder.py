@@ -4,8 +4,7 @@ from __future__ import annotations
 
 from dataclasses import dataclass, field
 
-from openpyxl.utils import get_column_letter
-
+from stager.shared.xlsx_report_writer import RIGHT, XlsxReportWriter
 from stager.verification.audio_verifier_diff import AudioVerifierDiff
 from stager.verification.extra_audio_diff import ExtraAudioDiff
 from stager.verification.match_audio_diff import MatchAudioDiff
@@ -108,13 +107,29 @@ class AudioVerifierSummarySheetBuilder:
 
     def write_sheet(
         self,
-        ws,
+        report: XlsxReportWriter,
+        title: str,
         diffs_by_role: dict[str, list[AudioVerifierDiff]],
         role_order: list[str] | None = None,
         vetted_ids_by_role: dict[str, set[str]] | None = None,
         ignored_ids_by_role: dict[str, set[str]] | None = None,
     ) -> None:
-        ws.append(self.headers)
+        sheet = report.add_sheet(
+            title,
+            self.headers,
+            widths={
+                "role": 20,
+                "match": 8,
+                "delete": 8,
+                "extra": 8,
+                "inline_diffs": 12,
+                "vetted": 8,
+                "ignored": 8,
+                "unvetted": 10,
+                "outstanding": 12,
+            },
+            column_styles={header: RIGHT for header in self.headers if header != "role"},
+        )
         rows = self.build_rows(
             diffs_by_role,
             role_order=role_order,
@@ -122,30 +137,7 @@ class AudioVerifierSummarySheetBuilder:
             ignored_ids_by_role=ignored_ids_by_role,
         )
         for row in rows:
-            ws.append([row.get(header, "") for header in self.headers])
-        self._format_columns(ws)
-
-    def _format_columns(self, ws) -> None:
-        widths = {
-            "role": 20,
-            "match": 8,
-            "delete": 8,
-            "extra": 8,
-            "inline_diffs": 12,
-            "vetted": 8,
-            "ignored": 8,
-            "unvetted": 10,
-            "outstanding": 12,
-        }
-        for idx, header in enumerate(self.headers, start=1):
-            col_letter = get_column_letter(idx)
-            if header in widths:
-                ws.column_dimensions[col_letter].width = widths[header]
-            if header != "role":
-                for cell in ws[col_letter]:
-                    if cell.row == 1:
-                        continue
-                    cell.alignment = cell.alignment.copy(horizontal="right")
+            sheet.append_row(row)
 
     def _diff_id(self, diff: AudioVerifierDiff) -> str:
         if isinstance(diff, MatchAudioDiff):
@@ -5,8 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from openpyxl import Workbook
-
+from stager.shared.xlsx_report_writer import XlsxReportWriter
 from stager.verification.audio_verifier_diff import AudioVerifierDiff
 from stager.verification.audio_verifier_sheet_builder import AudioVerifierSheetBuilder
 from stager.verification.audio_verifier_summary_sheet_builder import AudioVerifierSummarySheetBuilder
@@ -32,11 +31,10 @@ class AudioVerifierWorkbookWriter:
         ignored_ids_by_role: dict[str, set[str]] | None = None,
         problems_ids_by_role: dict[str, set[str]] | None = None,
     ) -> Path:
-        wb = Workbook()
-        summary_ws = wb.active
-        summary_ws.title = "Summary"
+        report = XlsxReportWriter()
         self.summary_builder.write_sheet(
-            summary_ws,
+            report,
+            "Summary",
             diffs_by_role,
             role_order=role_order,
             vetted_ids_by_role=vetted_ids_by_role,
@@ -46,35 +44,35 @@ class AudioVerifierWorkbookWriter:
         vetted_lookup = vetted_ids_by_role or {}
         ignored_lookup = ignored_ids_by_role or {}
         problems_lookup = problems_ids_by_role or {}
-        unprocessed_ws = wb.create_sheet("unprocessed")
         self.problems_builder.write_sheet(
-            unprocessed_ws,
+            report,
+            "unprocessed",
             diffs_by_role,
             role_order=role_order,
             vetted_ids_by_role=vetted_lookup,
             ignored_ids_by_role=ignored_lookup,
             problems_ids_by_role=problems_lookup,
         )
-        problems_ws = wb.create_sheet("problems")
         self.problems_builder.write_sheet(
-            problems_ws,
+            report,
+            "problems",
             diffs_by_role,
             role_order=role_order,
             problems_ids_by_role=problems_lookup,
             include_problems=True,
         )
-        vetted_ws = wb.create_sheet("vetted")
         self.problems_builder.write_sheet(
-            vetted_ws,
+            report,
+            "vetted",
             diffs_by_role,
             role_order=role_order,
             vetted_ids_by_role=vetted_lookup,
             ignored_ids_by_role=ignored_lookup,
             include_vetted=True,
         )
-        ignored_ws = wb.create_sheet("ignored")
         self.problems_builder.write_sheet(
-            ignored_ws,
+            report,
+            "ignored",
             diffs_by_role,
             role_order=role_order,
             ignored_ids_by_role=ignored_lookup,
@@ -85,12 +83,9 @@ class AudioVerifierWorkbookWriter:
         for role in order:
             if role not in diffs_by_role:
                 raise RuntimeError(f"Missing diffs for role {role}")
-            ws = wb.create_sheet(self._sheet_name(role))
-            self.sheet_builder.write_sheet(ws, diffs_by_role[role])
+            self.sheet_builder.write_sheet(report, self._sheet_name(role), diffs_by_role[role])
 
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        wb.save(out_path)
-        return out_path
+        return report.save(out_path)
 
     def _sheet_name(self, role: str) -> str:
         return role[:31]
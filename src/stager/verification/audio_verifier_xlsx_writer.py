@@ -5,8 +5,7 @@ from __future__ import annotations
 from dataclasses import dataclass, field
 from pathlib import Path
 
-from openpyxl import Workbook
-
+from stager.shared.xlsx_report_writer import XlsxReportWriter
 from stager.verification.audio_verifier_diff import AudioVerifierDiff
 from stager.verification.audio_verifier_sheet_builder import AudioVerifierSheetBuilder
 
@@ -17,13 +16,9 @@ class AudioVerifierXlsxWriter:
     sheet_builder: AudioVerifierSheetBuilder = field(default_factory=AudioVerifierSheetBuilder)
 
     def write(self, diffs: list[AudioVerifierDiff], out_path: Path, sheet_name: str = "Verification") -> Path:
-        wb = Workbook()
-        ws = wb.active
-        ws.title = sheet_name[:31]
+        report = XlsxReportWriter()
         builder = self.sheet_builder
         if self.headers is not None:
             builder = AudioVerifierSheetBuilder(headers=self.headers)
-        builder.write_sheet(ws, diffs)
-        out_path.parent.mkdir(parents=True, exist_ok=True)
-        wb.save(out_path)
-        return out_path
+        builder.write_sheet(report, sheet_name, diffs)
+        return report.save(out_path)
@@ -3,7 +3,11 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import ClassVar
+from pathlib import Path
+
+from stager.verification.pronunciation_index import PronunciationIndex
+
+Pronunciations = tuple[set[tuple[str, ...]], set[tuple[str, ...]]]
 
 
 @dataclass
@@ -11,11 +15,10 @@ class HomophoneMatcher:
     max_words: int = 2
     allow_schwa_deletion: bool = True
     schwa_phones: set[str] = field(default_factory=lambda: {"AH0"})
-    _word_cache: dict[str, set[tuple[str, ...]]] = field(default_factory=dict, init=False)
-    _phrase_cache: dict[tuple[str, ...], set[tuple[str, ...]]] = field(
-        default_factory=dict, init=False
-    )
-    _cmu_dict: ClassVar[dict[str, list[list[str]]] | None] = None
+    build_root: Path | None = None
+    _word_cache: dict[str, Pronunciations] = field(default_factory=dict, init=False)
+    _phrase_cache: dict[tuple[str, ...], Pronunciations] = field(default_factory=dict, init=False)
+    _index: PronunciationIndex | None = field(default=None, init=False, repr=False)
 
     def is_homophone(self, expected_words: list[str], actual_words: list[str]) -> bool:
         if not expected_words or not actual_words:
@@ -23,70 +26,61 @@ class HomophoneMatcher:
         if len(expected_words) > self.max_words or len(actual_words) > self.max_words:
             return False
         expected_prons = self._phrase_pronunciations(expected_words)
-        if not expected_prons:
+        if not expected_prons[0]:
             return False
         actual_prons = self._phrase_pronunciations(actual_words)
-        if not actual_prons:
+        if not actual_prons[0]:
             return False
         return self._pronunciations_equivalent(expected_prons, actual_prons)
 
-    def _phrase_pronunciations(self, words: list[str]) -> set[tuple[str, ...]]:
+    def _phrase_pronunciations(self, words: list[str]) -> Pronunciations:
         key = tuple(words)
         cached = self._phrase_cache.get(key)
         if cached is not None:
             return cached
         combos: list[tuple[str, ...]] = [()]
+        stripped_combos: list[tuple[str, ...]] = [()]
         for word in words:
-            pronunciations = self._word_pronunciations(word)
+            pronunciations, stripped = self._word_pronunciations(word)
             if not pronunciations:
                 combos = []
+                stripped_combos = []
                 break
-            next_combos: list[tuple[str, ...]] = []
-            for base in combos:
-                for pron in pronunciations:
-                    next_combos.append(base + pron)
-            combos = next_combos
-        result = set(combos)
+            combos = [base + pron for base in combos for pron in pronunciations]
+            # Stripping drops phones independently, so stripped phrases are joined stripped words.
+            stripped_combos = [base + pron for base in stripped_combos for pron in stripped]
+        result = (set(combos), set(stripped_combos))
         self._phrase_cache[key] = result
         return result
 
-    def _word_pronunciations(self, word: str) -> set[tuple[str, ...]]:
+    def _word_pronunciations(self, word: str) -> Pronunciations:
         key = word.lower()
         cached = self._word_cache.get(key)
         if cached is not None:
             return cached
-        cmu = self._get_cmudict()
-        pronunciations = cmu.get(key, [])
-        result = {tuple(phones) for phones in pronunciations}
+        index = self._get_index()
+        result = (index.pronunciations(key), index.stripped_pronunciations(key))
         self._word_cache[key] = result
         return result
 
     def _pronunciations_equivalent(
         self,
-        expected_prons: set[tuple[str, ...]],
-        actual_prons: set[tuple[str, ...]],
+        expected_prons: Pronunciations,
+        actual_prons: Pronunciations,
     ) -> bool:
-        if not expected_prons.isdisjoint(actual_prons):
+        expected, expected_stripped = expected_prons
+        actual, actual_stripped = actual_prons
+        if not expected.isdisjoint(actual):
             return True
         if not self.allow_schwa_deletion:
             return False
-        expected_stripped = {self._strip_schwa(pron) for pron in expected_prons}
-        actual_stripped = {self._strip_schwa(pron) for pron in actual_prons}
-        if not expected_stripped.isdisjoint(actual_prons):
+        if not expected_stripped.isdisjoint(actual):
             return True
-        if not actual_stripped.isdisjoint(expected_prons):
+        if not actual_stripped.isdisjoint(expected):
             return True
         return not expected_stripped.isdisjoint(actual_stripped)
 
-    def _strip_schwa(self, pronunciation: tuple[str, ...]) -> tuple[str, ...]:
-        if not pronunciation:
-            return pronunciation
-        return tuple(phone for phone in pronunciation if phone not in self.schwa_phones)
-
-    @classmethod
-    def _get_cmudict(cls) -> dict[str, list[list[str]]]:
-        if cls._cmu_dict is None:
-            import cmudict
-
-            cls._cmu_dict = cmudict.dict()
-        return cls._cmu_dict
+    def _get_index(self) -> PronunciationIndex:
+        if self._index is None:
+            self._index = PronunciationIndex.shared(frozenset(self.schwa_phones), build_root=self.build_root)
+        return self._index
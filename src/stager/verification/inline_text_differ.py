@@ -3,7 +3,8 @@
 from __future__ import annotations
 
 from dataclasses import dataclass, field
-from typing import Iterable
+from pathlib import Path
+from typing import Callable, Iterable, TypeVar
 
 from diff_match_patch import diff_match_patch
 
@@ -17,6 +18,9 @@ from stager.verification.spelling_normalizer import SpellingNormalizer
 from stager.verification.equivalencies import Equivalencies
 from stager.verification.homophone_matcher import HomophoneMatcher
 
+T = TypeVar("T")
+TextDiffs = tuple[list[tuple[int, str]], dict[int, str], list[str], list[str], list[str], list[str]]
+
 
 @dataclass
 class InlineTextDiffer:
@@ -28,7 +32,11 @@ class InlineTextDiffer:
     spelling_normalizer: SpellingNormalizer | None = None
     equivalencies: Equivalencies | None = None
     homophone_max_words: int = 2
+    build_root: Path | None = None
     _comparator: TokenComparator = field(init=False, repr=False)
+    # Results are memoized per differ, so builders sharing a differ reuse each other's diffs.
+    _text_diffs: dict[tuple[str, str], TextDiffs] = field(default_factory=dict, init=False, repr=False)
+    _results: dict[tuple[object, ...], object] = field(default_factory=dict, init=False, repr=False)
 
     def __post_init__(self) -> None:
         self._comparator = TokenComparator(
@@ -36,10 +44,59 @@ class InlineTextDiffer:
             name_similarity=self.name_similarity,
             spelling_normalizer=self.spelling_normalizer,
             equivalencies=self.equivalencies,
-            homophone_matcher=HomophoneMatcher(max_words=self.homophone_max_words),
+            homophone_matcher=HomophoneMatcher(max_words=self.homophone_max_words, build_root=self.build_root),
         )
 
     def diff(self, expected: str, actual: str, segment_id: str | None = None) -> InlineTextDiff:
+        return self._memoized(
+            ("diff", expected, actual, segment_id, self.window_before, self.window_after),
+            lambda: self._diff(expected, actual, segment_id),
+        )
+
+    def count_diffs(self, expected: str, actual: str, segment_id: str | None = None) -> int:
+        return self._memoized(
+            ("count", expected, actual, segment_id),
+            lambda: self._count_diffs(expected, actual, segment_id),
+        )
+
+    def windowed_diffs(
+        self,
+        expected: str,
+        actual: str,
+        segment_id: str | None = None,
+        max_gap: int = 1,
+    ) -> list[str]:
+        return self._memoized(
+            ("windowed", expected, actual, segment_id, max_gap, self.window_before, self.window_after),
+            lambda: self._windowed_diffs(expected, actual, segment_id, max_gap),
+        )
+
+    def replacement_pairs(
+        self,
+        expected: str,
+        actual: str,
+        segment_id: str | None = None,
+    ) -> list[InlineTextReplacement]:
+        return self._memoized(
+            ("replacements", expected, actual, segment_id),
+            lambda: self._replacement_pairs(expected, actual, segment_id),
+        )
+
+    def _memoized(self, key: tuple[object, ...], compute: Callable[[], T]) -> T:
+        if key not in self._results:
+            self._results[key] = compute()
+        return self._results[key]
+
+    def _is_identical(self, expected: str, actual: str) -> bool:
+        if expected == actual:
+            return True
+        diffs = self._diffs_for_texts(expected, actual)[0]
+        return all(op == 0 for op, _text in diffs)
+
+    def _diff(self, expected: str, actual: str, segment_id: str | None) -> InlineTextDiff:
+        if self._is_identical(expected, actual):
+            # Matching tokens render as the expected text itself, with no diff windows.
+            return InlineTextDiff(expected=expected, actual=actual, inline_diff=expected, windowed_diffs=[])
         context = self._build_context(expected, actual, segment_id)
         segments, diff_regions = self._build_segments(context)
         inline_diff = "".join(segment["text"] for segment in segments)
@@ -56,7 +113,9 @@ class InlineTextDiffer:
             windowed_diffs=windowed_diffs,
         )
 
-    def count_diffs(self, expected: str, actual: str, segment_id: str | None = None) -> int:
+    def _count_diffs(self, expected: str, actual: str, segment_id: str | None) -> int:
+        if self._is_identical(expected, actual):
+            return 0
         context = self._build_context(expected, actual, segment_id)
         count = 0
         for event in DiffWalker(context):
@@ -84,13 +143,15 @@ class InlineTextDiffer:
             raise RuntimeError(f"Unexpected diff event: {event.op}")
         return count
 
-    def windowed_diffs(
+    def _windowed_diffs(
         self,
         expected: str,
         actual: str,
-        segment_id: str | None = None,
-        max_gap: int = 1,
+        segment_id: str | None,
+        max_gap: int,
     ) -> list[str]:
+        if self._is_identical(expected, actual):
+            return []
         context = self._build_context(expected, actual, segment_id)
         segments, diff_regions = self._build_segments(context)
         return self._build_windowed_diffs(
@@ -100,12 +161,14 @@ class InlineTextDiffer:
             max_gap=max_gap,
         )
 
-    def replacement_pairs(
+    def _replacement_pairs(
         self,
         expected: str,
         actual: str,
-        segment_id: str | None = None,
+        segment_id: str | None,
     ) -> list[InlineTextReplacement]:
+        if self._is_identical(expected, actual):
+            return []
         context = self._build_context(expected, actual, segment_id)
         replacements: list[InlineTextReplacement] = []
         for event in DiffWalker(context):
@@ -151,18 +214,15 @@ class InlineTextDiffer:
             segment_id=segment_id,
         )
 
-    def _diffs_for_texts(
-        self,
-        expected: str,
-        actual: str,
-    ) -> tuple[
-        list[tuple[int, str]],
-        dict[int, str],
-        list[str],
-        list[str],
-        list[str],
-        list[str],
-    ]:
+    def _diffs_for_texts(self, expected: str, actual: str) -> TextDiffs:
+        key = (expected, actual)
+        cached = self._text_diffs.get(key)
+        if cached is None:
+            cached = self._compute_diffs_for_texts(expected, actual)
+            self._text_diffs[key] = cached
+        return cached
+
+    def _compute_diffs_for_texts(self, expected: str, actual: str) -> TextDiffs:
         expected_tokens, expected_types = self._tokenize(expected)
         actual_tokens, actual_types = self._tokenize(actual)
         expected_norm = [
@@ -177,8 +237,11 @@ class InlineTextDiffer:
             expected_norm,
             actual_norm,
         )
-        diffs = self.dmp.diff_main(encoded_expected, encoded_actual)
-        self.dmp.diff_cleanupSemantic(diffs)
+        if encoded_expected == encoded_actual:
+            diffs = [(0, encoded_expected)] if encoded_expected else []
+        else:
+            diffs = self.dmp.diff_main(encoded_expected, encoded_actual)
+            self.dmp.diff_cleanupSemantic(diffs)
         return diffs, id_to_token, expected_tokens, expected_types, actual_tokens, actual_types
 
     def _tokenize(self, text: str) -> tuple[list[str], list[str]]:
@@ -0,0 +1,165 @@
+#!/usr/bin/env python3
+"""Build-once, memory-mapped CMU pronunciation table with precomputed schwa-stripped variants."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import json
+import logging
+import os
+from pathlib import Path
+import shutil
+import sys
+import threading
+from typing import ClassVar
+
+import numpy as np
+
+from stager.shared import paths
+
+INDEX_VERSION = "1"
+PHONES_NAME = "phones.json"
+ARRAY_NAMES = ("words", "pron_offsets", "phone_offsets", "phones", "stripped_offsets", "stripped_phones")
+
+
+@dataclass
+class PronunciationIndex:
+    """Sorted word table pointing into flat phone-id arrays, loaded with ``mmap_mode="r"``."""
+
+    schwa_phones: frozenset[str] = frozenset({"AH0"})
+    cache_dir: Path = field(default_factory=lambda: PronunciationIndex.default_cache_dir())
+    _logger: logging.Logger = field(init=False, repr=False)
+    _arrays: dict[str, np.ndarray] = field(init=False, repr=False)
+    _phone_names: list[str] = field(init=False, repr=False)
+
+    _indexes: ClassVar[dict[tuple[Path, frozenset[str]], PronunciationIndex]] = {}
+    _indexes_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+        index_dir = self.index_dir()
+        if not self._is_complete(index_dir):
+            self._build(index_dir)
+        self._load(index_dir)
+
+    @classmethod
+    def shared(
+        cls,
+        schwa_phones: frozenset[str] = frozenset({"AH0"}),
+        build_root: Path | None = None,
+    ) -> PronunciationIndex:
+        cache_dir = cls.default_cache_dir(build_root)
+        key = (cache_dir.resolve(), frozenset(schwa_phones))
+        with cls._indexes_lock:
+            index = cls._indexes.get(key)
+            if index is None:
+                index = cls(schwa_phones=frozenset(schwa_phones), cache_dir=cache_dir)
+                cls._indexes[key] = index
+            return index
+
+    @staticmethod
+    def default_cache_dir(build_root: Path | None = None) -> Path:
+        # The index does not depend on the play, so it lives beside the play folders of an explicit build root.
+        if build_root is not None:
+            return build_root / "pronunciation_index"
+        return PronunciationIndex.user_cache_dir() / "pronunciation_index"
+
+    @staticmethod
+    def user_cache_dir() -> Path:
+        """Per-user cache directory, so callers without a build root never write into the checkout."""
+        if os.name == "nt" and os.environ.get("LOCALAPPDATA"):
+            return Path(os.environ["LOCALAPPDATA"]) / "stager" / "cache"
+        if sys.platform == "darwin":
+            return Path.home() / "Library" / "Caches" / "stager"
+        return Path(os.environ.get("XDG_CACHE_HOME") or Path.home() / ".cache") / "stager"
+
+    def index_dir(self) -> Path:
+        import cmudict
+
+        schwa = "-".join(sorted(self.schwa_phones)) or "none"
+        return self.cache_dir / f"cmudict-{cmudict.__version__}-{schwa}-v{INDEX_VERSION}"
+
+    def pronunciations(self, word: str) -> set[tuple[str, ...]]:
+        return self._lookup(word, "pron_offsets", "phone_offsets", "phones")
+
+    def stripped_pronunciations(self, word: str) -> set[tuple[str, ...]]:
+        return self._lookup(word, "pron_offsets", "stripped_offsets", "stripped_phones")
+
+    def _lookup(self, word: str, pron_name: str, offsets_name: str, phones_name: str) -> set[tuple[str, ...]]:
+        row = self._row(word)
+        if row is None:
+            return set()
+        pron_offsets = self._arrays[pron_name]
+        phone_offsets = self._arrays[offsets_name]
+        phones = self._arrays[phones_name]
+        names = self._phone_names
+        result: set[tuple[str, ...]] = set()
+        for pron in range(int(pron_offsets[row]), int(pron_offsets[row + 1])):
+            start = int(phone_offsets[pron])
+            end = int(phone_offsets[pron + 1])
+            result.add(tuple(names[phone] for phone in phones[start:end].tolist()))
+        return result
+
+    def _row(self, word: str) -> int | None:
+        words = self._arrays["words"]
+        key = word.lower().encode("utf-8")
+        if not key or len(key) > words.dtype.itemsize:
+            return None
+        row = int(np.searchsorted(words, key))
+        if row < len(words) and words[row] == key:
+            return row
+        return None
+
+    def _is_complete(self, index_dir: Path) -> bool:
+        return (index_dir / PHONES_NAME).exists() and all(
+            (index_dir / f"{name}.npy").exists() for name in ARRAY_NAMES
+        )
+
+    def _load(self, index_dir: Path) -> None:
+        if hasattr(self, "_arrays"):
+            return
+        self._arrays = {name: np.load(index_dir / f"{name}.npy", mmap_mode="r") for name in ARRAY_NAMES}
+        self._phone_names = json.loads((index_dir / PHONES_NAME).read_text(encoding="utf-8"))
+
+    def _build(self, index_dir: Path) -> None:
+        import cmudict
+
+        self._logger.info("Building pronunciation index %s", paths.display_path(index_dir))
+        entries = sorted((word.encode("utf-8"), prons) for word, prons in cmudict.dict().items())
+        phone_ids: dict[str, int] = {}
+        pron_offsets = [0]
+        phone_offsets = [0]
+        stripped_offsets = [0]
+        phones: list[int] = []
+        stripped_phones: list[int] = []
+        for _word, prons in entries:
+            # Duplicate pronunciations collapse here so lookups never rebuild sets from repeats.
+            unique = list(dict.fromkeys(tuple(pron) for pron in prons))
+            for pron in unique:
+                phones.extend(phone_ids.setdefault(phone, len(phone_ids)) for phone in pron)
+                phone_offsets.append(len(phones))
+                stripped_phones.extend(phone_ids[phone] for phone in pron if phone not in self.schwa_phones)
+                stripped_offsets.append(len(stripped_phones))
+            pron_offsets.append(pron_offsets[-1] + len(unique))
+        arrays = {
+            "words": np.array([word for word, _prons in entries], dtype=bytes),
+            "pron_offsets": np.array(pron_offsets, dtype=np.int32),
+            "phone_offsets": np.array(phone_offsets, dtype=np.int32),
+            "phones": np.array(phones, dtype=np.uint8),
+            "stripped_offsets": np.array(stripped_offsets, dtype=np.int32),
+            "stripped_phones": np.array(stripped_phones, dtype=np.uint8),
+        }
+        self._arrays = arrays
+        self._phone_names = list(phone_ids)
+        staging = index_dir.with_name(f".{index_dir.name}.{os.getpid()}.{threading.get_ident()}.tmp")
+        try:
+            staging.mkdir(parents=True, exist_ok=True)
+            for name, array in arrays.items():
+                np.save(staging / f"{name}.npy", array)
+            (staging / PHONES_NAME).write_text(json.dumps(self._phone_names), encoding="utf-8")
+            os.replace(staging, index_dir)
+        except OSError as exc:
+            # Another process may have published the index first; an unwritable cache just stays in memory.
+            if not self._is_complete(index_dir):
+                self._logger.warning("Could not save pronunciation index %s: %s", paths.display_path(index_dir), exc)
+        finally:
+            shutil.rmtree(staging, ignore_errors=True)
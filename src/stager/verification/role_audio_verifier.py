@@ -5,11 +5,12 @@ from __future__ import annotations
 import logging
 import re
 import time
+import wave
 from dataclasses import dataclass, field
 from pathlib import Path
 
+import numpy as np
 from faster_whisper import WhisperModel
-from rapidfuzz import fuzz
 
 from stager.shared import paths
 from stager.scriptwright.production_play_loader import ProductionPlayLoader
@@ -17,7 +18,9 @@ from stager.domain.block import RoleBlock, TitleBlock, DescriptionBlock, Directi
 from stager.domain.play import Play
 from stager.domain.segment import SpeechSegment, SimultaneousSegment, DirectionSegment
 from stager.transcription.whisper_model_store import WhisperModelStore
+from stager.transcription.resident_whisper_model_store import ResidentWhisperModelStore
 from stager.verification.inline_text_differ import InlineTextDiffer
+from stager.verification.token_similarity_cache import TokenSimilarityCache
 from stager.verification.audio_verifier_diff import AudioVerifierDiff
 from stager.verification.audio_verifier_diff_builder import AudioVerifierDiffBuilder
 from stager.verification.audio_verifier_xlsx_writer import AudioVerifierXlsxWriter
@@ -25,6 +28,10 @@ from stager.text.announcer import select_announcer
 from stager.transcription.vad_config import VadConfig
 from stager.verification.equivalencies import Equivalencies
 from stager.transcription.whisper_transcription_cache import WhisperTranscriptionCache
+from stager.transcription.segment_transcription_cache import SegmentTranscriptionCache
+from stager.transcription.batched_segment_transcriber import BatchedSegmentTranscriber
+from stager.transcription.decoded_audio_cache import DecodedAudioCache
+from stager.verification.role_verification_cache import RoleVerificationCache
 
 
 @dataclass
@@ -35,7 +42,7 @@ class RoleAudioVerifier:
     model_name: str = "base.en"
     device: str = "cpu"
     compute_type: str = "int8"
-    whisper_store: WhisperModelStore | None = None
+    whisper_store: WhisperModelStore | ResidentWhisperModelStore | None = None
     vad_filter: bool = True
     vad_config: VadConfig | None = None
     no_speech_threshold: float | None = None
@@ -43,6 +50,11 @@ class RoleAudioVerifier:
     condition_on_previous_text: bool = True
     initial_prompt: str | None = None
     transcription_cache: WhisperTranscriptionCache | None = None
+    segment_transcription: bool = False
+    batch_size: int = 1
+    segment_cache: SegmentTranscriptionCache | None = None
+    decoded_audio: DecodedAudioCache | None = None
+    result_cache: RoleVerificationCache | None = None
     remove_fillers: bool = False
     filler_words: set[str] = field(
         default_factory=lambda: {
@@ -76,6 +88,9 @@ class RoleAudioVerifier:
     _logger: logging.Logger = field(init=False, repr=False)
     _model: WhisperModel | None = field(init=False, repr=False, default=None)
     _inline_differ: InlineTextDiffer = field(init=False, repr=False)
+    _diff_builder: AudioVerifierDiffBuilder = field(init=False, repr=False)
+    results_from_cache: bool = field(init=False, default=False)
+    _token_similarity: TokenSimilarityCache = field(init=False, repr=False, default_factory=TokenSimilarityCache)
     _name_tokens: set[str] = field(init=False, repr=False)
     _equivalencies: Equivalencies = field(init=False, repr=False)
     _punct_re: re.Pattern[str] = field(init=False, repr=False)
@@ -96,6 +111,10 @@ class RoleAudioVerifier:
             )
         if self.transcription_cache is None:
             self.transcription_cache = WhisperTranscriptionCache(paths=self.paths)
+        if self.segment_cache is None:
+            self.segment_cache = SegmentTranscriptionCache(paths=self.paths)
+        if self.decoded_audio is None:
+            self.decoded_audio = DecodedAudioCache(paths=self.paths)
         self._name_tokens = self._build_name_tokens()
         self._equivalencies = self._load_equivalencies()
         self._inline_differ = InlineTextDiffer(
@@ -104,17 +123,48 @@ class RoleAudioVerifier:
             name_tokens=self._name_tokens,
             equivalencies=self._equivalencies,
             homophone_max_words=self.homophone_max_words,
+            build_root=self.paths.build_root,
+        )
+        # One builder per verifier shares the inline differ, so unresolved replacements and
+        # every build_diffs call (console rows, per-role XLSX) reuse the same memoized diffs.
+        self._diff_builder = AudioVerifierDiffBuilder(
+            window_before=self.diff_window_before,
+            window_after=self.diff_window_after,
+            name_tokens=self._name_tokens,
+            equivalencies=self._equivalencies,
+            homophone_max_words=self.homophone_max_words,
+            differ=self._inline_differ,
+            build_root=self.paths.build_root,
         )
 
     def verify(self, recording_path: Path | None = None) -> dict:
-        path = recording_path or (self.paths.recordings_dir / f"{self.role}.wav")
-        self._logger.info("Verifying audio file %s", paths.display_path(path))
-        if not path.exists():
-            raise RuntimeError(f"Recording not found for role {self.role}: {paths.display_path(path)}")
+        if self.segment_transcription:
+            if recording_path is not None:
+                raise RuntimeError("A recording path cannot be combined with segment transcription")
+            path = self.paths.segments_dir / self.role
+            self._logger.info("Verifying segment audio in %s", paths.display_path(path))
+            if not path.is_dir():
+                raise RuntimeError(f"Segment audio not found for role {self.role}: {paths.display_path(path)}")
+        else:
+            path = recording_path or (self.paths.recordings_dir / f"{self.role}.wav")
+            self._logger.info("Verifying audio file %s", paths.display_path(path))
+            if not path.exists():
+                raise RuntimeError(f"Recording not found for role {self.role}: {paths.display_path(path)}")
         expected_segments, script_words, word_to_segment = self._build_expected_words()
         if not expected_segments:
             raise RuntimeError(f"No expected segments found for role {self.role}")
-        audio_words = self._transcribe_words(path)
+        result_key: dict[str, object] | None = None
+        if self.result_cache is not None:
+            result_key = self._build_result_cache_key(path, expected_segments)
+            cached = self.result_cache.load(self.role, result_key)
+            if cached is not None:
+                self._logger.info("Verification inputs unchanged for %s; reusing previous results", self.role)
+                self.results_from_cache = True
+                return cached
+        if self.segment_transcription:
+            audio_words = self._transcribe_segment_words(expected_segments)
+        else:
+            audio_words = self._transcribe_words(path)
         alignment = self._align_words(script_words, audio_words)
         results = self._build_results(
             path,
@@ -131,17 +181,12 @@ class RoleAudioVerifier:
             len(script_words),
             len(audio_words),
         )
+        if self.result_cache is not None and result_key is not None:
+            self.result_cache.save(self.role, result_key, results)
         return results
 
     def build_diffs(self, results: dict) -> list[AudioVerifierDiff]:
-        builder = AudioVerifierDiffBuilder(
-            window_before=self.diff_window_before,
-            window_after=self.diff_window_after,
-            name_tokens=self._name_tokens,
-            equivalencies=self._equivalencies,
-            homophone_max_words=self.homophone_max_words,
-        )
-        return builder.build(results)
+        return self._diff_builder.build(results)
 
     def unresolved_replacements(self, results: dict) -> list[tuple[str, str, str | None]]:
         replacements: list[tuple[str, str, str | None]] = []
@@ -162,9 +207,13 @@ class RoleAudioVerifier:
         return replacements
 
     def _load_equivalencies(self) -> Equivalencies:
-        play_path = self.paths.play_dir / "substitutions.yaml"
-        role_path = self.paths.recordings_dir / f"{self.role}_substitutions.yaml"
-        return Equivalencies.load_many([play_path, role_path])
+        return Equivalencies.load_many(self._equivalency_paths())
+
+    def _equivalency_paths(self) -> list[Path]:
+        return [
+            self.paths.play_dir / "substitutions.yaml",
+            self.paths.recordings_dir / f"{self.role}_substitutions.yaml",
+        ]
 
     def vetted_ids(self) -> set[str]:
         return set(self._equivalencies.vetted_ids)
@@ -367,22 +416,88 @@ class RoleAudioVerifier:
                     vad_label,
                 )
                 return words
+        if self.decoded_audio is None:
+            raise RuntimeError("Decoded audio cache is not configured")
+        raw_words = self._transcribe_raw_words(self.decoded_audio.load(path), vad_parameters)
+        words = self._normalize_transcribed_words(raw_words)
+        if self.transcription_cache is not None:
+            self.transcription_cache.save(cache_key, path, raw_words)
+        elapsed = time.perf_counter() - start_time
+        self._logger.info(
+            "Transcribed %s (%d raw words, %d normalized) in %.2fs (%s)",
+            self.role,
+            len(raw_words),
+            len(words),
+            elapsed,
+            vad_label,
+        )
+        return words
+
+    def _transcribe_segment_words(self, expected_segments: list[dict]) -> list[dict]:
+        """Transcribe each split segment file and join the pieces into one role timeline."""
+        if self.segment_cache is None:
+            raise RuntimeError("Segment transcription cache is not configured")
+        start_time = time.perf_counter()
+        vad_parameters = None
+        if self.vad_filter and self.vad_config is not None:
+            vad_parameters = self.vad_config.to_transcribe_parameters()
+        options = self._build_segment_transcription_options(vad_parameters)
+        segment_paths = [
+            segment_path
+            for segment_path in (self._segment_audio_path(segment["segment_id"]) for segment in expected_segments)
+            if segment_path.exists()
+        ]
+        words_by_path = {segment_path: self.segment_cache.load(options, segment_path) for segment_path in segment_paths}
+        uncached = [segment_path for segment_path, words in words_by_path.items() if words is None]
+        for segment_path, segment_words in zip(uncached, self._transcribe_segment_files(uncached, vad_parameters)):
+            self.segment_cache.save(options, segment_path, segment_words, role=self.role)
+            words_by_path[segment_path] = segment_words
+        raw_words: list[dict] = []
+        offset = 0.0
+        for segment_path in segment_paths:
+            for word in words_by_path[segment_path]:
+                raw_words.append(
+                    {
+                        "word": word["word"],
+                        "start": float(word["start"]) + offset,
+                        "end": float(word["end"]) + offset,
+                    }
+                )
+            offset += self._wav_duration_seconds(segment_path)
+        words = self._normalize_transcribed_words(raw_words)
+        elapsed = time.perf_counter() - start_time
+        self._logger.info(
+            "Transcribed %s by segment (%d transcribed, %d cached, %d normalized words) in %.2fs (%s)",
+            self.role,
+            len(uncached),
+            len(segment_paths) - len(uncached),
+            len(words),
+            elapsed,
+            self._format_vad_label(vad_parameters),
+        )
+        return words
+
+    def _transcribe_segment_files(
+        self,
+        segment_paths: list[Path],
+        vad_parameters: dict[str, float | int | None] | None,
+    ) -> list[list[dict]]:
+        if not segment_paths:
+            return []
+        if self.batch_size <= 1:
+            return [self._transcribe_raw_words(segment_path, vad_parameters) for segment_path in segment_paths]
+        transcriber = BatchedSegmentTranscriber(model=self._load_model(), batch_size=self.batch_size)
+        return transcriber.transcribe(segment_paths, **self._transcribe_kwargs(vad_parameters))
+
+    def _transcribe_raw_words(
+        self,
+        audio: Path | np.ndarray,
+        vad_parameters: dict[str, float | int | None] | None,
+    ) -> list[dict]:
         model = self._load_model()
-        transcribe_kwargs = {
-            "word_timestamps": True,
-            "vad_filter": self.vad_filter,
-            "vad_parameters": vad_parameters,
-            "condition_on_previous_text": self.condition_on_previous_text,
-        }
-        if self.no_speech_threshold is not None:
-            transcribe_kwargs["no_speech_threshold"] = self.no_speech_threshold
-        if self.log_prob_threshold is not None:
-            transcribe_kwargs["log_prob_threshold"] = self.log_prob_threshold
-        if self.initial_prompt is not None:
-            transcribe_kwargs["initial_prompt"] = self.initial_prompt
         segments, _info = model.transcribe(
-            str(path),
-            **transcribe_kwargs,
+            audio if isinstance(audio, np.ndarray) else str(audio),
+            **self._transcribe_kwargs(vad_parameters),
         )
         raw_words: list[dict] = []
         for segment in segments:
@@ -397,19 +512,31 @@ class RoleAudioVerifier:
                         "end": float(word.end),
                     }
                 )
-        words = self._normalize_transcribed_words(raw_words)
-        if self.transcription_cache is not None:
-            self.transcription_cache.save(cache_key, path, raw_words)
-        elapsed = time.perf_counter() - start_time
-        self._logger.info(
-            "Transcribed %s (%d raw words, %d normalized) in %.2fs (%s)",
-            self.role,
-            len(raw_words),
-            len(words),
-            elapsed,
-            vad_label,
-        )
-        return words
+        return raw_words
+
+    def _transcribe_kwargs(self, vad_parameters: dict[str, float | int | None] | None) -> dict[str, object]:
+        transcribe_kwargs: dict[str, object] = {
+            "word_timestamps": True,
+            "vad_filter": self.vad_filter,
+            "vad_parameters": vad_parameters,
+            "condition_on_previous_text": self.condition_on_previous_text,
+        }
+        if self.no_speech_threshold is not None:
+            transcribe_kwargs["no_speech_threshold"] = self.no_speech_threshold
+        if self.log_prob_threshold is not None:
+            transcribe_kwargs["log_prob_threshold"] = self.log_prob_threshold
+        if self.initial_prompt is not None:
+            transcribe_kwargs["initial_prompt"] = self.initial_prompt
+        return transcribe_kwargs
+
+    def _segment_audio_path(self, segment_id: str) -> Path:
+        if segment_id == f"{self.role}_reader":
+            return self.paths.build_dir / "audio" / "readers" / f"{segment_id}.wav"
+        return self.paths.segments_dir / self.role / f"{segment_id}.wav"
+
+    def _wav_duration_seconds(self, path: Path) -> float:
+        with wave.open(str(path), "rb") as wav:
+            return wav.getnframes() / float(wav.getframerate())
 
     def _normalize_transcribed_words(self, raw_words: list[dict]) -> list[dict]:
         words: list[dict] = []
@@ -432,6 +559,8 @@ class RoleAudioVerifier:
         start_time = time.perf_counter()
         script_len = len(script_words)
         audio_len = len(audio_words)
+        script_ids = self._token_similarity.intern_all(script_words)
+        audio_ids = self._token_similarity.intern_all([word["norm"] for word in audio_words])
         dp = [[0.0] * (audio_len + 1) for _ in range(script_len + 1)]
         back = [[""] * (audio_len + 1) for _ in range(script_len + 1)]
 
@@ -445,7 +574,7 @@ class RoleAudioVerifier:
         for i in range(1, script_len + 1):
             expected = script_words[i - 1]
             for j in range(1, audio_len + 1):
-                sim = self._match_similarity(script_words, audio_words, i - 1, j - 1)
+                sim = self._match_similarity(script_ids, audio_ids, i - 1, j - 1)
                 if sim < self.min_match_similarity:
                     score_match = dp[i - 1][j - 1] + self.low_match_penalty
                 else:
@@ -470,7 +599,7 @@ class RoleAudioVerifier:
             if op == "match":
                 i -= 1
                 j -= 1
-                sim = self._match_similarity(script_words, audio_words, i, j) * 100.0
+                sim = self._match_similarity(script_ids, audio_ids, i, j) * 100.0
                 steps.append(
                     {
                         "op": "match",
@@ -830,29 +959,88 @@ class RoleAudioVerifier:
             "transcriber": "faster_whisper",
         }
 
-    def _similarity(self, expected: str, actual: str) -> float:
-        return float(fuzz.token_set_ratio(expected, actual))
+    def _build_result_cache_key(self, path: Path, expected_segments: list[dict]) -> dict[str, object]:
+        vad_parameters = None
+        if self.vad_filter and self.vad_config is not None:
+            vad_parameters = self.vad_config.to_transcribe_parameters()
+        if self.segment_transcription:
+            audio: dict[str, object] = {
+                segment["segment_id"]: RoleVerificationCache.file_digest(self._segment_audio_path(segment["segment_id"]))
+                for segment in expected_segments
+            }
+        else:
+            if self.decoded_audio is None:
+                raise RuntimeError("Decoded audio cache is not configured")
+            audio = {"path": str(path.resolve()), "sha256": self.decoded_audio.audio_digest(path)}
+        return {
+            "cache_version": "1",
+            "code_sha256": RoleVerificationCache.code_digest(),
+            "role": self.role,
+            "recording_path": str(path),
+            "audio": audio,
+            "expected_segments_sha256": RoleVerificationCache.text_digest(
+                [[segment["segment_id"], segment["expected_text"]] for segment in expected_segments]
+            ),
+            "equivalencies": {
+                str(equivalency_path): RoleVerificationCache.file_digest(equivalency_path)
+                for equivalency_path in self._equivalency_paths()
+            },
+            "name_tokens": sorted(self._name_tokens),
+            "transcription": {
+                **self._build_segment_transcription_options(vad_parameters),
+                "segment_transcription": self.segment_transcription,
+                "remove_fillers": self.remove_fillers,
+                "filler_words": sorted(self.filler_words),
+            },
+            "alignment": {
+                "skip_audio_penalty": self.skip_audio_penalty,
+                "skip_text_penalty": self.skip_text_penalty,
+                "match_weight": self.match_weight,
+                "min_match_similarity": self.min_match_similarity,
+                "low_match_penalty": self.low_match_penalty,
+                "next_word_boost_threshold": self.next_word_boost_threshold,
+                "diff_window_before": self.diff_window_before,
+                "diff_window_after": self.diff_window_after,
+                "extra_audio_padding_ms": self.extra_audio_padding_ms,
+                "homophone_max_words": self.homophone_max_words,
+            },
+        }
+
+    def _build_segment_transcription_options(
+        self,
+        vad_parameters: dict[str, float | int | None] | None,
+    ) -> dict[str, object]:
+        # Filler removal happens after transcription, so it is not part of the segment key.
+        return {
+            "model_name": self.model_name,
+            "compute_type": self.compute_type,
+            "vad_filter": self.vad_filter,
+            "vad_parameters": vad_parameters,
+            "initial_prompt": self.initial_prompt,
+            "no_speech_threshold": self.no_speech_threshold,
+            "log_prob_threshold": self.log_prob_threshold,
+            "condition_on_previous_text": self.condition_on_previous_text,
+            "transcriber": "faster_whisper_batched" if self.batch_size > 1 else "faster_whisper",
+        }
 
     def _match_similarity(
         self,
-        script_words: list[str],
-        audio_words: list[dict],
+        script_ids: list[int],
+        audio_ids: list[int],
         script_index: int,
         audio_index: int,
     ) -> float:
-        expected = script_words[script_index]
-        actual = audio_words[audio_index]["norm"]
-        base = self._similarity(expected, actual) / 100.0
+        similarity = self._token_similarity
+        expected = script_ids[script_index]
+        actual = audio_ids[audio_index]
+        base = similarity.token_similarity(expected, actual)
         next_script = script_index + 1
         next_audio = audio_index + 1
-        if next_script < len(script_words) and next_audio < len(audio_words):
-            next_expected = script_words[next_script]
-            next_actual = audio_words[next_audio]["norm"]
-            next_sim = self._similarity(next_expected, next_actual) / 100.0
-            if next_sim >= self.next_word_boost_threshold:
-                bigram_expected = f"{expected} {next_expected}"
-                bigram_actual = f"{actual} {next_actual}"
-                bigram_sim = fuzz.ratio(bigram_expected, bigram_actual) / 100.0
+        if next_script < len(script_ids) and next_audio < len(audio_ids):
+            next_expected = script_ids[next_script]
+            next_actual = audio_ids[next_audio]
+            if similarity.token_similarity(next_expected, next_actual) >= self.next_word_boost_threshold:
+                bigram_sim = similarity.bigram_similarity((expected, next_expected), (actual, next_actual))
                 if bigram_sim > base:
                     return bigram_sim
         return base
@@ -0,0 +1,124 @@
+#!/usr/bin/env python3
+"""Reuse a role's verification results while its recording, script, substitutions and settings are unchanged."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+import hashlib
+import json
+import logging
+import os
+from pathlib import Path
+import threading
+from typing import ClassVar
+
+from stager.shared import paths
+
+HASH_CHUNK_SIZE = 1024 * 1024
+# Results depend on how the verifier aligns, diffs and lays out sheets, so those sources are part of the key.
+CODE_SOURCES = (
+    Path(__file__).resolve().parent,
+    Path(paths.__file__).resolve().parent / "xlsx_report_sheet.py",
+    Path(paths.__file__).resolve().parent / "xlsx_report_writer.py",
+)
+
+
+@dataclass
+class RoleVerificationCache:
+    paths: paths.PathConfig
+    cache_version: str = "1"
+    _logger: logging.Logger = field(init=False, repr=False)
+
+    _code_digest: ClassVar[str | None] = None
+    _code_digest_lock: ClassVar[threading.Lock] = threading.Lock()
+
+    def __post_init__(self) -> None:
+        self._logger = logging.getLogger(__name__)
+
+    @property
+    def cache_dir(self) -> Path:
+        return self.paths.build_dir / "verify_cache"
+
+    def load(self, role: str, key: dict) -> dict | None:
+        cache_path = self._cache_path(role)
+        if not cache_path.exists():
+            return None
+        try:
+            payload = json.loads(cache_path.read_text(encoding="utf-8"))
+        except (OSError, ValueError):
+            self._logger.warning("Ignoring unreadable verification cache %s", paths.display_path(cache_path))
+            return None
+        if payload.get("cache_version") != self.cache_version:
+            return None
+        if payload.get("key_sha256") != self._key_digest(key):
+            return None
+        return payload.get("results")
+
+    def save(self, role: str, key: dict, results: dict) -> None:
+        cache_path = self._cache_path(role)
+        cache_path.parent.mkdir(parents=True, exist_ok=True)
+        payload = {
+            "cache_version": self.cache_version,
+            "key_sha256": self._key_digest(key),
+            "key": key,
+            "results": results,
+        }
+        staging = cache_path.with_name(f".{cache_path.name}.{os.getpid()}.tmp")
+        staging.write_text(json.dumps(payload, sort_keys=True, separators=(",", ":")), encoding="utf-8")
+        os.replace(staging, cache_path)
+        self._logger.debug("Saved verification cache %s", paths.display_path(cache_path))
+
+    def saved_at_ns(self, role: str) -> int | None:
+        """Modification time of the role's cache entry, or None when nothing is cached."""
+        try:
+            return self._cache_path(role).stat().st_mtime_ns
+        except FileNotFoundError:
+            return None
+
+    def clear(self, role: str | None = None) -> int:
+        if not self.cache_dir.exists():
+            return 0
+        cache_paths = [self._cache_path(role)] if role is not None else list(self.cache_dir.glob("*.json"))
+        removed = 0
+        for cache_path in cache_paths:
+            if cache_path.exists():
+                cache_path.unlink()
+                removed += 1
+        return removed
+
+    @staticmethod
+    def file_digest(path: Path) -> str | None:
+        if not path.exists():
+            return None
+        digest = hashlib.sha256()
+        with path.open("rb") as handle:
+            for chunk in iter(lambda: handle.read(HASH_CHUNK_SIZE), b""):
+                digest.update(chunk)
+        return digest.hexdigest()
+
+    @classmethod
+    def code_digest(cls) -> str:
+        """Digest of the verifier, differ and sheet-builder sources; computed once per process."""
+        with cls._code_digest_lock:
+            if cls._code_digest is None:
+                sources = sorted(
+                    path
+                    for source in CODE_SOURCES
+                    for path in (source.glob("*.py") if source.is_dir() else [source])
+                )
+                digest = hashlib.sha256()
+                for path in sources:
+                    digest.update(path.name.encode("utf-8") + b"\0")
+                    digest.update(path.read_bytes())
+                cls._code_digest = digest.hexdigest()
+            return cls._code_digest
+
+    @staticmethod
+    def text_digest(value: object) -> str:
+        encoded = json.dumps(value, sort_keys=True, separators=(",", ":"))
+        return hashlib.sha256(encoded.encode("utf-8")).hexdigest()
+
+    def _key_digest(self, key: dict) -> str:
+        return self.text_digest(key)
+
+    def _cache_path(self, role: str) -> Path:
+        return self.cache_dir / f"{role}.json"
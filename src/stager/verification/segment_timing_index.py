@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""Index segment WAV durations and source offsets from file headers, scanning role folders in parallel."""
+from __future__ import annotations
+
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass, field
+import os
+from pathlib import Path
+from typing import Callable, ClassVar
+import wave
+
+from stager.shared import paths
+
+
+@dataclass
+class SegmentTimingIndex:
+    """Durations are read from WAV headers and memoized by path, mtime and size across instances."""
+
+    segments_dir: Path
+    decode_duration_ms: Callable[[Path], int] | None = None
+    max_workers: int = 8
+    _durations: dict[str, dict[str, int]] = field(init=False, repr=False, default_factory=dict)
+    _offsets: dict[str, dict[str, str]] = field(init=False, repr=False, default_factory=dict)
+
+    _duration_memo: ClassVar[dict[str, tuple[int, int, int]]] = {}
+    _offsets_memo: ClassVar[dict[str, tuple[int, int, dict[str, str]]]] = {}
+
+    def __post_init__(self) -> None:
+        self.refresh()
+
+    def refresh(self) -> None:
+        self._durations = {}
+        self._offsets = {}
+        if not self.segments_dir.is_dir():
+            return
+        with os.scandir(self.segments_dir) as entries:
+            role_dirs = [entry for entry in entries if entry.is_dir()]
+        if not role_dirs:
+            return
+        with ThreadPoolExecutor(max_workers=min(self.max_workers, len(role_dirs))) as pool:
+            for role, durations, offsets in pool.map(self._scan_role, role_dirs):
+                self._durations[role] = durations
+                if offsets is not None:
+                    self._offsets[role] = offsets
+
+    def duration_ms(self, role: str, segment_id: str) -> int | None:
+        return self._durations.get(role, {}).get(segment_id)
+
+    def offset(self, role: str, segment_id: str) -> str | None:
+        return self._offsets.get(role, {}).get(segment_id)
+
+    def offsets(self, role: str) -> dict[str, str]:
+        return self._offsets.get(role, {})
+
+    def _scan_role(self, role_dir: os.DirEntry) -> tuple[str, dict[str, int], dict[str, str] | None]:
+        durations: dict[str, int] = {}
+        offsets: dict[str, str] | None = None
+        with os.scandir(role_dir.path) as entries:
+            for entry in entries:
+                if not entry.is_file():
+                    continue
+                if entry.name == "offsets.txt":
+                    offsets = self._read_offsets(entry)
+                elif entry.name.endswith(".wav"):
+                    durations[entry.name[: -len(".wav")]] = self._read_duration_ms(entry)
+        return role_dir.name, durations, offsets
+
+    def _read_duration_ms(self, entry: os.DirEntry) -> int:
+        stat = entry.stat()
+        memo = self._duration_memo.get(entry.path)
+        if memo is not None and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+        try:
+            with wave.open(entry.path, "rb") as wav:
+                duration_ms = round(1000 * wav.getnframes() / wav.getframerate())
+        except (wave.Error, EOFError) as exc:
+            # Headers the wave module cannot parse (e.g. float or extensible WAVs) are decoded instead.
+            if self.decode_duration_ms is None:
+                raise RuntimeError(f"Unreadable WAV header: {paths.display_path(entry.path)}") from exc
+            duration_ms = self.decode_duration_ms(Path(entry.path))
+        self._duration_memo[entry.path] = (stat.st_mtime_ns, stat.st_size, duration_ms)
+        return duration_ms
+
+    def _read_offsets(self, entry: os.DirEntry) -> dict[str, str]:
+        stat = entry.stat()
+        memo = self._offsets_memo.get(entry.path)
+        if memo is not None and memo[0] == stat.st_mtime_ns and memo[1] == stat.st_size:
+            return memo[2]
+        role_offsets: dict[str, str] = {}
+        for line in Path(entry.path).read_text().splitlines():
+            line = line.strip()
+            if not line or line.startswith("#"):
+                continue
+            parts = line.split()
+            if len(parts) < 2:
+                continue
+            seg_id, ts = parts[0], parts[1]
+            role_offsets[seg_id.replace(":", "_")] = ts
+        self._offsets_memo[entry.path] = (stat.st_mtime_ns, stat.st_size, role_offsets)
+        return role_offsets
@@ -8,6 +8,7 @@ from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Dict, Iterable
 
+import numpy as np
 from pydub import AudioSegment
 
 from stager.shared import paths
@@ -18,6 +19,7 @@ from stager.domain.segment import MetaSegment, DescriptionSegment, DirectionSegm
 from stager.domain.block import RoleBlock, TitleBlock, DescriptionBlock, DirectionBlock
 from stager.audiobook.clip import Clip, CalloutClip, ParallelClips, Silence
 from stager.audio.spacing import CALLOUT_SPACING_MS, SEGMENT_SPACING_MS
+from stager.verification.segment_timing_index import SegmentTimingIndex
 
 logging.basicConfig(level=logging.INFO, format="%(levelname)s: %(message)s")
 
@@ -57,13 +59,16 @@ class SegmentVerifier:
     include_decorations: bool = False
     paths: paths.PathConfig = field(default_factory=paths.current)
     _plan_start_map: Dict[str, float] = field(init=False, default_factory=dict)
-    _offsets_map: Dict[str, Dict[str, str]] = field(init=False, default_factory=dict)
+    _timing: SegmentTimingIndex = field(init=False, repr=False)
 
     def __post_init__(self) -> None:
         if self.play is None:
             self.play = ProductionPlayLoader(paths_config=self.paths).load()
         self._build_plan_start_map()
-        self._load_offsets()
+        self._timing = SegmentTimingIndex(
+            segments_dir=self.paths.segments_dir,
+            decode_duration_ms=self._decoded_duration_ms,
+        )
 
     def gather_expected(self) -> List[Dict]:
         rows: List[Dict] = []
@@ -144,9 +149,10 @@ class SegmentVerifier:
     def compute_rows(self) -> List[Dict]:
         rows = self.gather_expected()
         punct = set(string.punctuation)
-        for row in rows:
+        expected = np.full(len(rows), np.nan)
+        actual = np.full(len(rows), np.nan)
+        for index, row in enumerate(rows):
             role = row["role"] or "_NARRATOR"
-            fpath = self.paths.segments_dir / role / f"{row['id']}.wav"
             row["expected_seconds"] = None
             row["actual_seconds"] = None
             row["percent"] = None
@@ -158,43 +164,24 @@ class SegmentVerifier:
             if text and not all(ch in punct for ch in text):
                 row["expected_seconds"] = expected_duration_seconds(text)
 
-            if fpath.exists():
-                audio = AudioSegment.from_file(fpath)
-                row["actual_seconds"] = round(len(audio) / 1000.0, 1)
-                start_sec = self._plan_start_map.get(row["id"])
-                if start_sec is not None:
-                    row["start"] = self._format_seconds(start_sec)
-                role_key = row["role"] or "_NARRATOR"
-                src_offset = self._offsets_map.get(role_key, {}).get(row["id"])
-                if src_offset:
-                    row["src_offset"] = self._format_seconds(self._parse_timecode(src_offset))
-            else:
+            duration_ms = self._timing.duration_ms(role, row["id"])
+            if duration_ms is None:
                 logging.error("Missing snippet %s for role %s", row["id"], row["role"])
                 row["warning"] = "-"
                 continue
-
+            row["actual_seconds"] = round(duration_ms / 1000.0, 1)
+            start_sec = self._plan_start_map.get(row["id"])
+            if start_sec is not None:
+                row["start"] = self._format_seconds(start_sec)
+            src_offset = self._timing.offset(role, row["id"])
+            if src_offset:
+                row["src_offset"] = self._format_seconds(self._parse_timecode(src_offset))
             if row["expected_seconds"]:
-                exp = round(row["expected_seconds"], 1) if row["expected_seconds"] is not None else None
-                row["expected_seconds"] = exp
-                act = row["actual_seconds"]
-                if exp:
-                    row["percent"] = round((act / exp) * 100.0, 1)
-                    # Apply thresholds; short clips only warn when far below expected.
-                    if act >= 2.0:
-                        if act < self.too_short * exp and exp >= 1.0:
-                            row["warning"] = "<"
-                        elif act > self.too_long * exp:
-                            row["warning"] = ">"
-                    elif exp - act > 3.0:
-                        row["warning"] = "<"
-                    if row["warning"]:
-                        logging.warning(
-                            "%s %s duration off: actual %.2fs vs expected %.2fs",
-                            role,
-                            row["id"],
-                            act,
-                            exp,
-                        )
+                row["expected_seconds"] = round(row["expected_seconds"], 1)
+                expected[index] = row["expected_seconds"]
+                actual[index] = row["actual_seconds"]
+
+        self._apply_duration_checks(rows, expected, actual)
 
         def sort_key(row: Dict):
             pid, bid, sid = parse_id(row["id"])
@@ -227,27 +214,32 @@ class SegmentVerifier:
             norm_id = clip_id.replace(":", "_")
             self._plan_start_map[norm_id] = round(getattr(item, "offset_ms", 0) / 1000.0, 1)
 
-    def _load_offsets(self) -> None:
-        """Load source offsets from per-role offsets.txt files."""
-        if not self.paths.segments_dir.exists():
-            return
-        for role_dir in self.paths.segments_dir.iterdir():
-            if not role_dir.is_dir():
-                continue
-            offsets_path = role_dir / "offsets.txt"
-            if not offsets_path.exists():
-                continue
-            role_offsets: Dict[str, str] = {}
-            for line in offsets_path.read_text().splitlines():
-                line = line.strip()
-                if not line or line.startswith("#"):
-                    continue
-                parts = line.split()
-                if len(parts) < 2:
-                    continue
-                seg_id, ts = parts[0], parts[1]
-                role_offsets[seg_id.replace(":", "_")] = ts
-            self._offsets_map[role_dir.name] = role_offsets
+    def _apply_duration_checks(self, rows: List[Dict], expected: np.ndarray, actual: np.ndarray) -> None:
+        """Fill percent and warnings for every row with both an expected and an actual duration."""
+        checked = ~np.isnan(expected)
+        with np.errstate(invalid="ignore", divide="ignore"):
+            percent = np.round(actual / expected * 100.0, 1)
+            # Apply thresholds; short clips only warn when far below expected.
+            long_enough = checked & (actual >= 2.0)
+            too_short = long_enough & (actual < self.too_short * expected) & (expected >= 1.0)
+            too_long = long_enough & ~too_short & (actual > self.too_long * expected)
+            too_short |= checked & (actual < 2.0) & (expected - actual > 3.0)
+        for index in np.flatnonzero(checked).tolist():
+            rows[index]["percent"] = float(percent[index])
+        for index in np.flatnonzero(too_short | too_long).tolist():
+            row = rows[index]
+            row["warning"] = "<" if too_short[index] else ">"
+            logging.warning(
+                "%s %s duration off: actual %.2fs vs expected %.2fs",
+                row["role"] or "_NARRATOR",
+                row["id"],
+                row["actual_seconds"],
+                row["expected_seconds"],
+            )
+
+    @staticmethod
+    def _decoded_duration_ms(path: Path) -> int:
+        return len(AudioSegment.from_file(path))
 
     @staticmethod
     def _parse_timecode(ts: str) -> float | None:
@@ -352,7 +344,7 @@ def compute_rows(
     ) -> List[Dict]:
     cfg = paths_config or paths.current()
     play = ProductionPlayLoader(paths_config=cfg).load()
-    from callout_director import (
+    from stager.cues.callout_director import (
         ConversationAwareCalloutDirector,
         RoleCalloutDirector,
         NoCalloutDirector,
@@ -0,0 +1,52 @@
+#!/usr/bin/env python3
+"""Interned word ids with memoized fuzzy similarity scores for alignment."""
+from __future__ import annotations
+
+from dataclasses import dataclass, field
+
+from rapidfuzz import fuzz
+
+
+@dataclass
+class TokenSimilarityCache:
+    """Scores are fractions in [0, 1], cached by interned id so each word pair is scored once."""
+
+    _ids: dict[str, int] = field(default_factory=dict, init=False, repr=False)
+    _tokens: list[str] = field(default_factory=list, init=False, repr=False)
+    _token_scores: dict[tuple[int, int], float] = field(default_factory=dict, init=False, repr=False)
+    _bigram_scores: dict[tuple[int, int, int, int], float] = field(default_factory=dict, init=False, repr=False)
+
+    def intern(self, token: str) -> int:
+        token_id = self._ids.get(token)
+        if token_id is None:
+            token_id = len(self._tokens)
+            self._ids[token] = token_id
+            self._tokens.append(token)
+        return token_id
+
+    def intern_all(self, tokens: list[str]) -> list[int]:
+        return [self.intern(token) for token in tokens]
+
+    def token_similarity(self, expected_id: int, actual_id: int) -> float:
+        key = (expected_id, actual_id)
+        score = self._token_scores.get(key)
+        if score is None:
+            if expected_id == actual_id and self._tokens[expected_id]:
+                score = 1.0
+            else:
+                score = fuzz.token_set_ratio(self._tokens[expected_id], self._tokens[actual_id]) / 100.0
+            self._token_scores[key] = score
+        return score
+
+    def bigram_similarity(self, expected_ids: tuple[int, int], actual_ids: tuple[int, int]) -> float:
+        key = expected_ids + actual_ids
+        score = self._bigram_scores.get(key)
+        if score is None:
+            if expected_ids == actual_ids and self._tokens[expected_ids[0]] and self._tokens[expected_ids[1]]:
+                score = 1.0
+            else:
+                expected = f"{self._tokens[expected_ids[0]]} {self._tokens[expected_ids[1]]}"
+                actual = f"{self._tokens[actual_ids[0]]} {self._tokens[actual_ids[1]]}"
+                score = fuzz.ratio(expected, actual) / 100.0
+            self._bigram_scores[key] = score
+        return score
@@ -0,0 +1,64 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from stager.audiobook.audio_plan import AudioPlan
+from stager.audiobook.chapter import Chapter
+from stager.audiobook.clip import CalloutClip, ParallelClips, SegmentClip, Silence
+
+
+def _clip(name: str, length_ms: int, role: str = "ROLE") -> SegmentClip:
+    return SegmentClip(path=Path(f"{name}.wav"), text=name, role=role, clip_id=f"1:1:{name}", length_ms=length_ms)
+
+
+def _part(plan: AudioPlan) -> AudioPlan:
+    part = plan.empty_like()
+    part.addChapter(Chapter(block_id="1:1", title="Act I"))
+    part.addClip(_clip("a", 300), following_silence_ms=100)
+    part.add_parallel([_clip("b", 200, "A"), _clip("c", 500, "B")])
+    part.addClip(CalloutClip(path=Path("callout.wav"), text=None, role=None, clip_id="1:2", length_ms=50))
+    return part
+
+
+def test_items_round_trip_through_columns():
+    plan = _part(AudioPlan())
+
+    assert len(plan) == 5
+    assert plan.duration_ms == 950
+    assert plan[0] == Chapter(block_id="1:1", title="Act I", offset_ms=0)
+    assert plan[1] == _clip("a", 300)
+    assert plan[2] == Silence(100, offset_ms=300)
+    group = plan[3]
+    assert isinstance(group, ParallelClips)
+    assert (group.offset_ms, group.length_ms) == (400, 500)
+    assert [(clip.role, clip.offset_ms) for clip in group.clips] == [("A", 400), ("B", 400)]
+    assert isinstance(plan[-1], CalloutClip)
+    assert plan[-1].offset_ms == 900
+    assert [item.kind for item in plan[1:3]] == ["segment", "silence"]
+
+
+def test_append_plan_shifts_offsets_without_rebuilding_items():
+    plan = AudioPlan()
+    plan.add_silence(1000)
+    plan.append_plan(_part(plan))
+    plan.append_plan(_part(AudioPlan()))
+
+    assert plan.duration_ms == 1000 + 950 * 2
+    assert [item.offset_ms for item in plan] == [0, 1000, 1000, 1300, 1400, 1900, 1950, 1950, 2250, 2350, 2850]
+    assert [clip.offset_ms for clip in plan[9].clips] == [2350, 2350]
+    assert plan[9].clips[1].path == Path("c.wav")
+    assert plan.tables.paths.count(Path("c.wav")) == 1
+
+
+def test_between_returns_items_overlapping_the_range():
+    plan = AudioPlan()
+    plan.append_plan(_part(plan))
+    plan.append_plan(_part(plan))
+
+    window = plan.between(1000, 1400)
+
+    assert [(item.kind, item.offset_ms) for item in window] == [("segment", 950), ("silence", 1250), ("parallel", 1350)]
+    assert window.duration_ms == 1850
+    assert [clip.text for clip in window[-1].clips] == ["b", "c"]
+    assert isinstance(plan.between(950, 951)[0], Chapter)
+    assert len(plan.between(5000, 6000)) == 0
@@ -0,0 +1,104 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pydub import AudioSegment
+
+from stager.audiobook.chapter import Chapter
+from stager.audiobook.chunk_render_cache import ChunkRenderCache
+from stager.audiobook.clip import SegmentClip, Silence
+from stager.audiobook.play_audio_builder import PlayAudioBuilder
+
+
+class CapturingBuilder(PlayAudioBuilder):
+    def __init__(self, **kwargs) -> None:
+        super().__init__(**kwargs)
+        self.exports: list[tuple[AudioSegment, list[tuple[int, int, str]]]] = []
+        self.rendered_chunks = 0
+
+    def export_with_chapters(self, audio, chapters, out_path, fmt, metadata=None, captions_path=None) -> None:
+        self.exports.append((audio, chapters))
+        Path(out_path).write_bytes(b"")
+
+    def _render_items(self, items, mixer, cache):
+        self.rendered_chunks += 1
+        return super()._render_items(items, mixer, cache)
+
+
+def _segment(tmp_path: Path, name: str, duration_ms: int) -> SegmentClip:
+    path = tmp_path / "segments" / f"{name}.wav"
+    path.parent.mkdir(parents=True, exist_ok=True)
+    AudioSegment.silent(duration=duration_ms, frame_rate=8000).export(path, format="wav")
+    return SegmentClip(path=path, text=name, role="ROLE", clip_id=name, length_ms=duration_ms)
+
+
+def _plan(tmp_path: Path, act_two_ms: int) -> list:
+    return [
+        _segment(tmp_path, "intro", 300),
+        Chapter(block_id="1", title="Act I"),
+        _segment(tmp_path, "one", 400),
+        Silence(200),
+        Chapter(block_id="2", title="Act II"),
+        _segment(tmp_path, "two", act_two_ms),
+    ]
+
+
+def test_unchanged_chapters_are_reused_from_the_render_cache(tmp_path: Path) -> None:
+    builder = CapturingBuilder(render_cache=ChunkRenderCache(tmp_path / "render_cache"))
+
+    builder.instantiate_plan(_plan(tmp_path, 500), tmp_path / "play.mp4", audio_format="mp4")
+    assert builder.rendered_chunks == 3
+
+    builder.rendered_chunks = 0
+    builder.instantiate_plan(_plan(tmp_path, 700), tmp_path / "play.mp4", audio_format="mp4")
+
+    assert builder.rendered_chunks == 1
+    audio, chapters = builder.exports[-1]
+    assert len(audio) == 1600
+    assert chapters == [(300, 900, "Act I"), (900, 1600, "Act II")]
+
+
+def test_cached_render_matches_uncached_render(tmp_path: Path) -> None:
+    cached = CapturingBuilder(render_cache=ChunkRenderCache(tmp_path / "render_cache"))
+    uncached = CapturingBuilder()
+    plan = _plan(tmp_path, 500)
+
+    cached.instantiate_plan(plan, tmp_path / "a.mp3", audio_format="mp3")
+    cached.instantiate_plan(plan, tmp_path / "a.mp3", audio_format="mp3")
+    uncached.instantiate_plan(plan, tmp_path / "b.mp3", audio_format="mp3")
+
+    assert cached.rendered_chunks == 3
+    assert cached.exports[-1][0].raw_data == uncached.exports[-1][0].raw_data
+    assert cached.exports[-1][1] == uncached.exports[-1][1]
+
+
+def test_prune_keeps_only_chunks_referenced_by_current_outputs(tmp_path: Path) -> None:
+    render_cache = ChunkRenderCache(tmp_path / "render_cache")
+    builder = CapturingBuilder(render_cache=render_cache)
+
+    builder.instantiate_plan(_plan(tmp_path, 500), tmp_path / "part_1.mp3", audio_format="mp3")
+    builder.instantiate_plan(_plan(tmp_path, 600), tmp_path / "part_2.mp3", audio_format="mp3")
+    builder.instantiate_plan(_plan(tmp_path, 700), tmp_path / "part_1.mp3", audio_format="mp3")
+
+    assert len(list((tmp_path / "render_cache").glob("*.wav"))) == 5
+    assert render_cache.prune() == 1
+    assert len(list((tmp_path / "render_cache").glob("*.wav"))) == 4
+
+    builder.rendered_chunks = 0
+    builder.instantiate_plan(_plan(tmp_path, 600), tmp_path / "part_2.mp3", audio_format="mp3")
+    assert builder.rendered_chunks == 0
+
+
+def test_prune_drops_chunks_of_outputs_that_no_longer_exist(tmp_path: Path) -> None:
+    render_cache = ChunkRenderCache(tmp_path / "render_cache")
+    builder = CapturingBuilder(render_cache=render_cache)
+    builder.instantiate_plan(_plan(tmp_path, 500), tmp_path / "play.mp4", audio_format="mp4")
+    builder.instantiate_plan(_plan(tmp_path, 700), tmp_path / "play.mp3", audio_format="mp3")
+
+    (tmp_path / "play.mp4").unlink()
+
+    assert render_cache.prune() == 1
+    assert len(list((tmp_path / "render_cache" / "outputs").glob("*.json"))) == 1
+    builder.rendered_chunks = 0
+    builder.instantiate_plan(_plan(tmp_path, 700), tmp_path / "play.mp3", audio_format="mp3")
+    assert builder.rendered_chunks == 0
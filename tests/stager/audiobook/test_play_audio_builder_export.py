@@ -0,0 +1,88 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from pydub import AudioSegment
+
+from stager.audiobook import play_audio_builder
+from stager.audiobook.play_audio_builder import PlayAudioBuilder
+
+
+class RecordingRun:
+    def __init__(self) -> None:
+        self.calls: list[tuple[list[str], bytes | None]] = []
+
+    def __call__(self, cmd: list[str], *, input: bytes | None = None, check: bool) -> None:
+        assert check is True
+        self.calls.append((cmd, input))
+
+
+def _audio() -> AudioSegment:
+    return AudioSegment.silent(duration=2500, frame_rate=44100)
+
+
+def _value_after(cmd: list[str], flag: str) -> list[str]:
+    return [cmd[index + 1] for index, arg in enumerate(cmd) if arg == flag]
+
+
+def test_mp4_export_encodes_audio_chapters_captions_and_still_video_in_one_pass(tmp_path: Path, monkeypatch) -> None:
+    run = RecordingRun()
+    monkeypatch.setattr(play_audio_builder.subprocess, "run", run)
+    captions = tmp_path / "captions.vtt"
+    captions.write_text("WEBVTT\n", encoding="utf-8")
+    audio = _audio()
+
+    PlayAudioBuilder().export_with_chapters(
+        audio,
+        [(0, 1000, "Act I"), (1000, 2500, "Act II")],
+        tmp_path / "play.mp4",
+        fmt="mp4",
+        captions_path=captions,
+    )
+
+    assert len(run.calls) == 1
+    cmd, piped = run.calls[0]
+    assert piped == audio.raw_data
+    inputs = _value_after(cmd, "-i")
+    assert inputs[0] == "pipe:0"
+    assert inputs[1].endswith("chapters.txt")
+    assert inputs[2] == "color=size=1280x720:rate=1:color=black:duration=2.500"
+    assert inputs[3] == str(captions)
+    assert cmd[: cmd.index("-i")] == ["ffmpeg", "-y", "-f", "s16le", "-ar", "44100", "-ac", "1"]
+    assert _value_after(cmd, "-map") == ["0:a:0", "2:v:0", "3:s:0"]
+    assert _value_after(cmd, "-map_chapters") == ["1"]
+    assert _value_after(cmd, "-c:v") == ["libx264"]
+    assert _value_after(cmd, "-r") == ["1"]
+    assert _value_after(cmd, "-c:s") == ["mov_text"]
+    assert cmd[-1] == str(tmp_path / "play.mp4")
+
+
+def test_mp3_export_has_no_video_track_and_keeps_id3_tags(tmp_path: Path, monkeypatch) -> None:
+    run = RecordingRun()
+    monkeypatch.setattr(play_audio_builder.subprocess, "run", run)
+
+    PlayAudioBuilder().export_with_chapters(
+        _audio(),
+        [],
+        tmp_path / "part.mp3",
+        fmt="mp3",
+        metadata={"title": "ACT I"},
+    )
+
+    cmd, _piped = run.calls[0]
+    assert _value_after(cmd, "-i") == ["pipe:0"]
+    assert "lavfi" not in cmd
+    assert _value_after(cmd, "-c:a") == ["libmp3lame"]
+    assert _value_after(cmd, "-metadata") == ["title=ACT I"]
+    assert _value_after(cmd, "-id3v2_version") == ["3"]
+
+
+def test_wav_export_writes_pcm_without_ffmpeg(tmp_path: Path, monkeypatch) -> None:
+    run = RecordingRun()
+    monkeypatch.setattr(play_audio_builder.subprocess, "run", run)
+    out_path = tmp_path / "play.wav"
+
+    PlayAudioBuilder().export_with_chapters(_audio(), [(0, 2500, "Act I")], out_path, fmt="wav")
+
+    assert run.calls == []
+    assert len(AudioSegment.from_wav(out_path)) == 2500
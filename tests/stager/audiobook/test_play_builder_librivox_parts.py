@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+import threading
+from pathlib import Path
+
+import pytest
+
+from stager.audiobook.audio_play_build_service import AudioPlayBuildService
+from stager.audiobook.play_builder import PlayBuilder
+from stager.loudnorm import normalizer as normalizer_module
+from stager.shared import paths
+
+
+def _config(tmp_path: Path) -> paths.PathConfig:
+    return paths.PathConfig(
+        play_name="test",
+        build_root=tmp_path / "build",
+        plays_dir=tmp_path / "plays",
+        snippets_dir=tmp_path / "snippets",
+    )
+
+
+class RecordingProgress:
+    def __init__(self) -> None:
+        self.events: list[str | None] = []
+
+    def advance(self, description: str | None = None) -> None:
+        self.events.append(description)
+
+
+class BarrierAudioBuilder:
+    """Each render waits for the others, so a sequential build would time out."""
+
+    def __init__(self, parties: int) -> None:
+        self.barrier = threading.Barrier(parties, timeout=5)
+        self.rendered: list[Path] = []
+
+    def instantiate_plan(self, plan, out_path: Path, **kwargs) -> None:
+        self.barrier.wait()
+        self.rendered.append(out_path)
+
+
+def test_librivox_parts_render_in_parallel_and_report_in_part_order(tmp_path: Path) -> None:
+    outputs = [tmp_path / f"play_{part_no}_shaw_128kb.mp3" for part_no in range(3)]
+    audio_builder = BarrierAudioBuilder(parties=3)
+    progress = RecordingProgress()
+    builder = PlayBuilder(paths=_config(tmp_path), audio_builder=audio_builder, progress_reporter=progress, jobs=3)
+
+    builder._render_librivox_parts([([], out_path, {}) for out_path in outputs])
+
+    assert sorted(audio_builder.rendered) == outputs
+    assert progress.events == [f"Rendered {out_path.name}" for out_path in outputs]
+
+
+def test_librivox_part_failure_is_raised(tmp_path: Path) -> None:
+    class FailingAudioBuilder:
+        def instantiate_plan(self, plan, out_path: Path, **kwargs) -> None:
+            if out_path.name.endswith("_1.mp3"):
+                raise RuntimeError("encode failed")
+
+    builder = PlayBuilder(paths=_config(tmp_path), audio_builder=FailingAudioBuilder(), jobs=2)
+
+    with pytest.raises(RuntimeError, match="encode failed"):
+        builder._render_librivox_parts([([], tmp_path / f"part_{part_no}.mp3", {}) for part_no in range(3)])
+
+
+def test_outputs_are_normalized_in_parallel(tmp_path: Path, monkeypatch) -> None:
+    outputs = [tmp_path / "audioplay" / f"part_{part_no}.mp3" for part_no in range(3)]
+    barrier = threading.Barrier(len(outputs), timeout=5)
+    normalized: list[tuple[str, str]] = []
+
+    def fake_normalize(self, input_file: str, output_file: str | None = None):
+        barrier.wait()
+        normalized.append((input_file, output_file))
+
+    monkeypatch.setattr(normalizer_module.Normalizer, "normalize", fake_normalize)
+    progress = RecordingProgress()
+    service = AudioPlayBuildService(paths=_config(tmp_path), progress_reporter=progress, jobs=3)
+
+    service._normalize_outputs(outputs)
+
+    assert sorted(normalized) == [(str(path), str(path.parent / "normalized" / path.name)) for path in outputs]
+    assert progress.events == [f"Normalized {path.name}" for path in outputs]
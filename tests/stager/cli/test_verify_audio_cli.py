@@ -0,0 +1,31 @@
+from __future__ import annotations
+
+import os
+from pathlib import Path
+
+from stager.cli import build
+from stager.shared import paths
+from stager.verification.role_verification_cache import RoleVerificationCache
+
+
+def test_cached_workbook_is_kept_only_when_written_after_the_results(tmp_path: Path) -> None:
+    cfg = paths.PathConfig(
+        play_name="androcles",
+        build_root=tmp_path / "build",
+        plays_dir=tmp_path / "plays",
+        snippets_dir=tmp_path / "snippets",
+    )
+    result_cache = RoleVerificationCache(paths=cfg)
+    out_path = tmp_path / "CENTURION_audio_verification.xlsx"
+    out_path.write_bytes(b"workbook")
+
+    assert not build._written_after_cache(out_path, result_cache, "CENTURION")
+
+    result_cache.save("CENTURION", {"role": "CENTURION"}, {"segments": []})
+    saved_at_ns = result_cache.saved_at_ns("CENTURION")
+    os.utime(out_path, ns=(saved_at_ns - 1_000_000_000, saved_at_ns - 1_000_000_000))
+    assert not build._written_after_cache(out_path, result_cache, "CENTURION")
+
+    os.utime(out_path, ns=(saved_at_ns, saved_at_ns))
+    assert build._written_after_cache(out_path, result_cache, "CENTURION")
+    assert not build._written_after_cache(out_path, None, "CENTURION")
@@ -11,6 +11,8 @@ from stager.domain.block_id import BlockId
 from stager.domain.play import Play, ReadingMetadata, SourceTextMetadata
 from stager.domain.segment import BlockingSegment, DescriptionSegment, DirectionSegment, MetaSegment, SimultaneousSegment, SpeechSegment
 from stager.domain.segment_id import SegmentId
+from stager.linerecorder.recording_context import RecordingContext
+from stager.linerecorder.recording_context_index import RecordingContextIndex
 from stager.linerecorder.recording_request_builder import RecordingRequestBuilder
 from stager.production_publication.production_publisher import ProductionPublisher
 from stager.production_publication.production_version_store import ProductionVersionStore
@@ -562,3 +564,54 @@ I-2 MEGAERA: I won't go another step.
 """,
         encoding="utf-8",
     )
+
+
+def test_recording_request_builders_share_context_index_across_roles(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    play = _play(
+        [
+            _title_block(),
+            _speech_block(0, 1, "ANDROCLES", "Well, dear, do you want to see one?"),
+            _blocking_block(0, 2, ["MEGAERA"], "Cross to the milestone."),
+            _speech_block(0, 3, "MEGAERA", "I won't go another step."),
+            _direction_block(0, 4, "He sits."),
+            _speech_block(0, 5, "ANDROCLES", "Then stay here."),
+            _speech_block(0, 6, "MEGAERA", "I will go back."),
+        ]
+    )
+    context_index = RecordingContextIndex(play)
+
+    for role in ("ANDROCLES", "MEGAERA"):
+        shared = RecordingRequestBuilder(
+            play=play,
+            paths=cfg,
+            role=role,
+            created_at="2026-05-10T14:00:00Z",
+            context_index=context_index,
+        ).build_manifest().to_dict()
+        standalone = RecordingRequestBuilder(
+            play=play,
+            paths=cfg,
+            role=role,
+            created_at="2026-05-10T14:00:00Z",
+        ).build_manifest().to_dict()
+        assert shared == standalone
+
+    assert [block.production_id for block in context_index.role_blocks("MEGAERA")] == ["I-3", "I-6"]
+    megaera_line = context_index.role_blocks("MEGAERA")[1]
+    assert context_index.previous_context(megaera_line) == RecordingContext(speaker="ANDROCLES", text="Then stay here.")
+    assert context_index.next_context(megaera_line) is None
+
+
+def test_recording_request_builder_rejects_context_index_for_other_play(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    play = _play([_title_block(), _speech_block(0, 1, "MEGAERA", "I won't go another step.")])
+    other_play = _play([_title_block(), _speech_block(0, 1, "MEGAERA", "I won't go another step.")])
+
+    with pytest.raises(ValueError, match="different play"):
+        RecordingRequestBuilder(
+            play=play,
+            paths=cfg,
+            role="MEGAERA",
+            context_index=RecordingContextIndex(other_play),
+        )
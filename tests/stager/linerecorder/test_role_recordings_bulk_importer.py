@@ -0,0 +1,188 @@
+from __future__ import annotations
+
+import io
+import json
+from pathlib import Path
+import subprocess
+import wave
+import zipfile
+
+import pytest
+
+from stager.domain.block import RoleBlock
+from stager.domain.block_id import BlockId
+from stager.domain.play import Play
+from stager.domain.segment import SpeechSegment
+from stager.domain.segment_id import SegmentId
+from stager.linerecorder.role_recordings_bulk_importer import RoleRecordingsBulkImporter
+from stager.linerecorder.role_recordings_importer import RoleRecordingsImporter
+from stager.shared import paths
+
+
+def _cfg(tmp_path: Path) -> paths.PathConfig:
+    return paths.PathConfig(
+        play_name="androcles",
+        build_root=tmp_path / "build",
+        plays_dir=tmp_path / "plays",
+        snippets_dir=tmp_path / "snippets",
+    )
+
+
+def test_bulk_importer_imports_every_package_and_writes_one_summary(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    inbox = tmp_path / "inbox"
+    _write_role_package(inbox / "CENTURION.role-recordings.zip", role="CENTURION", block_no=1)
+    _write_role_package(inbox / "LAVINIA.role-recordings.zip", role="LAVINIA", block_no=2)
+
+    importer = RoleRecordingsBulkImporter(paths=cfg, play=_play(), jobs=2)
+    result = importer.import_packages(RoleRecordingsBulkImporter.package_paths(inbox))
+
+    assert [import_result.role for import_result in result.results] == ["CENTURION", "LAVINIA"]
+    assert result.failures == []
+    assert (cfg.segments_dir / "CENTURION" / "0_1_1.wav").exists()
+    assert (cfg.segments_dir / "LAVINIA" / "0_2_1.wav").exists()
+    summary = json.loads(result.summary_path.read_text(encoding="utf-8"))
+    assert [entry["role_id"] for entry in summary["imported"]] == ["CENTURION", "LAVINIA"]
+    assert summary["failed"] == []
+
+
+def test_bulk_importer_reports_failed_packages_without_blocking_others(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    inbox = tmp_path / "inbox"
+    _write_role_package(inbox / "CENTURION.role-recordings.zip", role="CENTURION", block_no=1)
+    _write_role_package(inbox / "GHOST.role-recordings.zip", role="GHOST", block_no=9)
+
+    result = RoleRecordingsBulkImporter(paths=cfg, play=_play(), jobs=2).import_packages(
+        RoleRecordingsBulkImporter.package_paths(str(inbox / "*.role-recordings.zip"))
+    )
+
+    assert [import_result.role for import_result in result.results] == ["CENTURION"]
+    assert [failure.package_path.name for failure in result.failures] == ["GHOST.role-recordings.zip"]
+    assert "Unknown role 'GHOST'" in result.failures[0].message
+    summary = json.loads(result.summary_path.read_text(encoding="utf-8"))
+    assert summary["failed"][0]["message"] == result.failures[0].message
+
+
+def test_bulk_importer_records_unexpected_failures_in_summary(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    inbox = tmp_path / "inbox"
+    _write_role_package(inbox / "CENTURION.role-recordings.zip", role="CENTURION", block_no=1)
+    with zipfile.ZipFile(inbox / "CORRUPT.role-recordings.zip", "w") as archive:
+        archive.writestr("manifest.json", "{not json")
+
+    result = RoleRecordingsBulkImporter(paths=cfg, play=_play(), jobs=2).import_packages(
+        RoleRecordingsBulkImporter.package_paths(inbox)
+    )
+
+    assert [import_result.role for import_result in result.results] == ["CENTURION"]
+    assert [failure.package_path.name for failure in result.failures] == ["CORRUPT.role-recordings.zip"]
+    assert "Invalid manifest.json" in result.failures[0].message
+    summary = json.loads(result.summary_path.read_text(encoding="utf-8"))
+    assert [entry["role_id"] for entry in summary["imported"]] == ["CENTURION"]
+    assert summary["failed"][0]["message"] == result.failures[0].message
+
+
+def test_bulk_importer_records_non_runtime_errors_in_summary(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    cfg = _cfg(tmp_path)
+    inbox = tmp_path / "inbox"
+    _write_role_package(inbox / "CENTURION.role-recordings.zip", role="CENTURION", block_no=1)
+    _write_role_package(inbox / "LAVINIA.role-recordings.zip", role="LAVINIA", block_no=2)
+    original_import = RoleRecordingsImporter.import_package
+
+    def _import_package(self, package_path, processing_options=None):
+        if package_path.name.startswith("LAVINIA"):
+            raise subprocess.CalledProcessError(1, ["ffmpeg"])
+        return original_import(self, package_path, processing_options)
+
+    monkeypatch.setattr(RoleRecordingsImporter, "import_package", _import_package)
+
+    result = RoleRecordingsBulkImporter(paths=cfg, play=_play(), jobs=2).import_packages(
+        RoleRecordingsBulkImporter.package_paths(inbox)
+    )
+
+    assert [import_result.role for import_result in result.results] == ["CENTURION"]
+    assert result.failures[0].message.startswith("CalledProcessError:")
+    summary = json.loads(result.summary_path.read_text(encoding="utf-8"))
+    assert summary["failed"][0]["package"].endswith("LAVINIA.role-recordings.zip")
+
+
+def test_bulk_importer_rejects_two_packages_for_one_role(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    first = tmp_path / "first.role-recordings.zip"
+    second = tmp_path / "second.role-recordings.zip"
+    _write_role_package(first, role="CENTURION", block_no=1)
+    _write_role_package(second, role="CENTURION", block_no=1)
+
+    with pytest.raises(RuntimeError, match="Multiple role recordings packages for the same role"):
+        RoleRecordingsBulkImporter(paths=cfg, play=_play()).import_packages([first, second])
+
+    assert not (cfg.segments_dir / "CENTURION" / "0_1_1.wav").exists()
+
+
+def _write_role_package(package_path: Path, *, role: str, block_no: int) -> None:
+    segment_id = f"0_{block_no}_1"
+    audio_path = f"audio/segments/{role}/{segment_id}.wav"
+    manifest = {
+        "schema_version": 1,
+        "package_type": "role_recordings",
+        "complete": True,
+        "play": {"id": "androcles", "title": "Androcles and the Lion"},
+        "role": {"id": role, "display_name": role.title()},
+        "recordings": [
+            {
+                "id": f"I-{block_no}:s1",
+                "line_id": f"I-{block_no}",
+                "block_id": f"0.{block_no}",
+                "segment_id": segment_id,
+                "audio_path": audio_path,
+                "recorded_at": "2026-05-11T12:00:00Z",
+                "duration_ms": 1000,
+                "sample_rate_hz": 48000,
+                "channels": 1,
+                "status": "accepted",
+            }
+        ],
+        "missing_segment_ids": [],
+    }
+    package_path.parent.mkdir(parents=True, exist_ok=True)
+    with zipfile.ZipFile(package_path, "w") as archive:
+        archive.writestr("manifest.json", json.dumps(manifest))
+        archive.writestr(audio_path, _wav_bytes())
+
+
+def _wav_bytes() -> bytes:
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(48000)
+        wav.writeframes((1000).to_bytes(2, "little", signed=True) * 48000)
+    return buffer.getvalue()
+
+
+def _play() -> Play:
+    return Play(
+        blocks=[
+            _role_block(1, "CENTURION", "Halt!"),
+            _role_block(2, "LAVINIA", "We will not."),
+        ]
+    )
+
+
+def _role_block(block_no: int, role: str, text: str) -> RoleBlock:
+    block_id = BlockId(0, block_no)
+    return RoleBlock(
+        block_id=block_id,
+        role_names=[role],
+        callout=role,
+        text=text,
+        segments=[
+            SpeechSegment(
+                segment_id=SegmentId(block_id, 1),
+                text=text,
+                role=role,
+                production_id=f"I-{block_no}:s1",
+            )
+        ],
+        production_id=f"I-{block_no}",
+    )
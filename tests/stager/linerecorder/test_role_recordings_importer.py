@@ -1,5 +1,6 @@
 from __future__ import annotations
 
+import hashlib
 import io
 import json
 from pathlib import Path
@@ -8,6 +9,7 @@ import zipfile
 
 import pytest
 
+from stager.audio.audio_cleanup_promoter import AudioCleanupPromoter
 from stager.domain.block import RoleBlock
 from stager.domain.block_id import BlockId
 from stager.domain.play import Play
@@ -223,6 +225,85 @@ def test_role_recordings_importer_records_new_segment_without_backup(tmp_path: P
     assert not (result.transaction_manifest_path.parent / "backups").exists()
 
 
+def test_role_recordings_importer_extracts_each_take_once_and_links_target(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    package_path = tmp_path / "CENTURION.role-recordings.zip"
+    wav_with_trailing_chunk = _wav_bytes() + b"LIST\x04\x00\x00\x00INFO"
+    _write_package(
+        package_path,
+        manifest=_role_recordings_manifest(format_version="1.0.0"),
+        files={"audio/segments/CENTURION/0_12_1.wav": wav_with_trailing_chunk},
+    )
+
+    result = RoleRecordingsImporter(paths=cfg).import_package(package_path)
+
+    transaction_dir = result.transaction_manifest_path.parent
+    target_path = cfg.segments_dir / "CENTURION" / "0_12_1.wav"
+    incoming_path = transaction_dir / "incoming" / "audio" / "segments" / "CENTURION" / "0_12_1.wav"
+    original_path = transaction_dir / "original" / "audio" / "segments" / "CENTURION" / "0_12_1.wav"
+    transaction = json.loads(result.transaction_manifest_path.read_text(encoding="utf-8"))
+    assert target_path.read_bytes() == wav_with_trailing_chunk
+    assert target_path.samefile(incoming_path)
+    assert original_path.samefile(incoming_path)
+    assert transaction["imported"][0]["sha256"] == hashlib.sha256(wav_with_trailing_chunk).hexdigest()
+
+
+def test_role_recordings_importer_history_survives_cleanup_promotion(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    package_path = tmp_path / "CENTURION.role-recordings.zip"
+    _write_package(
+        package_path,
+        manifest=_role_recordings_manifest(format_version="1.0.0"),
+        files={"audio/segments/CENTURION/0_12_1.wav": _wav_bytes()},
+    )
+    result = RoleRecordingsImporter(paths=cfg).import_package(package_path)
+    cleaned_path = tmp_path / "cleaned" / "0_12_1.wav"
+    cleaned_path.parent.mkdir(parents=True)
+    cleaned_path.write_bytes(b"CLEANED")
+    review_path = cfg.audio_out_dir / "cleaned" / "cleanup_review.json"
+    review_path.parent.mkdir(parents=True, exist_ok=True)
+    review_path.write_text(
+        json.dumps(
+            {
+                "entries": [
+                    {
+                        "role": "CENTURION",
+                        "segment_id": "0_12_1",
+                        "batch_id": "CENTURION-none",
+                        "output_path": str(cleaned_path),
+                    }
+                ]
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    AudioCleanupPromoter(paths_config=cfg).promote(confirm=True)
+
+    transaction_dir = result.transaction_manifest_path.parent
+    segment_path = Path("audio") / "segments" / "CENTURION" / "0_12_1.wav"
+    assert (cfg.segments_dir / "CENTURION" / "0_12_1.wav").read_bytes() == b"CLEANED"
+    assert (transaction_dir / "original" / segment_path).read_bytes() == _wav_bytes()
+    assert (transaction_dir / "incoming" / segment_path).read_bytes() == _wav_bytes()
+    assert not (cfg.segments_dir / "CENTURION" / "0_12_1.wav").samefile(transaction_dir / "incoming" / segment_path)
+
+
+def test_role_recordings_importer_removes_transaction_when_take_is_unreadable(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    package_path = tmp_path / "CENTURION.role-recordings.zip"
+    _write_package(
+        package_path,
+        manifest=_role_recordings_manifest(format_version="1.0.0"),
+        files={"audio/segments/CENTURION/0_12_1.wav": b"not a wav"},
+    )
+
+    with pytest.raises(RuntimeError, match="Unreadable WAV"):
+        RoleRecordingsImporter(paths=cfg).import_package(package_path)
+
+    assert list((cfg.build_dir / "linerecorder" / "imports").iterdir()) == []
+    assert not (cfg.segments_dir / "CENTURION" / "0_12_1.wav").exists()
+
+
 def test_role_recordings_importer_processes_recordings_with_floor_noise(tmp_path: Path) -> None:
     cfg = _cfg(tmp_path)
     package_path = tmp_path / "CENTURION.role-recordings.zip"
@@ -289,6 +370,57 @@ def test_role_recordings_importer_processes_recordings_with_floor_noise(tmp_path
     assert "original_path" in transaction["imported"][0]
 
 
+def test_role_recordings_importer_processes_takes_in_parallel_in_manifest_order(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    package_path = tmp_path / "CENTURION.role-recordings.zip"
+    _write_package(
+        package_path,
+        manifest=_multi_take_manifest(["0_12_1", "0_13_1", "0_14_1"]),
+        files={f"audio/segments/CENTURION/{segment_id}.wav": _wav_bytes() for segment_id in ["0_12_1", "0_13_1", "0_14_1"]},
+    )
+    audio_processor = FakeAudioProcessor()
+    importer = RoleRecordingsImporter(paths=cfg, audio_processor=audio_processor, processing_workers=3)
+
+    result = importer.import_package(
+        package_path,
+        processing_options=RecordingImportProcessingOptions(trim_silence=True),
+    )
+
+    assert len(audio_processor.calls) == 3
+    assert [path.name for path in result.written_paths] == ["0_12_1.wav", "0_13_1.wav", "0_14_1.wav"]
+    transaction = json.loads(result.transaction_manifest_path.read_text(encoding="utf-8"))
+    assert [item["segment_id"] for item in transaction["imported"]] == ["0_12_1", "0_13_1", "0_14_1"]
+    assert all(item["processed_sha256"] == hashlib.sha256(b"processed wav").hexdigest() for item in transaction["imported"])
+
+    undo = importer.undo_import(result.transaction_manifest_path)
+
+    assert undo.removed_count == 3
+
+
+def test_role_recordings_importer_discards_transaction_when_processing_fails(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    existing_path = cfg.segments_dir / "CENTURION" / "0_13_1.wav"
+    existing_path.parent.mkdir(parents=True, exist_ok=True)
+    existing_path.write_bytes(b"existing wav")
+    package_path = tmp_path / "CENTURION.role-recordings.zip"
+    _write_package(
+        package_path,
+        manifest=_multi_take_manifest(["0_12_1", "0_13_1"]),
+        files={f"audio/segments/CENTURION/{segment_id}.wav": _wav_bytes() for segment_id in ["0_12_1", "0_13_1"]},
+    )
+    audio_processor = FakeAudioProcessor(fail_for="0_13_1.wav")
+
+    with pytest.raises(RuntimeError, match="ffmpeg failed"):
+        RoleRecordingsImporter(paths=cfg, audio_processor=audio_processor, processing_workers=2).import_package(
+            package_path,
+            processing_options=RecordingImportProcessingOptions(trim_silence=True),
+        )
+
+    assert list((cfg.build_dir / "linerecorder" / "imports").iterdir()) == []
+    assert not (cfg.segments_dir / "CENTURION" / "0_12_1.wav").exists()
+    assert existing_path.read_bytes() == b"existing wav"
+
+
 def test_role_recordings_importer_rejects_unknown_floor_noise_reference(tmp_path: Path) -> None:
     cfg = _cfg(tmp_path)
     package_path = tmp_path / "CENTURION.role-recordings.zip"
@@ -757,6 +889,39 @@ def test_role_recordings_importer_reports_clipped_and_suspicious_duration(tmp_pa
     assert {issue.code for issue in result.issues} >= {"clipped", "suspicious_duration"}
 
 
+@pytest.mark.parametrize(
+    ("sample_width", "loud_sample", "expected_codes"),
+    [
+        (1, b"\x00", {"clipped", "unexpected_channels"}),
+        (3, b"\xff\xff\x7f", {"clipped", "unexpected_channels"}),
+        (4, b"\x00\x00\x00\x01", {"too_quiet", "unexpected_channels"}),
+    ],
+)
+def test_role_recordings_importer_checks_quality_for_other_sample_widths(
+    tmp_path: Path,
+    sample_width: int,
+    loud_sample: bytes,
+    expected_codes: set[str],
+) -> None:
+    cfg = _cfg(tmp_path)
+    package_path = tmp_path / "stereo.role-recordings.zip"
+    buffer = io.BytesIO()
+    with wave.open(buffer, "wb") as wav:
+        wav.setnchannels(2)
+        wav.setsampwidth(sample_width)
+        wav.setframerate(48000)
+        wav.writeframes(loud_sample * 2 * 48000)
+    _write_package(
+        package_path,
+        manifest=_role_recordings_manifest(format_version="1.0.0"),
+        files={"audio/segments/CENTURION/0_12_1.wav": buffer.getvalue()},
+    )
+
+    result = RoleRecordingsImporter(paths=cfg).import_package(package_path)
+
+    assert {issue.code for issue in result.issues} == expected_codes
+
+
 def test_imported_role_recordings_can_be_used_by_playbook_builder(tmp_path: Path) -> None:
     cfg = _cfg(tmp_path)
     play = _play_with_cue_and_response()
@@ -841,6 +1006,26 @@ def _role_recordings_manifest(*, format_version: str, production_version: str |
     return manifest
 
 
+def _multi_take_manifest(segment_ids: list[str]) -> dict:
+    manifest = _role_recordings_manifest(format_version="1.0.0")
+    manifest["recordings"] = [
+        {
+            "id": f"I-{segment_id.split('_')[1]}:s1",
+            "line_id": f"I-{segment_id.split('_')[1]}",
+            "block_id": f"0.{segment_id.split('_')[1]}",
+            "segment_id": segment_id,
+            "audio_path": f"audio/segments/CENTURION/{segment_id}.wav",
+            "recorded_at": "2026-05-11T12:00:00Z",
+            "duration_ms": 1000,
+            "sample_rate_hz": 48000,
+            "channels": 1,
+            "status": "accepted",
+        }
+        for segment_id in segment_ids
+    ]
+    return manifest
+
+
 def _write_current_production(cfg: paths.PathConfig) -> None:
     cfg.production_markdown.parent.mkdir(parents=True, exist_ok=True)
     cfg.production_markdown.write_text(
@@ -856,8 +1041,9 @@ I-12 CENTURION: Halt!
 
 
 class FakeAudioProcessor:
-    def __init__(self) -> None:
+    def __init__(self, fail_for: str | None = None) -> None:
         self.calls = []
+        self.fail_for = fail_for
 
     def process(
         self,
@@ -877,6 +1063,8 @@ class FakeAudioProcessor:
                 "options": options,
             }
         )
+        if input_path.name == self.fail_for:
+            raise RuntimeError("ffmpeg failed")
         output_path.parent.mkdir(parents=True, exist_ok=True)
         output_path.write_bytes(b"processed wav")
 
@@ -0,0 +1,105 @@
+from __future__ import annotations
+
+import subprocess
+from pathlib import Path
+
+import numpy as np
+import soundfile
+
+from stager.loudnorm.k_weighting_filter import KWeightingFilter
+from stager.loudnorm.loudness_meter import LoudnessMeter
+from stager.loudnorm.normalizer import Normalizer
+
+RATE = 48_000
+
+OUTPUT_SUMMARY = """
+Output Integrated:   -21.0 LUFS
+Output True Peak:     -1.0 dBTP
+Output LRA:           10.0 LU
+Output Threshold:    -31.0 LUFS
+"""
+
+
+def _sine(seconds: float, dbfs: float, frequency_hz: float = 1000.0, phase: float = 0.0) -> np.ndarray:
+    t = np.arange(int(RATE * seconds)) / RATE
+    return 10 ** (dbfs / 20) * np.sin(2 * np.pi * frequency_hz * t + phase)
+
+
+def _write(path: Path, samples: np.ndarray) -> str:
+    soundfile.write(str(path), samples, RATE, subtype="FLOAT")
+    return str(path)
+
+
+def test_meter_matches_ebu_reference_signals(tmp_path: Path) -> None:
+    tone = _sine(20, -23.0)
+    stepped = np.concatenate([_sine(20, -20.0), _sine(20, -30.0)])
+    inter_sample = _sine(10, -6.0, frequency_hz=RATE / 4, phase=np.pi / 4)
+    meter = LoudnessMeter()
+
+    reference = meter.measure(_write(tmp_path / "tone.wav", np.stack([tone, tone], axis=1)))
+    assert reference == {"lufs": -23.0, "true_peak": -23.0, "loudness_range": 0.0, "loudness_threshold": -33.0}
+    assert meter.measure(_write(tmp_path / "stepped.wav", np.stack([stepped, stepped], axis=1)))["loudness_range"] == 10.0
+    # Samples of this tone peak at -9 dBFS; the true peak sits between them.
+    assert abs(meter.measure(_write(tmp_path / "peak.wav", inter_sample))["true_peak"] + 6.0) <= 0.2
+
+
+def test_k_weighting_matches_direct_recurrence() -> None:
+    samples = np.random.default_rng(0).standard_normal(20_000)
+    expected = samples
+    weighting = KWeightingFilter(sample_rate_hz=44_100)
+    for (b0, b1, b2), (_, a1, a2) in weighting.coefficients():
+        x1 = x2 = y1 = y2 = 0.0
+        filtered = []
+        for x0 in expected.tolist():
+            y0 = b0 * x0 + b1 * x1 + b2 * x2 - a1 * y1 - a2 * y2
+            filtered.append(y0)
+            x2, x1, y2, y1 = x1, x0, y1, y0
+        expected = np.array(filtered)
+
+    chunks = [samples[:1], samples[1:7_000], samples[7_000:]]
+    actual = np.concatenate([weighting.process(chunk[:, None])[:, 0] for chunk in chunks])
+
+    assert np.max(np.abs(actual - expected)) < 1e-6
+
+
+def test_silence_is_not_normalizable(tmp_path: Path) -> None:
+    values = LoudnessMeter().measure(_write(tmp_path / "silence.wav", np.zeros(RATE * 2)))
+
+    measurements = Normalizer().measures_parser.measurements_from_values(values)
+
+    assert measurements["lufs"].value == -100
+    assert measurements.normalizable is False
+
+
+def test_measurements_are_cached_by_file_hash(tmp_path: Path, monkeypatch) -> None:
+    source = _write(tmp_path / "tone.wav", _sine(5, -20.0))
+    meter = LoudnessMeter(cache_dir=tmp_path / "cache")
+    first = meter.measure(source)
+
+    monkeypatch.setattr(LoudnessMeter, "_measure", lambda self, sound: (_ for _ in ()).throw(AssertionError("decoded")))
+
+    assert meter.measure(source) == first
+    assert len(list((tmp_path / "cache").glob("*.json"))) == 1
+
+
+def test_normalizer_measures_in_process_and_runs_ffmpeg_once(tmp_path: Path) -> None:
+    source = _write(tmp_path / "input.wav", _sine(5, -24.0))
+    commands: list[list[str]] = []
+
+    def runner(command: list[str], *, capture_output: bool, text: bool) -> subprocess.CompletedProcess[str]:
+        commands.append(command)
+        return subprocess.CompletedProcess(args=command, returncode=0, stdout="", stderr=OUTPUT_SUMMARY)
+
+    result = Normalizer(command_runner=runner, loudness_meter=LoudnessMeter()).normalize(source, str(tmp_path / "out.wav"))
+
+    assert len(commands) == 1
+    assert "measured_i=-27.0" in commands[0][commands[0].index("-af") + 1]
+    assert result.input_measurements["lufs"].value == -27.0
+    assert result.normalized_measurements["lufs"].value == -21.0
+
+
+def test_meter_defers_undecodable_input_to_ffmpeg(tmp_path: Path) -> None:
+    source = tmp_path / "input.m4a"
+    source.write_bytes(b"not audio")
+
+    assert LoudnessMeter().measure(str(source)) is None
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import pytest
+
+from stager.playbook.callout_source_index import CalloutSourceIndex
+
+
+def _touch(path: Path) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    path.write_bytes(b"")
+    return path
+
+
+def test_index_prefers_direct_then_nested_candidates(tmp_path: Path) -> None:
+    base_dir = tmp_path / "callouts"
+    nested = _touch(base_dir / "MEGAERA" / "MEGAERA.wav")
+    direct = _touch(base_dir / "ANDROCLES.mp3")
+
+    index = CalloutSourceIndex(base_dir)
+
+    assert index.resolve("MEGAERA") == nested
+    assert index.resolve("ANDROCLES") == direct
+
+
+def test_index_uses_base_name_for_numbered_callouts(tmp_path: Path) -> None:
+    base_dir = tmp_path / "callouts"
+    source = _touch(base_dir / "CHRISTIAN.wav")
+
+    assert CalloutSourceIndex(base_dir).resolve("CHRISTIAN-1") == source
+
+
+def test_index_falls_back_to_first_normalized_match_in_sorted_order(tmp_path: Path) -> None:
+    base_dir = tmp_path / "callouts"
+    _touch(base_dir / "z" / "ox driver.WAV")
+    first = _touch(base_dir / "a" / "Ox-Driver.wav")
+    _touch(base_dir / "a" / "notes.txt")
+
+    assert CalloutSourceIndex(base_dir).resolve("OX DRIVER") == first
+
+
+def test_index_walks_callout_directory_once(tmp_path: Path, monkeypatch: pytest.MonkeyPatch) -> None:
+    base_dir = tmp_path / "callouts"
+    _touch(base_dir / "lions" / "lion.wav")
+    index = CalloutSourceIndex(base_dir)
+
+    def fail_walk(self, pattern):
+        raise AssertionError("callout lookups should use the index")
+
+    monkeypatch.setattr(Path, "rglob", fail_walk)
+
+    assert index.resolve("LION") == base_dir / "lions" / "lion.wav"
+    assert index.resolve("MISSING") is None
+
+
+def test_index_resolves_nothing_without_callout_directory(tmp_path: Path) -> None:
+    assert CalloutSourceIndex(tmp_path / "callouts").resolve("MEGAERA") is None
@@ -7,7 +7,9 @@ import wave
 from pathlib import Path
 
 from stager.playbook.cue_start_offset_analyzer import CueStartOffsetAnalyzer
+from stager.playbook.cue_start_offset_cache import CueStartOffsetCache
 from stager.playbook.cue_window_presets import CueWindowPresets
+from stager.shared import paths
 
 
 def _write_tone_with_silence(
@@ -110,3 +112,49 @@ def test_analyzer_omits_offsets_for_compressed_audio() -> None:
     analyzer = CueStartOffsetAnalyzer(windows_ms=[10000])
 
     assert analyzer.analyze(Path("cue.mp3"), duration_ms=16000) == []
+
+
+def test_analyzer_matches_boundary_for_stereo_audio(tmp_path: Path) -> None:
+    mono_path = tmp_path / "mono.wav"
+    stereo_path = tmp_path / "stereo.wav"
+    _write_tone_with_silence(mono_path, duration_ms=16000, silence_start_ms=5900, silence_end_ms=6100)
+    with wave.open(str(mono_path), "rb") as mono:
+        frames = mono.readframes(mono.getnframes())
+    with wave.open(str(stereo_path), "wb") as stereo:
+        stereo.setnchannels(2)
+        stereo.setsampwidth(2)
+        stereo.setframerate(8_000)
+        stereo.writeframes(b"".join(frames[index:index + 2] * 2 for index in range(0, len(frames), 2)))
+    analyzer = CueStartOffsetAnalyzer(windows_ms=[10000])
+
+    assert analyzer.analyze(stereo_path, duration_ms=16000) == analyzer.analyze(mono_path, duration_ms=16000)
+
+
+def test_analyzer_reuses_cached_offsets_for_unchanged_audio(tmp_path: Path, monkeypatch) -> None:
+    cfg = paths.PathConfig(play_name="test-play", build_root=tmp_path / "build", plays_dir=tmp_path / "plays")
+    audio_path = tmp_path / "cue.wav"
+    _write_tone_with_silence(audio_path, duration_ms=16000, silence_start_ms=5900, silence_end_ms=6100)
+    first_cache = CueStartOffsetCache(paths_config=cfg)
+    offsets = CueStartOffsetAnalyzer(windows_ms=[10000], cache=first_cache).analyze(audio_path, duration_ms=16000)
+    first_cache.save()
+
+    def fail_decode(*args, **kwargs):
+        raise AssertionError("cached offsets should not decode audio")
+
+    monkeypatch.setattr("stager.playbook.cue_start_offset_analyzer.AudioSegment.from_file", fail_decode)
+    analyzer = CueStartOffsetAnalyzer(windows_ms=[10000], cache=CueStartOffsetCache(paths_config=cfg))
+
+    assert analyzer.analyze(audio_path, duration_ms=16000) == offsets
+
+
+def test_analyzer_cache_misses_when_windows_or_content_change(tmp_path: Path) -> None:
+    cfg = paths.PathConfig(play_name="test-play", build_root=tmp_path / "build", plays_dir=tmp_path / "plays")
+    audio_path = tmp_path / "cue.wav"
+    _write_tone_with_silence(audio_path, duration_ms=16000)
+    cache = CueStartOffsetCache(paths_config=cfg)
+    settings = {"windows_ms": [10000]}
+    original_key = cache.cache_key(audio_path, settings)
+
+    assert cache.cache_key(audio_path, {"windows_ms": [5000]}) != original_key
+    _write_tone_with_silence(audio_path, duration_ms=16000, silence_start_ms=5900, silence_end_ms=6100)
+    assert CueStartOffsetCache(paths_config=cfg).cache_key(audio_path, settings) != original_key
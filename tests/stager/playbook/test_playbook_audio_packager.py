@@ -1,10 +1,12 @@
 from __future__ import annotations
 
 import wave
+import zipfile
 from pathlib import Path
 
 import pytest
 
+from stager.playbook.playbook_archive_writer import PlaybookArchiveWriter
 from stager.playbook.playbook_audio_packager import PlaybookAudioPackager
 
 
@@ -68,3 +70,22 @@ def test_packager_exports_mp3_with_ffmpeg_backed_pydub(tmp_path: Path, monkeypat
 def test_packager_rejects_unsupported_audio_format(tmp_path: Path) -> None:
     with pytest.raises(ValueError, match="audio_format must be one of: wav, mp3"):
         PlaybookAudioPackager(app_dir=tmp_path / "app", audio_format="flac")
+
+
+def test_packager_writes_wav_into_archive_without_staging_file(tmp_path: Path) -> None:
+    app_dir = tmp_path / "app"
+    source_path = tmp_path / "source" / "0_1_1.wav"
+    destination_dir = app_dir / "audio" / "segments" / "ANDROCLES"
+    zip_path = tmp_path / "test.playbook.zip"
+    _write_wav(source_path)
+
+    with PlaybookArchiveWriter(zip_path) as archive:
+        packaged = PlaybookAudioPackager(app_dir=app_dir).package(source_path, destination_dir, archive=archive)
+
+    assert packaged.path is None
+    assert packaged.manifest_path.as_posix() == "audio/segments/ANDROCLES/0_1_1.wav"
+    assert not destination_dir.exists()
+    with zipfile.ZipFile(zip_path) as package:
+        info = package.getinfo("audio/segments/ANDROCLES/0_1_1.wav")
+        assert info.compress_type == zipfile.ZIP_STORED
+        assert package.read(info) == source_path.read_bytes()
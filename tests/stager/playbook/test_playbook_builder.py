@@ -813,6 +813,114 @@ def test_playbook_builder_fails_on_missing_cue_audio(tmp_path: Path) -> None:
         PlaybookBuilder(play=play, paths=cfg).build()
 
 
+def test_playbook_builder_streams_direct_zip_without_unpacked_audio(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    cue_block = _speech_block(0, 1, "ANDROCLES", "Well, dear, do you want to see one?")
+    response_block = _speech_block(0, 2, "MEGAERA", "I won't go another step.")
+    play = _play([_title_block(), cue_block, response_block])
+    _write_wav(cfg.segments_dir / "_NARRATOR" / "0_0_1.wav")
+    _write_wav(cfg.segments_dir / "ANDROCLES" / "0_1_1.wav")
+    _write_wav(cfg.segments_dir / "MEGAERA" / "0_2_1.wav")
+
+    zip_path = PlaybookBuilder(play=play, paths=cfg, packaging="direct").build()
+    manifest = json.loads((cfg.build_dir / "app" / "manifest.json").read_text(encoding="utf-8"))
+
+    assert not (cfg.build_dir / "app" / "audio").exists()
+    with zipfile.ZipFile(zip_path) as archive:
+        assert json.loads(archive.read("manifest.json")) == manifest
+        assert archive.getinfo("manifest.json").compress_type == zipfile.ZIP_DEFLATED
+        for asset in manifest["assets"]:
+            assert archive.getinfo(asset["path"]).compress_type == zipfile.ZIP_STORED
+        assert archive.read("audio/segments/MEGAERA/0_2_1.wav") == (cfg.segments_dir / "MEGAERA" / "0_2_1.wav").read_bytes()
+    assert not zip_path.with_name(f"{zip_path.name}.partial").exists()
+
+
+def test_playbook_builder_direct_zip_can_keep_unpacked_directory(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    response_block = _speech_block(0, 1, "MEGAERA", "I won't go another step.")
+    play = _play([_title_block(), response_block])
+    _write_wav(cfg.segments_dir / "_NARRATOR" / "0_0_1.wav")
+    _write_wav(cfg.segments_dir / "MEGAERA" / "0_1_1.wav")
+
+    zip_path = PlaybookBuilder(play=play, paths=cfg, packaging="direct", keep_app_dir=True).build()
+
+    app_dir = cfg.build_dir / "app"
+    with zipfile.ZipFile(zip_path) as archive:
+        unpacked = sorted(path.relative_to(app_dir).as_posix() for path in app_dir.rglob("*") if path.is_file())
+        assert sorted(archive.namelist()) == unpacked
+        assert archive.read("manifest.json") == (app_dir / "manifest.json").read_bytes()
+
+
+def test_playbook_builder_direct_zip_discards_partial_package_on_failure(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    response_block = _speech_block(0, 1, "MEGAERA", "I won't go another step.")
+    play = _play([_title_block(), response_block])
+    _write_wav(cfg.segments_dir / "_NARRATOR" / "0_0_1.wav")
+
+    with pytest.raises(RuntimeError, match="Missing required response audio"):
+        PlaybookBuilder(play=play, paths=cfg, packaging="direct").build()
+
+    zip_path = cfg.build_dir / "test-play.playbook.zip"
+    assert not zip_path.exists()
+    assert not zip_path.with_name(f"{zip_path.name}.partial").exists()
+
+
+def test_playbook_builder_stores_audio_uncompressed_in_staged_zip(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    response_block = _speech_block(0, 1, "MEGAERA", "I won't go another step.")
+    play = _play([_title_block(), response_block])
+    _write_wav(cfg.segments_dir / "_NARRATOR" / "0_0_1.wav")
+    _write_wav(cfg.segments_dir / "MEGAERA" / "0_1_1.wav")
+
+    zip_path = PlaybookBuilder(play=play, paths=cfg).build()
+
+    with zipfile.ZipFile(zip_path) as archive:
+        assert archive.getinfo("audio/segments/MEGAERA/0_1_1.wav").compress_type == zipfile.ZIP_STORED
+        assert archive.getinfo("manifest.json").compress_type == zipfile.ZIP_DEFLATED
+
+
+def test_playbook_builder_packs_role_audio_into_sprites(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    first_block = _speech_block(0, 1, "MEGAERA", "I won't go another step.")
+    cue_block = _speech_block(0, 2, "ANDROCLES", "Well, dear, do you want to see one?")
+    second_block = _speech_block(0, 3, "MEGAERA", "No.")
+    play = _play([_title_block(), first_block, cue_block, second_block])
+    _write_wav(cfg.segments_dir / "_NARRATOR" / "0_0_1.wav")
+    _write_wav(cfg.segments_dir / "MEGAERA" / "0_1_1.wav", duration_ms=100)
+    _write_wav(cfg.segments_dir / "ANDROCLES" / "0_2_1.wav")
+    _write_wav(cfg.segments_dir / "MEGAERA" / "0_3_1.wav", duration_ms=200)
+
+    zip_path = PlaybookBuilder(play=play, paths=cfg, audio_layout="sprites").build()
+    manifest = json.loads((cfg.build_dir / "app" / "manifest.json").read_text(encoding="utf-8"))
+
+    megaera = next(role for role in manifest["roles"] if role["id"] == "MEGAERA")
+    first_audio = megaera["lines"][0]["response"]["segments"][0]["audio"]
+    second_audio = megaera["lines"][1]["response"]["segments"][0]["audio"]
+    assert manifest["format_version"] == "2.0.0"
+    assert first_audio == {"path": "audio/sprites/MEGAERA.wav", "offset_ms": 0, "duration_ms": 100, "required": True}
+    assert second_audio == {"path": "audio/sprites/MEGAERA.wav", "offset_ms": 150, "duration_ms": 200, "required": True}
+    with zipfile.ZipFile(zip_path) as archive:
+        assert not any(name.startswith("audio/segments/") for name in archive.namelist())
+        with archive.open("audio/sprites/MEGAERA.wav") as sprite_file, wave.open(sprite_file) as sprite:
+            assert sprite.getnframes() == 8_000 * (100 + 50 + 200) // 1000
+
+
+def test_playbook_builder_keeps_callouts_as_files_in_sprite_layout(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    response_block = _speech_block(0, 1, "MEGAERA", "I won't go another step.", callout="MEGAERA")
+    play = _play([_title_block(), response_block])
+    _write_wav(cfg.segments_dir / "_NARRATOR" / "0_0_1.wav")
+    _write_wav(cfg.segments_dir / "MEGAERA" / "0_1_1.wav")
+    _write_wav(cfg.build_dir / "audio" / "callouts" / "MEGAERA.wav")
+
+    zip_path = PlaybookBuilder(play=play, paths=cfg, audio_layout="sprites", packaging="direct").build()
+
+    with zipfile.ZipFile(zip_path) as archive:
+        names = set(archive.namelist())
+    assert "audio/callouts/MEGAERA/MEGAERA.wav" in names
+    assert {"audio/sprites/MEGAERA.wav", "audio/sprites/_NARRATOR.wav"} <= names
+
+
 def test_playbook_builder_keeps_path_configs_isolated(tmp_path: Path) -> None:
     first_cfg = _named_cfg(tmp_path, "first-play")
     second_cfg = _named_cfg(tmp_path, "second-play")
@@ -14,3 +14,13 @@ def test_run_playbook_rejects_unknown_audio_format() -> None:
 def test_run_playbook_rejects_unknown_audio_source() -> None:
     with pytest.raises(typer.BadParameter, match="audio-source must be one of: auto, canonical, cleaned"):
         run_playbook(audio_source="mixed")
+
+
+def test_run_playbook_rejects_unknown_packaging() -> None:
+    with pytest.raises(typer.BadParameter, match="packaging must be one of: staged, direct"):
+        run_playbook(packaging="tarball")
+
+
+def test_run_playbook_rejects_unknown_audio_layout() -> None:
+    with pytest.raises(typer.BadParameter, match="audio-layout must be one of: files, sprites"):
+        run_playbook(audio_layout="bundle")
@@ -187,6 +187,43 @@ def test_recording_request_cli_does_not_create_or_back_write_production_version_
     assert "// production_version:" not in cfg.production_markdown.read_text(encoding="utf-8")
 
 
+def test_recording_request_cli_builds_all_roles_in_one_pass(tmp_path: Path, monkeypatch) -> None:
+    cfg = _config(tmp_path)
+    cfg.play_text.write_text(
+        """## 1: ACT I ##
+
+CAPTAIN.
+Stand fast.
+
+LAVINIA.
+We will not.
+""",
+        encoding="utf-8",
+    )
+    ScriptWright(paths_config=cfg).write_locked()
+    _patch_path_config(monkeypatch, cfg)
+
+    result = CliRunner().invoke(build.app, ["recording-request", "--all-roles", "--play", "test"])
+
+    assert result.exit_code == 0, result.output
+    assert (cfg.build_dir / "linerecorder" / "CAPTAIN.recording-request.zip").exists()
+    assert (cfg.build_dir / "linerecorder" / "LAVINIA.recording-request.zip").exists()
+
+
+def test_recording_request_cli_rejects_role_with_all_roles(tmp_path: Path, monkeypatch) -> None:
+    cfg = _config(tmp_path)
+    ScriptWright(paths_config=cfg).write_locked()
+    _patch_path_config(monkeypatch, cfg)
+
+    result = CliRunner().invoke(
+        build.app,
+        ["recording-request", "--role", "CAPTAIN", "--all-roles", "--play", "test"],
+    )
+
+    assert result.exit_code != 0
+    assert "Use either --role or --all-roles" in result.output
+
+
 def test_publish_production_cli_requires_change_summary(tmp_path: Path, monkeypatch) -> None:
     cfg = _config(tmp_path)
     ScriptWright(paths_config=cfg).write_locked()
@@ -0,0 +1,83 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+import wave
+
+from stager.transcription.batched_segment_transcriber import BatchedSegmentTranscriber
+
+
+class FakeBatchedPipeline:
+    def __init__(self) -> None:
+        self.calls: list[list[dict]] = []
+
+    def transcribe(self, audio, *, clip_timestamps: list[dict], batch_size: int, **_kwargs):
+        self.calls.append(clip_timestamps)
+        # One word in the middle of every clip, timed on the packed audio like faster-whisper.
+        segments = [
+            SimpleNamespace(
+                words=[
+                    SimpleNamespace(
+                        word=f" clip{len(self.calls)}-{index}",
+                        start=clip["start"] + 0.1,
+                        end=clip["start"] + 0.3,
+                    )
+                ]
+            )
+            for index, clip in enumerate(clip_timestamps)
+        ]
+        return segments, None
+
+
+class FakeWhisperModel:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def transcribe(self, audio, **_kwargs):
+        self.calls += 1
+        return [SimpleNamespace(words=[SimpleNamespace(word=" long", start=29.0, end=29.5)])], None
+
+
+def test_batched_transcriber_groups_segments_and_returns_file_relative_words(tmp_path: Path) -> None:
+    audio_paths = [_write_wav(tmp_path / f"0_{index}_1.wav", seconds=1) for index in range(1, 4)]
+    pipeline = FakeBatchedPipeline()
+
+    words = BatchedSegmentTranscriber(model=FakeWhisperModel(), batch_size=2, pipeline=pipeline).transcribe(
+        audio_paths,
+        word_timestamps=True,
+    )
+
+    assert [len(clips) for clips in pipeline.calls] == [2, 1]
+    assert pipeline.calls[0][1] == {"start": 1.0, "end": 2.0}
+    assert [[word["word"] for word in file_words] for file_words in words] == [
+        ["clip1-0"],
+        ["clip1-1"],
+        ["clip2-0"],
+    ]
+    assert round(words[1][0]["start"], 6) == 0.1
+    assert round(words[1][0]["end"], 6) == 0.3
+
+
+def test_batched_transcriber_falls_back_to_single_file_for_long_segments(tmp_path: Path) -> None:
+    long_path = _write_wav(tmp_path / "0_1_1.wav", seconds=30)
+    short_path = _write_wav(tmp_path / "0_2_1.wav", seconds=1)
+    model = FakeWhisperModel()
+    pipeline = FakeBatchedPipeline()
+
+    words = BatchedSegmentTranscriber(model=model, batch_size=4, pipeline=pipeline).transcribe(
+        [long_path, short_path]
+    )
+
+    assert model.calls == 1
+    assert [len(clips) for clips in pipeline.calls] == [1]
+    assert words[0] == [{"word": "long", "start": 29.0, "end": 29.5}]
+    assert [word["word"] for word in words[1]] == ["clip1-0"]
+
+
+def _write_wav(path: Path, *, seconds: int) -> Path:
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes((1000).to_bytes(2, "little", signed=True) * 16000 * seconds)
+    return path
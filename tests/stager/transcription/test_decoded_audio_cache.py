@@ -0,0 +1,114 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+import wave
+
+import numpy as np
+
+from stager.shared import paths
+from stager.transcription import decoded_audio_cache
+from stager.transcription.decoded_audio_cache import DecodedAudioCache
+from stager.transcription.role_whisper_transcriber import RoleWhisperTranscriber
+from stager.transcription.whisper_cache_cleaner import WhisperCacheCleaner
+from stager.transcription.whisper_cache_store import WhisperCacheStore
+
+
+def _cfg(tmp_path: Path) -> paths.PathConfig:
+    return paths.PathConfig(
+        play_name="androcles",
+        build_root=tmp_path / "build",
+        plays_dir=tmp_path / "plays",
+        snippets_dir=tmp_path / "snippets",
+    )
+
+
+def test_decoded_audio_is_reused_until_the_recording_changes(tmp_path: Path, monkeypatch) -> None:
+    cfg = _cfg(tmp_path)
+    recording = _write_wav(tmp_path / "CENTURION.wav", seconds=2, level=1000)
+    decodes: list[str] = []
+    real_decode = decoded_audio_cache.decode_audio
+
+    def counting_decode(path: str, sampling_rate: int) -> np.ndarray:
+        decodes.append(Path(path).name)
+        return real_decode(path, sampling_rate=sampling_rate)
+
+    monkeypatch.setattr(decoded_audio_cache, "decode_audio", counting_decode)
+    cache = DecodedAudioCache(paths=cfg)
+
+    first = cache.load(recording)
+    second = DecodedAudioCache(paths=cfg).load(recording)
+
+    assert decodes == ["CENTURION.wav"]
+    assert isinstance(second, np.memmap)
+    assert second.dtype == np.float32
+    assert len(first) == len(second) == 32000
+    assert len(cache.clip(recording, from_ms=500, length_ms=1000)) == 16000
+
+    _write_wav(recording, seconds=1, level=2000)
+    assert len(cache.load(recording)) == 16000
+    assert decodes == ["CENTURION.wav", "CENTURION.wav"]
+
+
+def test_decoded_audio_is_evicted_within_its_own_budget(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    first = _write_wav(tmp_path / "CENTURION.wav", seconds=2, level=1000)
+    second = _write_wav(tmp_path / "LAVINIA.wav", seconds=2, level=2000)
+    cache_dir = cfg.build_dir / "whisper_cache"
+    timelines = WhisperCacheStore.for_directory(cache_dir, max_bytes=1)
+    cache = DecodedAudioCache(paths=cfg, max_bytes=200_000)
+
+    assert not cache_dir.exists()
+    timelines.put("timeline", {"role": "CENTURION"}, [{"word": "Halt!", "start": 0.1, "end": 0.4}])
+    first_path = cache.cache_path(first)
+    second_path = cache.cache_path(second)
+
+    assert second_path.exists()
+    assert not first_path.exists()
+    assert timelines.entries() == {"timeline": {"role": "CENTURION"}}
+    store = WhisperCacheStore.for_directory(cache_dir / "decoded", max_bytes=200_000)
+    assert store.total_bytes == second_path.stat().st_size
+    assert store.entries() == {
+        WhisperCacheStore.decoded_key(second_path): {
+            "kind": "decoded",
+            "audio_path": str(second),
+            "role": "LAVINIA",
+        }
+    }
+
+
+def test_role_transcriber_clips_decoded_audio_without_ffmpeg(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    recording = _write_wav(cfg.recordings_dir / "CENTURION.wav", seconds=3, level=1000)
+    received: list[np.ndarray] = []
+
+    def transcribe(audio, **_kwargs):
+        received.append(audio)
+        return [SimpleNamespace(text=" Halt!", start=0.1, end=0.4)], None
+
+    store = SimpleNamespace(load=lambda _model_name: SimpleNamespace(transcribe=transcribe))
+    transcriber = RoleWhisperTranscriber(
+        role="CENTURION",
+        paths=cfg,
+        whisper_store=store,
+        clip_from_ms=1000,
+        clip_length_ms=1500,
+    )
+
+    target = transcriber.transcribe(recording)
+
+    assert len(received[0]) == 24000
+    assert target.read_text(encoding="utf-8") == "100-400: Halt!\n"
+    assert WhisperCacheCleaner(paths=cfg).clear("LAVINIA") == 0
+    assert WhisperCacheCleaner(paths=cfg).clear("CENTURION") == 1
+    assert not list((cfg.build_dir / "whisper_cache" / "decoded").glob("*.npy"))
+
+
+def _write_wav(path: Path, *, seconds: int, level: int) -> Path:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(48000)
+        wav.writeframes(level.to_bytes(2, "little", signed=True) * 48000 * seconds)
+    return path
@@ -0,0 +1,112 @@
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from pathlib import Path
+
+from stager.shared import paths
+from stager.transcription.whisper_cache_cleaner import WhisperCacheCleaner
+from stager.transcription.whisper_cache_store import WhisperCacheStore
+from stager.transcription.whisper_transcription_cache import WhisperTranscriptionCache
+
+
+WORDS = [
+    {"word": "Halt!", "start": 0.12, "end": 0.48},
+    {"word": "Halt!", "start": 1.0, "end": 1.31},
+    {"word": "Who", "start": 2.04, "end": 2.2},
+]
+
+
+def test_store_round_trips_words_and_replays_its_index(tmp_path: Path) -> None:
+    store = WhisperCacheStore(cache_dir=tmp_path / "cache")
+    store.put("first", {"role": "CENTURION"}, WORDS)
+
+    reopened = WhisperCacheStore(cache_dir=tmp_path / "cache")
+
+    assert reopened.read("first") == WORDS
+    assert reopened.entries() == {"first": {"role": "CENTURION"}}
+    assert reopened.total_bytes == (tmp_path / "cache" / "first.npz").stat().st_size
+    assert not list((tmp_path / "cache").glob("*.json"))
+
+
+def test_store_evicts_least_recently_used_entries_past_its_budget(tmp_path: Path) -> None:
+    store = WhisperCacheStore(cache_dir=tmp_path / "cache", max_bytes=None)
+    for key in ("a", "b", "c"):
+        store.put(key, {}, WORDS)
+    entry_size = store.total_bytes // 3
+    store.read("a")
+
+    store.max_bytes = entry_size * 3
+    store.put("d", {}, WORDS)
+
+    assert sorted(store.entries()) == ["a", "c", "d"]
+    assert not (tmp_path / "cache" / "b.npz").exists()
+    assert sorted(WhisperCacheStore(cache_dir=tmp_path / "cache").entries()) == ["a", "c", "d"]
+
+
+def test_shared_store_takes_the_latest_budget(tmp_path: Path) -> None:
+    store = WhisperCacheStore.for_directory(tmp_path / "cache", max_bytes=None)
+    for key in ("a", "b"):
+        store.put(key, {}, WORDS)
+    entry_size = store.total_bytes // 2
+
+    assert WhisperCacheStore.for_directory(tmp_path / "cache", max_bytes=entry_size * 2) is store
+    store.put("c", {}, WORDS)
+
+    assert store.max_bytes == entry_size * 2
+    assert sorted(store.entries()) == ["b", "c"]
+
+
+def test_transcription_cache_reads_and_imports_legacy_json_entries(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    recording = tmp_path / "CENTURION.wav"
+    recording.write_bytes(b"take one")
+    cache_key = {"audio_path": str(recording), "model_name": "base.en"}
+    digest = hashlib.sha256(json.dumps(cache_key, sort_keys=True, separators=(",", ":")).encode("utf-8")).hexdigest()
+    legacy_path = cfg.build_dir / "whisper_cache" / f"CENTURION-{digest}.json"
+    legacy_path.parent.mkdir(parents=True)
+    stat = recording.stat()
+    legacy_path.write_text(
+        json.dumps(
+            {
+                "cache_version": "1",
+                "audio_path": str(recording),
+                "audio_mtime_ns": stat.st_mtime_ns,
+                "audio_size": stat.st_size,
+                "key": cache_key,
+                "raw_words": WORDS,
+            }
+        ),
+        encoding="utf-8",
+    )
+
+    assert WhisperTranscriptionCache(paths=cfg).load(cache_key, recording) == WORDS
+    assert not legacy_path.exists()
+    assert WhisperCacheStore(cache_dir=cfg.build_dir / "whisper_cache").read(digest) == WORDS
+
+
+def test_transcription_cache_checks_recording_and_clears_by_role(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    recording = tmp_path / "CENTURION.wav"
+    recording.write_bytes(b"take one")
+    cache = WhisperTranscriptionCache(paths=cfg)
+    cache_key = {"audio_path": str(recording), "model_name": "base.en"}
+
+    cache.save(cache_key, recording, WORDS)
+
+    assert WhisperTranscriptionCache(paths=cfg).load(cache_key, recording) == WORDS
+    os.utime(recording, ns=(0, 0))
+    assert cache.load(cache_key, recording) is None
+    assert WhisperCacheCleaner(paths=cfg).clear("LAVINIA") == 0
+    assert WhisperCacheCleaner(paths=cfg).clear("CENTURION") == 1
+    assert WhisperTranscriptionCache(paths=cfg).load(cache_key, recording) is None
+
+
+def _cfg(tmp_path: Path) -> paths.PathConfig:
+    return paths.PathConfig(
+        play_name="androcles",
+        build_root=tmp_path / "build",
+        plays_dir=tmp_path / "plays",
+        snippets_dir=tmp_path / "snippets",
+    )
@@ -0,0 +1,148 @@
+from __future__ import annotations
+
+from pathlib import Path
+import socket
+import sys
+import threading
+import time
+from types import SimpleNamespace
+
+import numpy as np
+import pytest
+
+from stager.transcription.resident_whisper_model_store import ResidentWhisperModelStore
+from stager.transcription.whisper_daemon import WhisperDaemon
+from stager.transcription.whisper_daemon_client import RemoteWhisperModel, WhisperDaemonClient
+
+
+class FakeWhisperModel:
+    def __init__(self) -> None:
+        self.calls: list[tuple[str, dict]] = []
+
+    def transcribe(self, audio_path: str, **options):
+        self.calls.append((audio_path, options))
+        words = [SimpleNamespace(word=" Halt!", start=0.1, end=0.4)]
+        return [SimpleNamespace(text=" Halt!", start=0.1, end=0.4, words=words)], None
+
+
+class FakeWhisperStore:
+    def __init__(self) -> None:
+        self.model = FakeWhisperModel()
+        self.loads: list[str] = []
+
+    def load(self, model_name: str) -> FakeWhisperModel:
+        self.loads.append(model_name)
+        if model_name == "missing":
+            raise RuntimeError("model not cached")
+        return self.model
+
+
+def test_daemon_serves_transcriptions_from_a_resident_model(tmp_path: Path) -> None:
+    store = FakeWhisperStore()
+    socket_path = tmp_path / "whisper.sock"
+    thread = _serve(WhisperDaemon(socket_path=socket_path, store=store, idle_timeout_s=5.0))
+    client = WhisperDaemonClient(socket_path=socket_path)
+
+    model = RemoteWhisperModel(client=client, model_name="base.en")
+    segments, _info = model.transcribe(tmp_path / "CENTURION.wav", word_timestamps=True)
+
+    assert segments[0].text == " Halt!"
+    assert segments[0].words[0].word == " Halt!"
+    assert store.model.calls == [(str((tmp_path / "CENTURION.wav").resolve()), {"word_timestamps": True})]
+    model.transcribe(np.linspace(-1.0, 1.0, 16000, dtype=np.float32))
+    np.testing.assert_array_equal(store.model.calls[1][0], np.linspace(-1.0, 1.0, 16000, dtype=np.float32))
+    assert client.request({"op": "load", "model_name": "missing"}) == {
+        "ok": False,
+        "error": "RuntimeError: model not cached",
+    }
+
+    client.call({"op": "shutdown"})
+    thread.join(timeout=10)
+    assert not socket_path.exists()
+
+
+def test_remote_model_sends_cached_arrays_as_a_file_range(tmp_path: Path) -> None:
+    store = FakeWhisperStore()
+    socket_path = tmp_path / "whisper.sock"
+    thread = _serve(WhisperDaemon(socket_path=socket_path, store=store, idle_timeout_s=5.0))
+    bodies: list[bytes | None] = []
+    client = WhisperDaemonClient(socket_path=socket_path)
+    request = client.request
+    client.request = lambda payload, body=None: bodies.append(body) or request(payload, body)
+    samples = np.linspace(-1.0, 1.0, 16000, dtype=np.float32)
+    np.save(tmp_path / "decoded.npy", samples)
+
+    RemoteWhisperModel(client=client, model_name="base.en").transcribe(
+        np.load(tmp_path / "decoded.npy", mmap_mode="r")[4000:12000]
+    )
+
+    assert bodies == [None]
+    np.testing.assert_array_equal(store.model.calls[0][0], samples[4000:12000])
+
+    client.call({"op": "shutdown"})
+    thread.join(timeout=10)
+
+
+def test_resident_store_uses_running_daemon_and_falls_back_in_process(tmp_path: Path) -> None:
+    socket_path = tmp_path / "whisper.sock"
+    local_store = SimpleNamespace(load=lambda model_name: f"in-process {model_name}")
+    resident = ResidentWhisperModelStore(store=local_store, auto_start=False, socket_path=socket_path)
+
+    assert resident.load("base.en") == "in-process base.en"
+
+    thread = _serve(WhisperDaemon(socket_path=socket_path, store=FakeWhisperStore(), idle_timeout_s=5.0))
+    assert isinstance(resident.load("base.en"), RemoteWhisperModel)
+    assert resident.load("missing") == "in-process missing"
+
+    WhisperDaemonClient(socket_path=socket_path).call({"op": "shutdown"})
+    thread.join(timeout=10)
+
+
+def test_resident_store_skips_auto_start_in_packaged_builds(tmp_path: Path, monkeypatch, caplog) -> None:
+    local_store = SimpleNamespace(load=lambda model_name: f"in-process {model_name}")
+    resident = ResidentWhisperModelStore(store=local_store, socket_path=tmp_path / "whisper.sock")
+    monkeypatch.setattr(sys, "frozen", True, raising=False)
+    monkeypatch.setattr(resident, "_start_daemon", lambda: pytest.fail("daemon started from a packaged build"))
+    started = time.monotonic()
+
+    assert resident.load("base.en") == "in-process base.en"
+    assert time.monotonic() - started < resident.start_timeout_s
+    assert "cannot be started from a packaged build" in caplog.text
+
+
+@pytest.mark.parametrize("reply", [b"", b'{"ok": tr'])
+def test_resident_store_falls_back_when_daemon_hangs_up(tmp_path: Path, reply: bytes) -> None:
+    socket_path = tmp_path / "whisper.sock"
+    listener = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+    listener.bind(str(socket_path))
+    listener.listen()
+
+    def accept_and_close() -> None:
+        # One ping from the client check and one from the resident store.
+        for _ in range(2):
+            connection, _address = listener.accept()
+            with connection:
+                connection.recv(1024)
+                connection.sendall(reply)
+
+    thread = threading.Thread(target=accept_and_close, daemon=True)
+    thread.start()
+    local_store = SimpleNamespace(load=lambda model_name: f"in-process {model_name}")
+    resident = ResidentWhisperModelStore(store=local_store, auto_start=False, socket_path=socket_path)
+    try:
+        assert not WhisperDaemonClient(socket_path=socket_path).is_running()
+        assert resident.load("base.en") == "in-process base.en"
+    finally:
+        thread.join(timeout=10)
+        listener.close()
+
+
+def _serve(daemon: WhisperDaemon) -> threading.Thread:
+    thread = threading.Thread(target=daemon.serve, daemon=True)
+    thread.start()
+    client = WhisperDaemonClient(socket_path=daemon.socket_path)
+    deadline = time.monotonic() + 5
+    while not client.is_running():
+        assert time.monotonic() < deadline, "daemon did not start"
+        time.sleep(0.01)
+    return thread
@@ -0,0 +1,41 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+from openpyxl import load_workbook
+
+from stager.verification.audio_verifier_workbook_writer import AudioVerifierWorkbookWriter
+from stager.verification.extra_audio_diff import ExtraAudioDiff
+from stager.verification.match_audio_diff import MatchAudioDiff
+from stager.verification.missing_audio_diff import MissingAudioDiff
+
+
+def test_workbook_streams_sheets_with_column_styles(tmp_path: Path) -> None:
+    diffs_by_role = {
+        "LAVINIA": [
+            MatchAudioDiff(0, 100, "1_1", "exp", "heard", "[heard/exp]", 1),
+            MissingAudioDiff(None, None, "1_2", "missing"),
+        ],
+        "CENTURION": [ExtraAudioDiff(None, None, "2_1@extra", "extra words")],
+    }
+
+    out_path = AudioVerifierWorkbookWriter().write(
+        diffs_by_role,
+        tmp_path / "out" / "audio-verifier.xlsx",
+        role_order=["LAVINIA", "CENTURION"],
+        problems_ids_by_role={"LAVINIA": {"1_2"}},
+    )
+
+    wb = load_workbook(out_path)
+    assert wb.sheetnames == ["Summary", "unprocessed", "problems", "vetted", "ignored", "LAVINIA", "CENTURION"]
+    summary = wb["Summary"]
+    assert [cell.value for cell in summary[4]][:2] == ["TOTAL", 1]
+    assert summary["B2"].alignment.horizontal == "right"
+    assert summary["B1"].alignment.horizontal is None
+    assert wb["problems"]["C2"].value == "1_2"
+    role_ws = wb["LAVINIA"]
+    assert role_ws.column_dimensions["F"].width == 36
+    assert role_ws["A1"].alignment.horizontal == "center"
+    assert role_ws["F2"].alignment.wrap_text
+    assert role_ws["F2"].alignment.vertical == "top"
+    assert role_ws["F1"].alignment.wrap_text is not True
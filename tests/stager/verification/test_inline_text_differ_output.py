@@ -36,3 +36,32 @@ def test_replacement_pairs_ignore_inserts() -> None:
     replacements = differ.replacement_pairs("The quick fox.", "The quick fox jumps.")
 
     assert replacements == []
+
+
+class CountingDmp:
+    def __init__(self) -> None:
+        self.calls = 0
+
+    def diff_main(self, expected: str, actual: str):
+        self.calls += 1
+        return [(-1, expected), (1, actual)]
+
+    def diff_cleanupSemantic(self, _diffs) -> None:
+        return None
+
+
+def test_identical_token_streams_skip_diffing_and_results_are_memoized() -> None:
+    dmp = CountingDmp()
+    differ = InlineTextDiffer(dmp=dmp)
+
+    clean = differ.diff("Who goes there?", "who goes there?")
+
+    assert clean.inline_diff == "Who goes there?"
+    assert clean.windowed_diffs == []
+    assert differ.count_diffs("Who goes there?", "who goes there?") == 0
+    assert dmp.calls == 0
+
+    first = differ.count_diffs("Halt!", "Hold!")
+    assert differ.count_diffs("Halt!", "Hold!") == first == 1
+    assert differ.replacement_pairs("Halt!", "Hold!")[0].actual == "Hold!"
+    assert dmp.calls == 1
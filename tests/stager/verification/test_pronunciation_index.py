@@ -0,0 +1,48 @@
+from __future__ import annotations
+
+from pathlib import Path
+
+import cmudict
+
+from stager.verification.homophone_matcher import HomophoneMatcher
+from stager.verification.pronunciation_index import PronunciationIndex
+
+
+def test_index_is_built_once_and_matches_cmudict(tmp_path: Path) -> None:
+    index = PronunciationIndex(cache_dir=tmp_path)
+    reopened = PronunciationIndex(cache_dir=tmp_path)
+    cmu = cmudict.dict()
+
+    assert len(list(tmp_path.iterdir())) == 1
+    for word in ("two", "tomato", "aaron", "zzz-not-a-word", ""):
+        expected = {tuple(phones) for phones in cmu.get(word, [])}
+        assert index.pronunciations(word) == expected
+        assert reopened.pronunciations(word.upper()) == expected
+    assert ("B", "AH0", "N", "AE1", "N", "AH0") in index.pronunciations("banana")
+    assert ("B", "N", "AE1", "N") in index.stripped_pronunciations("banana")
+
+
+def test_matcher_uses_precomputed_stripped_variants(tmp_path: Path) -> None:
+    matcher = HomophoneMatcher(build_root=tmp_path)
+
+    assert matcher.is_homophone(["to"], ["two"])
+    assert matcher.is_homophone(["for", "all"], ["four", "all"])
+    assert not matcher.is_homophone(["cat"], ["dog"])
+
+
+def test_shared_index_is_kept_per_build_root(tmp_path: Path) -> None:
+    first = PronunciationIndex.shared(build_root=tmp_path / "one")
+    second = PronunciationIndex.shared(build_root=tmp_path / "two")
+
+    assert PronunciationIndex.shared(build_root=tmp_path / "one") is first
+    assert second is not first
+    assert second.cache_dir == tmp_path / "two" / "pronunciation_index"
+    assert (tmp_path / "two" / "pronunciation_index").is_dir()
+
+
+def test_default_cache_dir_without_build_root_is_per_user(tmp_path: Path, monkeypatch) -> None:
+    monkeypatch.setattr("sys.platform", "linux")
+    monkeypatch.setenv("XDG_CACHE_HOME", str(tmp_path))
+
+    assert PronunciationIndex.default_cache_dir() == tmp_path / "stager" / "pronunciation_index"
+    assert PronunciationIndex.default_cache_dir(tmp_path / "build") == tmp_path / "build" / "pronunciation_index"
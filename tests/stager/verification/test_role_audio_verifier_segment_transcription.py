@@ -0,0 +1,159 @@
+from __future__ import annotations
+
+from pathlib import Path
+from types import SimpleNamespace
+import wave
+
+from stager.domain.block import RoleBlock
+from stager.domain.block_id import BlockId
+from stager.domain.play import Play
+from stager.domain.segment import SpeechSegment
+from stager.domain.segment_id import SegmentId
+from stager.shared import paths
+from stager.transcription.whisper_cache_cleaner import WhisperCacheCleaner
+from stager.verification.role_audio_verifier import RoleAudioVerifier
+from stager.verification.role_verification_cache import RoleVerificationCache
+
+
+class FakeWhisperModel:
+    def __init__(self, words_by_name: dict[str, list[str]]) -> None:
+        self.words_by_name = words_by_name
+        self.calls: list[str] = []
+
+    def transcribe(self, audio_path: str, **_kwargs):
+        name = Path(audio_path).stem
+        self.calls.append(name)
+        words = [
+            SimpleNamespace(word=f" {word}", start=0.1 + index * 0.2, end=0.25 + index * 0.2)
+            for index, word in enumerate(self.words_by_name[name])
+        ]
+        return [SimpleNamespace(words=words)], None
+
+
+class FakeWhisperStore:
+    def __init__(self, model: FakeWhisperModel) -> None:
+        self.model = model
+
+    def load(self, _model_name: str) -> FakeWhisperModel:
+        return self.model
+
+
+def _cfg(tmp_path: Path) -> paths.PathConfig:
+    return paths.PathConfig(
+        play_name="androcles",
+        build_root=tmp_path / "build",
+        plays_dir=tmp_path / "plays",
+        snippets_dir=tmp_path / "snippets",
+    )
+
+
+def test_segment_transcription_only_transcribes_changed_takes(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    _write_wav(cfg.segments_dir / "CENTURION" / "0_1_1.wav", seconds=1, level=1000)
+    _write_wav(cfg.segments_dir / "CENTURION" / "0_2_1.wav", seconds=2, level=1000)
+    model = FakeWhisperModel({"0_1_1": ["halt"], "0_2_1": ["who", "goes", "there"]})
+
+    first = _verifier(cfg, model).verify()
+
+    assert model.calls == ["0_1_1", "0_2_1"]
+    assert [segment["status"] for segment in first["segments"]] == ["matched", "matched"]
+    assert first["segments"][1]["matched_audio_start"] == 1.1
+
+    model.calls.clear()
+    _write_wav(cfg.segments_dir / "CENTURION" / "0_2_1.wav", seconds=2, level=2000)
+    second = _verifier(cfg, model).verify()
+
+    assert model.calls == ["0_2_1"]
+    assert second["segments"][1]["matched_audio_text"] == "who goes there"
+
+
+def test_segment_transcription_skips_missing_takes_and_cleaner_clears_role(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    _write_wav(cfg.segments_dir / "CENTURION" / "0_2_1.wav", seconds=1, level=1000)
+    model = FakeWhisperModel({"0_2_1": ["who", "goes", "there"]})
+
+    results = _verifier(cfg, model).verify()
+
+    assert [segment["status"] for segment in results["segments"]] == ["missing", "matched"]
+    assert WhisperCacheCleaner(paths=cfg).clear("LAVINIA") == 0
+    assert WhisperCacheCleaner(paths=cfg).clear("CENTURION") == 1
+
+
+def test_unchanged_inputs_reuse_results_until_substitutions_change(tmp_path: Path) -> None:
+    cfg = _cfg(tmp_path)
+    _write_wav(cfg.segments_dir / "CENTURION" / "0_1_1.wav", seconds=1, level=1000)
+    _write_wav(cfg.segments_dir / "CENTURION" / "0_2_1.wav", seconds=1, level=1000)
+    model = FakeWhisperModel({"0_1_1": ["halt"], "0_2_1": ["who", "goes", "there"]})
+    result_cache = RoleVerificationCache(paths=cfg)
+
+    first = _verifier(cfg, model, result_cache=result_cache).verify()
+    reused = _verifier(cfg, model, result_cache=result_cache)
+
+    assert reused.verify() == first
+    assert reused.results_from_cache
+
+    cfg.recordings_dir.mkdir(parents=True, exist_ok=True)
+    (cfg.recordings_dir / "CENTURION_substitutions.yaml").write_text("vetted: []\n", encoding="utf-8")
+    edited = _verifier(cfg, model, result_cache=result_cache)
+    edited.verify()
+
+    assert not edited.results_from_cache
+    retuned = _verifier(cfg, model, result_cache=result_cache, skip_text_penalty=-0.6)
+    retuned.verify()
+    assert not retuned.results_from_cache
+    assert result_cache.clear() == 1
+
+
+def test_cached_results_are_tied_to_the_verifier_code(tmp_path: Path, monkeypatch) -> None:
+    cfg = _cfg(tmp_path)
+    _write_wav(cfg.segments_dir / "CENTURION" / "0_1_1.wav", seconds=1, level=1000)
+    _write_wav(cfg.segments_dir / "CENTURION" / "0_2_1.wav", seconds=1, level=1000)
+    model = FakeWhisperModel({"0_1_1": ["halt"], "0_2_1": ["who", "goes", "there"]})
+    result_cache = RoleVerificationCache(paths=cfg)
+    _verifier(cfg, model, result_cache=result_cache).verify()
+
+    assert len(RoleVerificationCache.code_digest()) == 64
+    monkeypatch.setattr(RoleVerificationCache, "_code_digest", "0" * 64)
+    changed = _verifier(cfg, model, result_cache=result_cache)
+    changed.verify()
+
+    assert not changed.results_from_cache
+
+
+def _verifier(cfg: paths.PathConfig, model: FakeWhisperModel, **overrides) -> RoleAudioVerifier:
+    return RoleAudioVerifier(
+        role="CENTURION",
+        paths=cfg,
+        play=_play(),
+        whisper_store=FakeWhisperStore(model),
+        segment_transcription=True,
+        **overrides,
+    )
+
+
+def _write_wav(path: Path, *, seconds: int, level: int) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(16000)
+        wav.writeframes(level.to_bytes(2, "little", signed=True) * 16000 * seconds)
+
+
+def _play() -> Play:
+    return Play(
+        blocks=[
+            _role_block(1, "Halt!"),
+            _role_block(2, "Who goes there?"),
+        ]
+    )
+
+
+def _role_block(block_no: int, text: str) -> RoleBlock:
+    block_id = BlockId(0, block_no)
+    return RoleBlock(
+        block_id=block_id,
+        role_names=["CENTURION"],
+        text=text,
+        segments=[SpeechSegment(segment_id=SegmentId(block_id, 1), text=text, role="CENTURION")],
+    )
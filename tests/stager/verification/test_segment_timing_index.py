@@ -0,0 +1,47 @@
+from __future__ import annotations
+
+from pathlib import Path
+import wave
+
+from stager.verification.segment_timing_index import SegmentTimingIndex
+
+
+def _write_wav(path: Path, frames: int, rate: int = 8000) -> None:
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with wave.open(str(path), "wb") as wav:
+        wav.setnchannels(1)
+        wav.setsampwidth(2)
+        wav.setframerate(rate)
+        wav.writeframes(b"\x00\x00" * frames)
+
+
+def test_index_reads_headers_and_offsets(tmp_path: Path) -> None:
+    _write_wav(tmp_path / "ALICE" / "1_2_3.wav", frames=12000)
+    _write_wav(tmp_path / "_NARRATOR" / "1_0_1.wav", frames=4000)
+    (tmp_path / "ALICE" / "offsets.txt").write_text("# id offset\n1:2:3 0:01:05.250\n\n", encoding="utf-8")
+
+    index = SegmentTimingIndex(segments_dir=tmp_path)
+
+    assert index.duration_ms("ALICE", "1_2_3") == 1500
+    assert index.duration_ms("_NARRATOR", "1_0_1") == 500
+    assert index.duration_ms("ALICE", "9_9_9") is None
+    assert index.offset("ALICE", "1_2_3") == "0:01:05.250"
+    assert index.offsets("_NARRATOR") == {}
+
+
+def test_unreadable_headers_fall_back_to_decoder_and_are_memoized(tmp_path: Path) -> None:
+    broken = tmp_path / "BOB" / "1_1_1.wav"
+    broken.parent.mkdir(parents=True)
+    broken.write_bytes(b"")
+    decoded: list[Path] = []
+
+    def decode(path: Path) -> int:
+        decoded.append(path)
+        return 750
+
+    first = SegmentTimingIndex(segments_dir=tmp_path, decode_duration_ms=decode)
+    second = SegmentTimingIndex(segments_dir=tmp_path, decode_duration_ms=decode)
+
+    assert first.duration_ms("BOB", "1_1_1") == 750
+    assert second.duration_ms("BOB", "1_1_1") == 750
+    assert decoded == [broken]
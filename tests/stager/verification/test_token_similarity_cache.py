@@ -0,0 +1,20 @@
+from __future__ import annotations
+
+from rapidfuzz import fuzz
+
+from stager.verification.token_similarity_cache import TokenSimilarityCache
+
+
+def test_scores_match_rapidfuzz_and_are_computed_once() -> None:
+    cache = TokenSimilarityCache()
+    halt, hold, who = cache.intern_all(["halt", "hold", "who"])
+
+    assert cache.intern("halt") == halt
+    assert cache.token_similarity(halt, halt) == 1.0
+    assert cache.token_similarity(halt, hold) == fuzz.token_set_ratio("halt", "hold") / 100.0
+    assert cache.bigram_similarity((halt, who), (hold, who)) == fuzz.ratio("halt who", "hold who") / 100.0
+
+    cache.token_similarity(halt, hold)
+    cache.bigram_similarity((halt, who), (hold, who))
+    assert len(cache._token_scores) == 2
+    assert len(cache._bigram_scores) == 1